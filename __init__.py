@@ -17,3 +17,35 @@ __revision__ = "$Id: __init__.py,v 1.1.1.5 2014/10/18 10:25:24 aseibert Exp $"
 __version__ = "1.8.2"
 
 
+
+# settings for loading the arapi, see configure
+configuration = {}
+
+def configure(libraries = None, version = None):
+    '''configure pins the shared libraries and the API version that pyars.cars
+loads; it has to be called before pyars.cars is imported (directly or
+through ars/erars):
+
+>>> import pyars
+>>> pyars.configure(['/opt/remedy/lib/libarjni81_lx64.so',
+...                  '/opt/remedy/lib/libar_lx64.so'], 81)
+>>> from pyars import erars
+
+Then no library names are probed and the Windows registry is not scanned;
+if a library cannot be loaded, the import fails with an ImportError.
+Use libraries = 'fake' to run against the in-process fake of the arapi
+(see pyars.fakearapi) instead of a library.
+The same can be achieved with the environment variables PYARS_LIBRARIES
+(library paths separated by os.pathsep) and PYARS_API_VERSION; 
+configure takes precedence.
+Input: libraries (list of paths of shared libraries, loaded in this order; 
+            the last one is used as arapi)
+       version (API version, e.g. 81, 76.04 or 7604)
+Output: none'''
+    import sys
+    if 'pyars.cars' in sys.modules:
+        raise RuntimeError('pyars.configure must be called before pyars.cars is imported')
+    if isinstance(libraries, str):
+        libraries = [libraries]
+    configuration['libraries'] = libraries and list(libraries) or None
+    configuration['version'] = version
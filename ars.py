@@ -39,9 +39,13 @@ from ctypes import byref, c_char_p, c_uint, c_int, c_ulong,\
                     Structure, POINTER, c_long,  set_conversion_mode
 import logging
 import sys
+import threading
+import weakref
 
 # try:
 from pyars import cars
+from pyars import instrumentation
+from pyars import resilience
 #except ImportError: # Python3
 #    from . import cars
 
@@ -206,6 +210,127 @@ a bug in the log module'''
         if self.level <= logging.ERROR:
             print (logMessage)
 
+class ARResult(object):
+    '''ARResult holds the result of a raw AR* call and frees it with ARFree
+when the with block is left (also in case of an exception):
+    with ars.autoFree(ars.ARGetListSchema()) as nameList:
+        names = [nameList.nameList[i].value for i in range(nameList.numItems)]
+If the call returns a tuple, all ctypes structures in it are freed.
+Use detach to keep the result beyond the with block.'''
+
+    def __init__(self, arsSession, value):
+        self.arsSession = arsSession
+        self.value = value
+
+    def __enter__(self):
+        return self.value
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.free()
+
+    def free(self):
+        '''free the result (only the first call has an effect)'''
+        value = self.value
+        self.value = None
+        if isinstance(value, tuple):
+            for element in value:
+                if isinstance(element, Structure):
+                    self.arsSession.ARFree(element)
+        elif isinstance(value, Structure):
+            self.arsSession.ARFree(value)
+
+    def detach(self):
+        '''return the result; it will not be freed by this holder anymore'''
+        value = self.value
+        self.value = None
+        return value
+
+class StatusListPool(object):
+    '''StatusListPool is a small free-list of ARStatusLists: every thread
+that calls the arapi through a session borrows one status list for this
+session (see ARS51.arsl) and gives it back when the thread (or the 
+session) is gone; then the messages in it are freed.'''
+
+    def __init__(self, size = 32):
+        self.size = size
+        self.free = []
+
+    def borrow(self):
+        try:
+            # list.pop and list.append are atomic, no lock is needed
+            return self.free.pop()
+        except IndexError:
+            return cars.ARStatusList()
+
+    def giveBack(self, arsl, arapi = None):
+        '''give arsl back; its messages are freed with arapi (the library
+of the session, default: cars.arapi)'''
+        if arsl.numItems:
+            if arapi is None:
+                arapi = cars.arapi
+            try:
+                arapi.FreeARStatusList(byref(arsl), False)
+            except Exception: # e.g. at interpreter shutdown
+                return
+        arsl.numItems = 0
+        arsl.statusList = None
+        if len(self.free) < self.size:
+            self.free.append(arsl)
+
+# the free-list of the status lists of all sessions
+statusLists = StatusListPool()
+
+class _StatusListLease(object):
+    '''gives the status list back to statusLists when the _CallStatus of a
+thread is deleted (at the end of the thread); the messages are freed with
+the library of the session (a weak reference, so that the session can go
+away first)'''
+
+    __slots__ = ('arsl', 'session')
+
+    def __init__(self, session):
+        self.arsl = statusLists.borrow()
+        self.session = session
+
+    def __del__(self):
+        if statusLists is not None:
+            session = self.session()
+            statusLists.giveBack(self.arsl, 
+                                 session is not None and session.arapi or None)
+
+class _CallStatus(threading.local):
+    '''errnr and status list of the calls of one thread on one session
+(session is a weak reference to the session)'''
+
+    def __init__(self, session):
+        self.errnr = 0
+        self.lease = _StatusListLease(session)
+        self.arsl = self.lease.arsl
+
+class _LockedLibrary(object):
+    '''_LockedLibrary stands in for the arapi (or cmdbapi) of a session that
+is shared by several threads: every function holds the lock of the
+session while it is running.'''
+
+    def __init__(self, library, lock):
+        self._library = library
+        self._lock = lock
+
+    def __getattr__(self, name):
+        function = getattr(self._library, name)
+        if not callable(function):
+            return function
+        lock = self._lock
+        def wrapper(*args):
+            lock.acquire()
+            try:
+                return function(*args)
+            finally:
+                lock.release()
+        # the next lookup finds the wrapper without calling __getattr__
+        setattr(self, name, wrapper)
+        return wrapper
+
 class ARS51(object):
     '''pythonic wrapper Class for Remedy C API, V5.1
 
@@ -223,7 +348,7 @@ similar to ARSPerl and ARSJython'''
         self.arapi = cars.arapi # set in cars
         self.oldCharset = None
         self.context = None
-        self.arsl = cars.ARStatusList()
+        self.errnr = 0
         if sys.platform == 'cli': # special handling for IronPython
             self.logger = mylogger(level=logging.INFO)
         else:
@@ -240,6 +365,10 @@ similar to ARSPerl and ARSJython'''
                 hdlr.setFormatter(formatter)
                 self.logger.addHandler(hdlr) 
                 self.logger.setLevel(logging.INFO)
+        if resilience.default is not None:
+            self.enableResilience(resilience.default)
+        if instrumentation.default is not None:
+            self.enableInstrumentation(instrumentation.default)
         if server != '':
             self.Login(server, user, password, 
                        language = language,
@@ -247,6 +376,152 @@ similar to ARSPerl and ARSJython'''
                        tcpport = tcpport,
                        rpcnumber = rpcnumber)
 
+##############################################################
+#
+# status of the calls and sharing of a session by several threads
+#
+# errnr and arsl (the status list handed to the arapi) are kept per
+# thread: every thread that uses the session borrows a status list from
+# statusLists, so that the outcome of a call cannot be overwritten by
+# the call of another thread before it has been checked. Single threaded
+# code does not see a difference.
+
+    def _callStatus(self):
+        try:
+            return self.__dict__['_status']
+        except KeyError:
+            # dict.setdefault is atomic: two threads get the same object
+            return self.__dict__.setdefault('_status', _CallStatus(weakref.ref(self)))
+
+    def _getErrnr(self):
+        return self._callStatus().errnr
+
+    def _setErrnr(self, errnr):
+        self._callStatus().errnr = errnr
+        if errnr > 1:
+            # seen by all threads (see lastErrnr)
+            self.lastErrnr = errnr
+
+    # errnr of the last failed call of any thread on this session; unlike
+    # errnr, it is not reset by successful calls (set it to 0 to reset it)
+    lastErrnr = 0
+
+    errnr = property(_getErrnr, _setErrnr, 
+                     doc = 'return code of the last call of this thread')
+
+    def _getArsl(self):
+        return self._callStatus().arsl
+
+    def _setArsl(self, arsl):
+        self._callStatus().arsl = arsl
+
+    arsl = property(_getArsl, _setArsl, 
+                    doc = 'status list of the last call of this thread')
+
+    def _getLock(self):
+        try:
+            return self.__dict__['_lock']
+        except KeyError:
+            return self.__dict__.setdefault('_lock', threading.RLock())
+
+    lock = property(_getLock, 
+                    doc = 'lock that serializes the calls of the arapi (see enableThreadSharing)')
+
+    def enableThreadSharing(self):
+        '''enableThreadSharing lets several threads use this session at the 
+same time: every call of the arapi (and cmdbapi) holds the lock of the
+session, so that the calls with the same control record are serialized
+(the status of the calls is kept per thread anyway).
+Sequences of calls that belong together (e.g. a bulk entry transaction)
+must hold the lock themselves (CreateEntries and MergeEntries of erARS do):
+    with ars.lock:
+        ars.ARBeginBulkEntryTransaction()
+        ...
+Output: errnr'''
+        instrumentation_ = self.disableInstrumentation()
+        for attribute in instrumentation.Instrumentation.libraries:
+            library = self.__dict__.get(attribute)
+            if library is not None and not isinstance(library, _LockedLibrary):
+                setattr(self, attribute, _LockedLibrary(library, self.lock))
+        # the instrumentation measures the calls including the wait for the lock
+        if instrumentation_ is not None:
+            instrumentation_.attach(self)
+        self.errnr = 0
+        return self.errnr
+
+    def disableThreadSharing(self):
+        '''disableThreadSharing lets the session call the arapi without the
+lock again.
+Output: errnr'''
+        instrumentation_ = self.disableInstrumentation()
+        for attribute in instrumentation.Instrumentation.libraries:
+            library = self.__dict__.get(attribute)
+            if isinstance(library, _LockedLibrary):
+                setattr(self, attribute, library._library)
+        if instrumentation_ is not None:
+            instrumentation_.attach(self)
+        self.errnr = 0
+        return self.errnr
+
+##############################################################
+#
+# instrumentation of the calls of the arapi (see instrumentation.py)
+#
+
+    def enableInstrumentation(self, instrumentation_ = None):
+        '''enableInstrumentation times every call of the arapi (and cmdbapi)
+and of the public methods of this session.
+Input: (optional) instrumentation_ (Instrumentation, that can be shared
+            by several sessions; default: a new Instrumentation)
+Output: the Instrumentation'''
+        if instrumentation_ is None:
+            instrumentation_ = instrumentation.Instrumentation()
+        instrumentation_.attach(self)
+        return instrumentation_
+
+    def disableInstrumentation(self):
+        '''disableInstrumentation lets the session call the arapi directly
+again.
+Output: the Instrumentation that was used (or None)'''
+        instrumentation_ = getattr(self, '_instrumentation', None)
+        if instrumentation_ is not None:
+            instrumentation_.detach(self)
+        return instrumentation_
+
+##############################################################
+#
+# retries and reconnects after RPC failures (see resilience.py)
+#
+
+    def enableResilience(self, resilience_ = None):
+        '''enableResilience lets the session initialize its control record
+again after the connection to the server has been lost, and repeat the
+calls that only read after transient errors (with backoff; a circuit
+breaker per server stops the calls while the server is down).
+Input: (optional) resilience_ (Resilience, that can be shared by several
+            sessions; default: a new Resilience)
+Output: the Resilience'''
+        if resilience_ is None:
+            resilience_ = resilience.Resilience()
+        # the instrumentation stays the outermost wrapper, so that it
+        # measures a call including its retries
+        instrumentation_ = self.disableInstrumentation()
+        resilience_.attach(self)
+        if instrumentation_ is not None:
+            instrumentation_.attach(self)
+        return resilience_
+
+    def disableResilience(self):
+        '''disableResilience lets failed calls fail at once again.
+Output: the Resilience that was used (or None)'''
+        resilience_ = getattr(self, '_resilience', None)
+        if resilience_ is not None:
+            instrumentation_ = self.disableInstrumentation()
+            resilience_.detach(self)
+            if instrumentation_ is not None:
+                instrumentation_.attach(self)
+        return resilience_
+
 ##############################################################
 #
 # small helper function to check if a schema exists
@@ -257,12 +532,20 @@ similar to ARSPerl and ARSJython'''
 
 Input: string (name of a schema)
   :returns: Boolean or None in case of failure'''
-        namelist = self.ARGetListSchema()
-        if self.errnr > 1:
-            return None
-        result = [namelist.nameList[i].value for i in range(namelist.numItems) 
-                  if namelist.nameList[i].value == schemaString]
-        return len(result) > 0 and True or False
+        with self.autoFree(self.ARGetListSchema()) as namelist:
+            if self.errnr > 1:
+                return None
+            for i in range(namelist.numItems):
+                if namelist.nameList[i].value == schemaString:
+                    return True
+            return False
+
+    def autoFree(self, result):
+        '''autoFree wraps the result of a raw AR* call in an ARResult, that
+frees it at the end of a with block.
+Input: result of an AR* call (ctypes structure, tuple or None)
+Output: ARResult'''
+        return ARResult(self, result)
 
 ##############################################################
 #
@@ -5312,30 +5595,61 @@ Input:
         for i in range(obj.numItems):
             self.FreeARSchema(obj.schemaList[i])
 
+    # ctypes class -> function(arsSession, obj, freeStruct) that frees it;
+    # the function is resolved once per class by _resolveFreeFunction
+    _freeFunctions = {}
+    # classes that are freed by a Free<classname> method of this class
+    # (they are not known to the arapi)
+    _pythonFreeClasses = ('ARActiveLinkList', 'ARActiveLinkStruct',
+                          'ARContainerList', 'ARContainerStruct',
+                          'AREscalationList', 'AREscalationStruct',
+                          'ARFilterList', 'ARFilterStruct', 
+                          'ARMenuList', 'ARMenuStruct',
+                          'ARSchema', 'ARSchemaList')
+
+    def _resolveFreeFunction(self, class_):
+        '''find the free routine for a ctypes class and register it'''
+        name = class_.__name__
+        if name in self._pythonFreeClasses:
+            methodName = 'Free%s' % (name)
+            def function(arsSession, obj, freeStruct):
+                return getattr(arsSession, methodName)(obj)
+        elif name in ('AREscalationTmStruct', 'AREscalationTmList'):
+            # cannot find any free routine for those...
+            def function(arsSession, obj, freeStruct):
+                pass
+        else:
+            freeName = 'Free%s' % (name)
+            # the registry is shared by all sessions, so it refers to the
+            # library itself, not to the instrumented (or locked) library
+            # of a session
+            library = self.arapi
+            while hasattr(library, '_library'):
+                library = library._library
+            try:
+                arapiFree = getattr(library, freeName)
+            except AttributeError:
+                self.logger.error("ARFree failed for class: %s" % (name))
+                def function(arsSession, obj, freeStruct):
+                    return None
+            else:
+                def function(arsSession, obj, freeStruct):
+                    if arsSession.arapi is library:
+                        return arapiFree(byref(obj), freeStruct)
+                    return getattr(arsSession.arapi, freeName)(byref(obj), freeStruct)
+        self._freeFunctions[class_] = function
+        return function
+
     def ARFree(self, obj, freeStruct=False):
         '''ARFree frees all substructures of the handed structure.'''
         # self.logger.debug('pyARS: ARFree called for %s' % (obj))
         if obj is None:
             return
         try:
-            
-            if obj.__class__.__name__ in ('ARActiveLinkList', 'ARActiveLinkStruct',
-                                          'ARContainerList', 'ARContainerStruct',
-                                          'AREscalationList', 'AREscalationStruct',
-                                          'ARFilterList', 'ARFilterStruct', 
-                                          'ARMenuList', 'ARMenuStruct',
-                                          'ARSchema', 'ARSchemaList'):
-                return eval('self.Free%s(obj)' % obj.__class__.__name__)
-            elif isinstance(obj, (cars.AREscalationTmStruct, cars.AREscalationTmList)):
-                # cannot find any free routine for those...
-                pass
-            else:
-                return eval('self.arapi.Free%s(byref(obj), freeStruct)' % (
-                       obj.__class__.__name__))
-
+            function = self._freeFunctions[obj.__class__]
         except KeyError:
-            self.logger.error("ARFree failed for class: %s" % (str(obj.__class__.__name__)))
-            return None
+            function = self._resolveFreeFunction(obj.__class__)
+        return function(self, obj, freeStruct)
 
 class ARS(ARS51):
     pass
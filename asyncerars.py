@@ -0,0 +1,363 @@
+#######################################################################
+#
+# This is the asyncio facade of the pythonic layer of pyars.
+# (C) 2004-2015 by Ergorion
+#
+# AsyncERARS makes the methods of erARS awaitable: every call returns an
+# asyncio future, so the event loop is not blocked during the round trip
+# to the server.
+#     ars = AsyncERARS('server', 'user', 'password', sessions = 4)
+#     entry = await ars.GetEntry(schema, entryId)
+#     async for (entryId, values) in ars.iterListEntryWithFields(schema, query):
+#         ...
+#     await ars.close()
+# One ARControlStruct must only be used by one thread at a time, so every
+# session gets its own worker thread that runs its calls one after the
+# other; a call goes to the session with the fewest waiting calls.
+# maxConcurrency limits the number of calls that are handed to the
+# sessions at the same time, the others wait in the event loop. If the
+# future of a call is cancelled before the call started, it is not made
+# at all; a running call of the arapi cannot be interrupted: it is
+# finished on its thread, and its result is thrown away.
+#
+# The module does not use the async/await syntax, so that it can be
+# imported on every python that pyars supports: it works with asyncio
+# (python 3.4 and later) and with trollius, the backport of asyncio to
+# python 2 (there, use "yield From(...)" instead of await and the method
+# next of the iterators instead of "async for").
+#
+
+from collections import deque
+from itertools import islice
+import sys
+import threading
+try:
+    import Queue as queue
+except ImportError: # python 3
+    import queue
+
+try:
+    import asyncio
+except ImportError:
+    try:
+        import trollius as asyncio
+    except ImportError:
+        asyncio = None
+
+from pyars import cars
+from pyars import erars
+
+try:
+    StopAsyncIteration = StopAsyncIteration
+except NameError: # before python 3.5
+    class StopAsyncIteration(Exception):
+        '''raised by the futures of AsyncEntryIterator.next at the end'''
+        pass
+
+def _newFuture(loop):
+    if hasattr(loop, 'create_future'):
+        return loop.create_future()
+    return asyncio.Future(loop = loop)
+
+def _deliver(future, result, error):
+    '''hand over the outcome of a call (runs in the event loop)'''
+    if future.cancelled():
+        # the caller is not interested anymore
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+class _SessionWorker(object):
+    '''_SessionWorker owns one session and a thread that runs the calls of
+this session one after the other; the session is logged in with the
+first call.'''
+
+    def __init__(self, facade, index):
+        self.facade = facade
+        self.session = facade.sessionClass()
+        self.loggedIn = False
+        # number of calls that have been handed to this worker and are not
+        # finished yet (only changed in the event loop)
+        self.pending = 0
+        self.calls = queue.Queue()
+        self.thread = threading.Thread(target = self._run,
+                                       name = 'AsyncERARS(%s, %d)' % (facade.server, index))
+        self.thread.setDaemon(True)
+        self.thread.start()
+
+    def submit(self, loop, future, function, args, kwargs):
+        self.pending += 1
+        self.calls.put((loop, future, function, args, kwargs))
+
+    def stop(self):
+        self.calls.put(None)
+
+    def _login(self):
+        facade = self.facade
+        self.session.Login(facade.server, facade.user, facade.password,
+                           facade.language, facade.authString,
+                           facade.tcpport, facade.rpcnumber)
+        if self.session.errnr > 1:
+            raise erars.ARError(None, 'AsyncERARS: login to %s as %s failed: %s' % (
+                                facade.server, facade.user, self.session.statusText()),
+                                cars.AR_RETURN_ERROR)
+        self.loggedIn = True
+
+    def _run(self):
+        while True:
+            item = self.calls.get()
+            if item is None:
+                return
+            (loop, future, function, args, kwargs) = item
+            (result, error) = (None, None)
+            if function is _logoff and not self.loggedIn:
+                pass
+            elif not future.cancelled():
+                try:
+                    if not self.loggedIn:
+                        self._login()
+                    result = function(self.session, *args, **kwargs)
+                except Exception:
+                    error = sys.exc_info()[1]
+            try:
+                loop.call_soon_threadsafe(self.facade._finished, self, future,
+                                          result, error)
+            except RuntimeError:
+                # the event loop has been closed in the meantime
+                pass
+
+def _logoff(session):
+    session.Logoff()
+
+def _callMethod(session, name, args, kwargs):
+    return getattr(session, name)(*args, **kwargs)
+
+class AsyncEntryIterator(object):
+    '''AsyncEntryIterator hands out the entries of a paged list API (e.g.
+IterListEntryWithFields) asynchronously: the generator runs on the worker
+of one session and is asked for a page of entries at a time.'''
+
+    def __init__(self, facade, worker, generator, pageSize):
+        self.facade = facade
+        self.worker = worker
+        self.generator = generator
+        self.pageSize = pageSize
+        self.buffer = deque()
+        self.finished = False
+        # the error of a page that nobody waited for (see next)
+        self.error = None
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return self.next()
+
+    def next(self):
+        '''return a future of the next entry; at the end, the future raises
+StopAsyncIteration'''
+        loop = asyncio.get_event_loop()
+        if self.buffer:
+            future = _newFuture(loop)
+            future.set_result(self.buffer.popleft())
+            return future
+        if self.error is not None:
+            future = _newFuture(loop)
+            future.set_exception(self.error)
+            return future
+        if self.finished:
+            future = _newFuture(loop)
+            future.set_exception(StopAsyncIteration())
+            return future
+        result = _newFuture(loop)
+        page = self.facade._submit(loop, self.worker, _nextPage,
+                                   (self.generator, self.pageSize), {})
+        def pageArrived(page):
+            if page.cancelled():
+                # the generator has not been asked for the page
+                if not result.cancelled():
+                    result.cancel()
+                return
+            if page.exception() is not None:
+                self.finished = True
+                if result.cancelled():
+                    self.error = page.exception()
+                else:
+                    result.set_exception(page.exception())
+                return
+            # the generator has moved past the page: its entries belong to
+            # the iterator, even if the caller has cancelled this call
+            entries = page.result()
+            if len(entries) < self.pageSize:
+                self.finished = True
+            self.buffer.extend(entries)
+            if result.cancelled():
+                return
+            if self.buffer:
+                result.set_result(self.buffer.popleft())
+            else:
+                result.set_exception(StopAsyncIteration())
+        page.add_done_callback(pageArrived)
+        return result
+
+    def aclose(self):
+        '''stop the iteration; the generator is closed on the worker
+(so that the memory of its qualifier is given back).
+Output: future'''
+        self.finished = True
+        self.buffer.clear()
+        loop = asyncio.get_event_loop()
+        return self.facade._submit(loop, self.worker, _closeGenerator,
+                                   (self.generator, ), {})
+
+def _nextPage(session, generator, pageSize):
+    return list(islice(generator, pageSize))
+
+def _closeGenerator(session, generator):
+    generator.close()
+
+class AsyncERARS(object):
+    '''AsyncERARS offers the methods of erARS as coroutines (functions that
+return asyncio futures), see the module documentation.'''
+
+    def __init__(self, server, user, password, language = '',
+                 authString = '',
+                 tcpport = 0,
+                 rpcnumber = 0,
+                 sessions = 4,
+                 maxConcurrency = None,
+                 sessionClass = None):
+        '''Input: server, user, password, (optional) language, authString,
+                 tcpport, rpcnumber: parameters for Login
+       (optional) sessions (number of sessions, each with its own thread,
+                  default: 4)
+       (optional) maxConcurrency (maximum number of calls that are handed
+                  to the sessions at the same time, default: None = no limit)
+       (optional) sessionClass (class of the sessions, default: erARS)'''
+        if asyncio is None:
+            raise ImportError('AsyncERARS needs asyncio (or trollius on python 2)')
+        self.server = server
+        self.user = user
+        self.password = password
+        self.language = language
+        self.authString = authString
+        self.tcpport = tcpport
+        self.rpcnumber = rpcnumber
+        self.maxConcurrency = maxConcurrency
+        if sessionClass is None:
+            sessionClass = erars.erARS
+        self.sessionClass = sessionClass
+        self._workers = [_SessionWorker(self, i) for i in range(sessions)]
+        # calls that wait for maxConcurrency: (loop, worker or None, future,
+        # function, args, kwargs)
+        self._waiting = deque()
+        self._running = 0
+        self._closed = False
+
+    def __getattr__(self, name):
+        if name.startswith('_') or not callable(getattr(self.sessionClass, name, None)):
+            raise AttributeError(name)
+        def method(*args, **kwargs):
+            return self.call(name, *args, **kwargs)
+        method.__name__ = name
+        method.__doc__ = getattr(self.sessionClass, name).__doc__
+        # the next lookup finds the method without calling __getattr__
+        setattr(self, name, method)
+        return method
+
+    def _leastBusyWorker(self):
+        worker = self._workers[0]
+        for other in self._workers[1:]:
+            if other.pending < worker.pending:
+                worker = other
+        return worker
+
+    def _submit(self, loop, worker, function, args, kwargs, wait = True):
+        '''hand a call to worker (or let it wait for maxConcurrency); if
+worker is None, the call goes to the least busy worker when it is handed
+over.'''
+        if self._closed:
+            raise erars.ARError(None, 'AsyncERARS: the sessions have been closed!',
+                                cars.AR_RETURN_ERROR)
+        future = _newFuture(loop)
+        if wait and self.maxConcurrency is not None and self._running >= self.maxConcurrency:
+            self._waiting.append((loop, worker, future, function, args, kwargs))
+        else:
+            self._running += 1
+            (worker or self._leastBusyWorker()).submit(loop, future, function,
+                                                       args, kwargs)
+        return future
+
+    def _finished(self, worker, future, result, error):
+        '''a call is done (runs in the event loop)'''
+        worker.pending -= 1
+        self._running -= 1
+        _deliver(future, result, error)
+        while self._waiting and (self.maxConcurrency is None or
+                                 self._running < self.maxConcurrency):
+            (loop, worker, future, function, args, kwargs) = self._waiting.popleft()
+            if future.cancelled():
+                continue
+            self._running += 1
+            (worker or self._leastBusyWorker()).submit(loop, future, function,
+                                                       args, kwargs)
+
+    def call(self, name, *args, **kwargs):
+        '''call runs the method name of erARS with args and kwargs on one
+of the sessions.
+Output: future of the result'''
+        loop = asyncio.get_event_loop()
+        return self._submit(loop, None, _callMethod, (name, args, kwargs), {})
+
+    def iterate(self, name, *args, **kwargs):
+        '''iterate runs a paged list API of erARS (a generator such as
+IterListEntryWithFields) on one of the sessions.
+The method must be a generator function (so that calling it does not
+talk to the server yet).
+Input: name of the method
+       args and kwargs of the method; in addition, pageSize (default: 1000)
+       is the number of entries that are fetched with one round trip
+Output: AsyncEntryIterator'''
+        pageSize = kwargs.get('pageSize', 1000)
+        if name == 'IterListEntryWithFields':
+            # the prefetch thread would use the session besides the worker
+            kwargs['prefetch'] = False
+        worker = self._leastBusyWorker()
+        # the generator is created here, on the thread of the event loop;
+        # this is safe only because a generator does not run any of its
+        # code (nor touch the session) before it is asked for the first
+        # entry, which happens on the worker (see _nextPage)
+        generator = getattr(worker.session, name)(*args, **kwargs)
+        return AsyncEntryIterator(self, worker, generator, pageSize)
+
+    def iterListEntryWithFields(self, *args, **kwargs):
+        '''async iterator over the entries of IterListEntryWithFields
+(same arguments)'''
+        return self.iterate('IterListEntryWithFields', *args, **kwargs)
+
+    def scanListEntryWithFields(self, *args, **kwargs):
+        '''async iterator over the entries of ScanListEntryWithFields
+(same arguments; the partitions are read by sessions of their own)'''
+        return self.iterate('ScanListEntryWithFields', *args, **kwargs)
+
+    def stats(self):
+        '''return (number of running calls, number of waiting calls)'''
+        return (self._running, len(self._waiting))
+
+    def close(self):
+        '''close logs off all sessions and stops their threads.
+Output: future that is done when all sessions have been logged off'''
+        loop = asyncio.get_event_loop()
+        # the logoff is queued behind the calls that have been handed to
+        # the workers already; calls that still wait are dropped
+        futures = [self._submit(loop, worker, _logoff, (), {}, wait = False)
+                   for worker in self._workers]
+        self._closed = True
+        for (loop_, worker, future, function, args, kwargs) in self._waiting:
+            future.cancel()
+        self._waiting.clear()
+        for worker in self._workers:
+            worker.stop()
+        return asyncio.gather(*futures)
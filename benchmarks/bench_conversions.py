@@ -0,0 +1,259 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#######################################################################
+#
+# Benchmark of the conversion and wrapper layers of erars: the hot
+# conversions between ctypes structs and python objects and the ARFree
+# paths are timed on synthetic structs of rows x columns; the columns
+# cycle through the given data types.
+# The session runs against the in-process fake of the arapi (see
+# pyars.fakearapi), so that neither a server nor the BMC libraries are
+# needed; the fake's Free functions do nothing, so for ARFree only the
+# overhead of pyars is measured.
+# For every conversion, rows/s and allocations per row are reported;
+# allocations are memory blocks (python 3.4 and later) or container
+# objects tracked by the garbage collector (older pythons) that are
+# still allocated when the conversion returns, including its result.
+# Results can be written as JSON to compare pyars versions.
+# (C) 2004-2015 by Ergorion
+#
+# usage: python bench_conversions.py [rows] [columns] [data types] [JSON file] [repetitions]
+#        data types are comma separated, e.g. integer,char,real
+#        (default: integer,real,char,enum,time)
+#
+#######################################################################
+
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+import pyars
+if 'pyars.cars' not in sys.modules:
+    pyars.configure('fake', os.environ.get('PYARS_API_VERSION', 81))
+from pyars import cars, erars, fakearapi
+
+schemaName = 'pyars benchmark'
+firstFieldId = 536870913
+
+# name -> (data type, value of the i-th row)
+dataTypes = {'integer': (cars.AR_DATA_TYPE_INTEGER, lambda i: i),
+             'real': (cars.AR_DATA_TYPE_REAL, lambda i: i / 3.0),
+             'char': (cars.AR_DATA_TYPE_CHAR, lambda i: 'value %d' % (i)),
+             'diary': (cars.AR_DATA_TYPE_DIARY, lambda i: 'diary entry %d' % (i)),
+             'enum': (cars.AR_DATA_TYPE_ENUM, lambda i: i % 4),
+             'time': (cars.AR_DATA_TYPE_TIME, lambda i: 1400000000 + i),
+             'decimal': (cars.AR_DATA_TYPE_DECIMAL, lambda i: '%d.%02d' % (i, i % 100)),
+             'ulong': (cars.AR_DATA_TYPE_ULONG, lambda i: i),
+             'date': (cars.AR_DATA_TYPE_DATE, lambda i: 735000 + i % 1000),
+             'null': (cars.AR_DATA_TYPE_NULL, lambda i: None)}
+defaultDataTypes = 'integer,real,char,enum,time'
+
+def columnTypes(numColumns, typeNames):
+    '''the data type names of the columns'''
+    return [typeNames[j % len(typeNames)] for j in range(numColumns)]
+
+def pythonicRow(i, types):
+    '''the i-th row as a list of (fieldId, value)'''
+    return [(firstFieldId + j, dataTypes[types[j]][1](i))
+            for j in range(len(types))]
+
+def setValue(valueStruct, dataType, value):
+    if value is None or dataType == cars.AR_DATA_TYPE_NULL:
+        valueStruct.dataType = cars.AR_DATA_TYPE_NULL
+        return
+    valueStruct.dataType = dataType
+    member = cars.ARValueStruct._mapping_so_[dataType].split('.')[-1]
+    setattr(valueStruct.u, member, value)
+
+def buildFieldValueList(i, types):
+    '''build the ARFieldValueList of the i-th row'''
+    array = (cars.ARFieldValueStruct * len(types))()
+    for (j, (fieldId, value)) in enumerate(pythonicRow(i, types)):
+        array[j].fieldId = fieldId
+        setValue(array[j].value, dataTypes[types[j]][0], value)
+    return cars.ARFieldValueList(len(types), array)
+
+def buildEntryList(numRows, types):
+    '''build an AREntryListFieldValueList as returned by
+GetListEntryWithFields'''
+    entries = (cars.AREntryListFieldValueStruct * numRows)()
+    entryIds = (cars.AREntryIdType * numRows)()
+    # the structs only hold pointers to the field value lists
+    keepAlive = []
+    for i in range(numRows):
+        entryIds[i].value = '%015d' % (i + 1)
+        entries[i].entryId.numItems = 1
+        entries[i].entryId.entryIdList = cars.pointer(entryIds[i])
+        fieldValueList = buildFieldValueList(i, types)
+        keepAlive.append(fieldValueList)
+        entries[i].entryValues = cars.pointer(fieldValueList)
+    entryList = cars.AREntryListFieldValueList(numRows, entries)
+    entryList._keepAlive = (entryIds, keepAlive)
+    return entryList
+
+def buildValueListList(numRows, types):
+    '''build an ARValueListList as returned by GetListSQL'''
+    rows = (cars.ARValueList * numRows)()
+    keepAlive = []
+    for i in range(numRows):
+        values = (cars.ARValueStruct * len(types))()
+        for (j, (fieldId, value)) in enumerate(pythonicRow(i, types)):
+            setValue(values[j], dataTypes[types[j]][0], value)
+        keepAlive.append(values)
+        rows[i].numItems = len(types)
+        rows[i].valueList = values
+    valueListList = cars.ARValueListList(numRows, rows)
+    valueListList._keepAlive = keepAlive
+    return valueListList
+
+def createSession(types):
+    '''create a session with the fake arapi and a form with the benchmark
+fields (conv2FieldValueList looks up their data types)'''
+    if not isinstance(cars.arapi, fakearapi.FakeArapi):
+        fakearapi.install()
+    cars.arapi.addForm(schemaName, [(firstFieldId + j, 'Column %d' % (j),
+                                     dataTypes[types[j]][0])
+                                    for j in range(len(types))])
+    return erars.erARS('fake', 'Demo', '')
+
+def benchmarks(session, numRows, types):
+    '''return the list of (name, function, number of rows per call)'''
+    entryList = buildEntryList(numRows, types)
+    fieldValueList = entryList.entryList[0].entryValues.contents
+    valueListList = buildValueListList(numRows, types)
+    rows = [pythonicRow(i, types) for i in range(numRows)]
+    entryIds = ['%d' % (i + 1) for i in range(numRows)]
+    sortList = [(fieldId, 'descending') for (fieldId, value) in rows[0]]
+
+    def convFieldValueList2Dict():
+        for _ in range(numRows):
+            session.convFieldValueList2Dict(fieldValueList)
+
+    def conv2FieldValueList():
+        return [session.conv2FieldValueList(schemaName, row) for row in rows]
+
+    def padEntryid():
+        return [session.padEntryid(entryId) for entryId in entryIds]
+
+    def conv2SortList():
+        return [session.conv2SortList(sortList) for _ in range(numRows)]
+
+    def freeEntryList():
+        for _ in range(numRows):
+            session.Free(entryList)
+
+    def freeFieldValueLists():
+        for i in range(numRows):
+            session.Free(entryList.entryList[i].entryValues.contents)
+
+    return (('convEntryListFieldValueList2List',
+             lambda: session.convEntryListFieldValueList2List(entryList), numRows),
+            ('convValueListList2List',
+             lambda: session.convValueListList2List(valueListList), numRows),
+            ('convFieldValueList2Dict', convFieldValueList2Dict, numRows),
+            ('conv2FieldValueList', conv2FieldValueList, numRows),
+            ('conv2EntryIdListList',
+             lambda: session.conv2EntryIdListList(schemaName, entryIds), numRows),
+            ('padEntryid', padEntryid, numRows),
+            ('conv2SortList', conv2SortList, numRows),
+            # here, a row is a call of ARFree for the whole list
+            ('ARFree (AREntryListFieldValueList)', freeEntryList, numRows),
+            ('ARFree (ARFieldValueList per row)', freeFieldValueLists, numRows))
+
+def measureTime(function, repetitions):
+    '''return the best duration of function in seconds'''
+    best = None
+    gcEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repetitions):
+            start = time.time()
+            function()
+            duration = time.time() - start
+            if best is None or duration < best:
+                best = duration
+    finally:
+        if gcEnabled:
+            gc.enable()
+    return best
+
+def countAllocations(function):
+    '''return (number of allocations that are alive after function
+returned, unit of the allocations)'''
+    gc.collect()
+    if hasattr(sys, 'getallocatedblocks'):
+        (count, unit) = (sys.getallocatedblocks, 'blocks')
+    else:
+        (count, unit) = (lambda: len(gc.get_objects()), 'objects')
+    gcEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        before = count()
+        result = function()
+        after = count()
+    finally:
+        if gcEnabled:
+            gc.enable()
+    del result
+    return (max(after - before, 0), unit)
+
+def main(numRows = 10000, numColumns = 10, typeNames = defaultDataTypes,
+         outputFile = None, repetitions = 3):
+    typeNames = [name.strip() for name in typeNames.split(',') if name.strip()]
+    for name in typeNames:
+        if name not in dataTypes:
+            raise SystemExit('unknown data type %s, known are: %s' % (
+                             name, ', '.join(sorted(dataTypes.keys()))))
+    types = columnTypes(numColumns, typeNames)
+    session = createSession(types)
+    results = {}
+    print ('%d rows x %d columns (%s), best of %d' % (numRows, numColumns,
+                                                      ','.join(typeNames), repetitions))
+    print ('%-36s %10s %14s %16s' % ('conversion', 'seconds', 'rows/s', 'allocations/row'))
+    for (name, function, rowsPerCall) in benchmarks(session, numRows, types):
+        cars.arapi.resetCounters()
+        function()
+        # the fake counts how often its Free functions are called
+        freeCalls = sum([calls for (functionName, calls) in cars.arapi.calls.items()
+                         if functionName.startswith('Free')])
+        duration = measureTime(function, repetitions)
+        (allocations, unit) = countAllocations(function)
+        rowsPerSecond = duration and rowsPerCall / duration or None
+        results[name] = {'seconds': duration,
+                         'rows': rowsPerCall,
+                         'rowsPerSecond': rowsPerSecond,
+                         'allocationsPerRow': float(allocations) / rowsPerCall,
+                         'allocationUnit': unit,
+                         'arapiFreeCallsPerRow': float(freeCalls) / rowsPerCall}
+        print ('%-36s %10.4f %14s %12.1f %s' % (name, duration,
+                                               rowsPerSecond and '%.0f' % (rowsPerSecond) or 'n/a',
+                                               float(allocations) / rowsPerCall, unit))
+    session.Logoff()
+    report = {'pyars': pyars.__version__,
+              'apiVersion': cars.version,
+              'python': platform.python_version(),
+              'platform': platform.platform(),
+              'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+              'rows': numRows,
+              'columns': numColumns,
+              'dataTypes': typeNames,
+              'repetitions': repetitions,
+              'results': results}
+    if outputFile:
+        f = open(outputFile, 'w')
+        try:
+            json.dump(report, f, indent = 2, sort_keys = True)
+        finally:
+            f.close()
+        print ('results written to %s' % (outputFile))
+    return report
+
+if __name__ == '__main__':
+    args = sys.argv[1:6]
+    for i in (0, 1, 4):
+        if len(args) > i:
+            args[i] = int(args[i])
+    main(*args)
@@ -0,0 +1,82 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#######################################################################
+#
+# Micro benchmark: decoding ARValueStructs via the precompiled decoder
+# table (cars.ARValueStruct._decoder_) versus the former eval path
+# over the string mappings _mapping_so_ / _mapping_co_.
+# (C) 2004-2015 by Ergorion
+#
+# usage: python bench_decoders.py [number of values] [repetitions]
+#
+#######################################################################
+
+import sys
+import time
+
+from pyars import cars
+
+def buildValues(numValues):
+    '''build an array of ARValueStructs with a mix of the common
+data types of a form (integer, real, char, enum, time)'''
+    values = (cars.ARValueStruct * numValues)()
+    for i in range(numValues):
+        kind = i % 5
+        if kind == 0:
+            values[i].dataType = cars.AR_DATA_TYPE_INTEGER
+            values[i].u.intVal = i
+        elif kind == 1:
+            values[i].dataType = cars.AR_DATA_TYPE_REAL
+            values[i].u.realVal = i / 3.0
+        elif kind == 2:
+            values[i].dataType = cars.AR_DATA_TYPE_CHAR
+            values[i].u.charVal = 'value %d' % i
+        elif kind == 3:
+            values[i].dataType = cars.AR_DATA_TYPE_ENUM
+            values[i].u.enumVal = i % 4
+        else:
+            values[i].dataType = cars.AR_DATA_TYPE_TIME
+            values[i].u.timeVal = 1400000000 + i
+    return values
+
+def decodeEval(obj):
+    '''this is the conversion as it used to be done in
+erARS51.convValueStruct2Value'''
+    try:
+        if obj.dataType in (cars.AR_DATA_TYPE_NULL,
+                            cars.AR_DATA_TYPE_VIEW):
+            return None
+        return eval('obj.%s' % (cars.ARValueStruct._mapping_so_ [obj.dataType]))
+    except KeyError:
+        return eval('%s' % (cars.ARValueStruct._mapping_co_ [obj.dataType]))
+
+def decodeTable(obj, decoder = cars.ARValueStruct._decoder_):
+    return decoder[obj.dataType](obj)
+
+def timeit(function, values, repetitions):
+    best = None
+    for _ in range(repetitions):
+        start = time.time()
+        for i in range(len(values)):
+            function(values[i])
+        duration = time.time() - start
+        if best is None or duration < best:
+            best = duration
+    return best
+
+def main(numValues = 100000, repetitions = 3):
+    values = buildValues(numValues)
+    for i in range(len(values)):
+        assert decodeEval(values[i]) == decodeTable(values[i])
+    evalTime = timeit(decodeEval, values, repetitions)
+    tableTime = timeit(decodeTable, values, repetitions)
+    print ('values decoded:  %d (best of %d)' % (numValues, repetitions))
+    print ('eval path:       %8.3f s  %12.0f values/s' % (evalTime,
+                                                          numValues / evalTime))
+    print ('decoder table:   %8.3f s  %12.0f values/s' % (tableTime,
+                                                          numValues / tableTime))
+    print ('speedup:         %8.1f x' % (evalTime / tableTime))
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,66 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#######################################################################
+#
+# Import time benchmark: every phase of loading pyars is measured in a
+# fresh interpreter, so that nothing is shared with an earlier phase.
+# (C) 2004-2015 by Ergorion
+#
+# usage: python bench_import.py [version of the struct module, e.g. 81] [repetitions]
+#
+#######################################################################
+
+import os
+import subprocess
+import sys
+
+# (name of the phase, setup that is not measured, statement that is measured)
+def phases(version):
+    return (('ctypes', '', 'import ctypes'),
+            ('struct module _cars%s' % (version), 'import ctypes', 
+             'from pyars import _cars%s' % (version)),
+            ('cars (probe cache disabled)', 'import os; os.environ["PYARS_PROBE_CACHE"] = "off"',
+             'from pyars import cars'),
+            ('cars (probe cache)', 'import os; os.environ["PYARS_PROBE_CACHE"] = "on"',
+             'from pyars import cars'),
+            ('ars_const', 'from pyars import cars', 'len(cars.ars_const)'),
+            ('ars', 'from pyars import cars', 'from pyars import ars'),
+            ('erars', 'from pyars import ars', 'from pyars import erars'),
+            ('pyars.erars (total)', '', 'from pyars import erars'))
+
+def measure(setup, statement):
+    '''run setup and statement in a new interpreter and return the
+duration of statement in seconds (or None if it failed)'''
+    program = '\n'.join(('import time',
+                         setup,
+                         'start = time.time()',
+                         statement,
+                         'print (time.time() - start)'))
+    process = subprocess.Popen([sys.executable, '-c', program],
+                               stdout = subprocess.PIPE,
+                               stderr = subprocess.PIPE)
+    (output, _) = process.communicate()
+    if process.returncode != 0:
+        return None
+    try:
+        return float(output.strip().splitlines()[-1])
+    except (ValueError, IndexError):
+        return None
+
+def main(version = 81, repetitions = 5):
+    # the package has to be importable as pyars
+    packageDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    os.environ['PYTHONPATH'] = os.pathsep.join((os.path.dirname(packageDirectory),
+                                                os.environ.get('PYTHONPATH', '')))
+    print ('phase                          best of %d' % (repetitions))
+    for (name, setup, statement) in phases(version):
+        durations = [measure(setup, statement) for _ in range(repetitions)]
+        durations = [duration for duration in durations if duration is not None]
+        if durations:
+            print ('%-30s %8.1f ms' % (name, 1000 * min(durations)))
+        else:
+            print ('%-30s      n/a (failed)' % (name))
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
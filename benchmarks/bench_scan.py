@@ -0,0 +1,58 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#######################################################################
+#
+# Scaling of ScanListEntryWithFields with the number of partitions
+# (sessions): a form of the in-process fake of the arapi is read with
+# 1, 2, 4, ... partitions. Every call of ARGetListEntryWithFields waits
+# for the given latency, which stands in for the time the server needs
+# for a page; the conversions run on the client and are shared by all
+# partitions (and limited by the number of cores).
+# (C) 2004-2015 by Ergorion
+#
+# usage: python bench_scan.py [entries] [latency per page in ms] [page size] [max partitions]
+#
+#######################################################################
+
+import os
+import sys
+import time
+
+import pyars
+if 'pyars.cars' not in sys.modules:
+    pyars.configure('fake', os.environ.get('PYARS_API_VERSION', 81))
+from pyars import cars, erars, fakearapi
+
+schemaName = 'pyars benchmark'
+
+def main(numEntries = 20000, latency = 100, pageSize = 500, maxPartitions = 8):
+    if not isinstance(cars.arapi, fakearapi.FakeArapi):
+        fakearapi.install()
+    fake = cars.arapi
+    fake.addForm(schemaName, [(536870913, 'Counter', cars.AR_DATA_TYPE_INTEGER)])
+    fake.populate(schemaName, numEntries)
+    fake.latencies['ARGetListEntryWithFields'] = latency / 1000.0
+    session = erars.erARS('fake', 'Demo', '')
+    print ('%d entries, %d ms per page of %d entries' % (numEntries, latency, pageSize))
+    print ('partitions    seconds  entries/s  speedup')
+    partitions = 1
+    first = None
+    while partitions <= maxPartitions:
+        start = time.time()
+        numRead = 0
+        for entry in session.ScanListEntryWithFields(schemaName, None, (1, 536870913),
+                                                     partitions = partitions,
+                                                     pageSize = pageSize):
+            numRead += 1
+        duration = time.time() - start
+        assert numRead == numEntries
+        if first is None:
+            first = duration
+        print ('%10d %10.2f %10.0f %8.2f' % (partitions, duration,
+                                              numEntries / duration, first / duration))
+        partitions *= 2
+    session.Logoff()
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:5]]
+    main(*args)
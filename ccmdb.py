@@ -10,6 +10,8 @@
 import os
 
 from ctypes import CDLL # , cdecl
+
+from pyars import decoders
 # from cars import *
 
 # a list of versions (major/minor version) of dll/.h files to check
@@ -159,6 +161,12 @@ ARValueStruct._mapping_co_ = {
             AR_DATA_TYPE_CURRENCY: 'u.currencyVal.contents',
             AR_DATA_TYPE_COORDS: 'u.coordListVal.contents'
         }
+ARValueStruct._decoder_ = decoders.compileValueDecoders(ARValueStruct._mapping_so_,
+                                                       ARValueStruct._mapping_co_,
+                                                       (AR_DATA_TYPE_NULL,),
+                                                       'obj.')
+ARValueStruct._decoder_utf8_ = decoders.compileUnicodeDecoders(ARValueStruct._decoder_,
+                                                              AR_DATA_TYPE_CHAR)
 #ARActiveLinkActionStruct._mapping_ = { AR_ACTIVE_LINK_ACTION_MACRO: 'u.macro',
 #                  AR_ACTIVE_LINK_ACTION_FIELDS: 'u.setFields',
 #                  AR_ACTIVE_LINK_ACTION_MESSAGE: 'u.message',
@@ -18,7 +18,7 @@ import logging
 
 from ctypes import c_uint, c_int, c_char_p, byref, Structure, POINTER
 
-from pyars import cars, ccmdb
+from pyars import cars, ccmdb, instrumentation, resilience
 from pyars.ars import ARS, my_byref 
 
 if ccmdb.cmdbversion == 'arosapi63':
@@ -86,6 +86,10 @@ All methods have prefix "AROS".'''
             self.cmdbapi = ccmdb.cmdbapi # set in ccmdb
             self.arversion = cars.version
             self.cmdbversion = ccmdb.cmdbversion # set in ccmdb
+            if resilience.default is not None:
+                self.enableResilience(resilience.default)
+            if instrumentation.default is not None:
+                self.enableInstrumentation(instrumentation.default)
             if server != '':
                 self.Login(server, user, password)
     
@@ -1367,6 +1371,10 @@ CMDB API, using the true CMDB... function calls.'''
             self.cmdbapi = ccmdb.cmdbapi # set in ccmdb
             self.arversion = cars.version
             self.cmdbversion = ccmdb.cmdbversion # set in ccmdb
+            if resilience.default is not None:
+                self.enableResilience(resilience.default)
+            if instrumentation.default is not None:
+                self.enableInstrumentation(instrumentation.default)
             if server != '':
                 self.Login(server, user, password)
     
@@ -0,0 +1,62 @@
+#######################################################################
+#
+# This is the decoder table for the ARValueStruct union of pyars.
+# (C) 2004-2015 by Ergorion
+#
+# cars and ccmdb describe how to read the union members of an
+# ARValueStruct as strings (_mapping_so_ and _mapping_co_). Evaluating
+# those strings for every single value is expensive; therefore the
+# strings are compiled into one accessor function per data type when
+# the version specific struct module is loaded. The resulting
+# dictionaries are attached to the ARValueStruct class as _decoder_
+# and _decoder_utf8_ and shared by erars and ercmdb.
+#
+
+def decodeNull(obj):
+    '''accessor for data types that do not carry a value'''
+    return None
+
+def compileValueDecoders(mappingSimple, mappingComplex, nullTypes = (),
+                         prefix = ''):
+    '''compileValueDecoders turns the string mappings of an ARValueStruct
+into a dictionary of precompiled accessor functions.
+
+Input: mappingSimple: {dataType: 'u.member', ...} (read as obj.u.member)
+       mappingComplex: {dataType: 'expression', ...} (an expression
+                   working on the struct obj)
+       (optional) nullTypes: data types that are returned as None (default: ())
+       (optional) prefix: string prepended to the complex expressions;
+                   use 'obj.' if the expressions do not reference obj
+                   themselves (default: '')
+Output: dictionary {dataType: function(obj), ...}'''
+    decoder = {}
+    for dataType in nullTypes:
+        decoder[dataType] = decodeNull
+    for (dataType, member) in mappingSimple.items():
+        decoder[dataType] = eval('lambda obj: obj.%s' % (member))
+    for (dataType, expression) in mappingComplex.items():
+        decoder[dataType] = eval('lambda obj: %s%s' % (prefix, expression))
+    return decoder
+
+def compileUnicodeDecoders(decoder, charType, attachType = None,
+                           charSet = 'utf-8'):
+    '''compileUnicodeDecoders derives a decoder table for sessions that
+use a multibyte character set: character values (and optionally the
+name of attachments) are decoded into unicode strings.
+
+Input: decoder: dictionary as returned by compileValueDecoders
+       charType: data type of character fields (AR_DATA_TYPE_CHAR)
+       (optional) attachType: data type of attachments; if given, attachments
+                   are returned as (unicode name, origSize, compSize) (default: None)
+       (optional) charSet: character set used to decode (default: utf-8)
+Output: dictionary {dataType: function(obj), ...}'''
+    unicodeDecoder = dict(decoder)
+    unicodeDecoder[charType] = lambda obj: obj.u.charVal.decode(charSet)
+    if attachType is not None:
+        def decodeAttach(obj):
+            attach = obj.u.attachVal.contents
+            return (attach.name.decode(charSet),
+                    attach.origSize,
+                    attach.compSize)
+        unicodeDecoder[attachType] = decodeAttach
+    return unicodeDecoder
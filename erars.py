@@ -12,34 +12,55 @@
 # known issues:
 #
 
+from array import array
 from ctypes import c_ulong, c_long, c_double, c_int, c_uint, byref,\
-                    pointer, c_char_p
+                    pointer, c_char_p, addressof, memmove, sizeof, Structure
+import heapq
+import re
 import exceptions
+import sys
+import threading
 import time
+from collections import OrderedDict
+try:
+    import Queue as queue
+except ImportError: # python 3
+    import queue
+
+try: # numpy is optional; it is only used for columnar results
+    import numpy
+except ImportError:
+    numpy = None
 
 from pyars import cars
 #from pyars.ars import ARS, my_byref, pyARSNotImplemented
 from pyars import ars
+from pyars import metadatastore
+from pyars import objectcache
 
 class ARError(exceptions.Exception):
     def __init__(self, arsSession = None, msgText = None, msgType = cars.AR_RETURN_WARNING):
         '''You can raise an ARError exception with an ars session or a message.
-If msgType is set, it is assumed that you do want to use msgText as the
-exception text; otherwise, the status list from arsSession will be read 
-and used as the message.
+If msgText is given (or there is no arsSession), it is used as the
+exception text; otherwise, the status list of the last call of this
+thread on arsSession will be read and used as the message.
 Input: (optional) arsSession
        (optional) msgText
        (optional) msgType (can be AR_RETURN_OK, AR_RETURN_WARNING, AR_RETURN_ERROR)
 Output: n/a'''
-        if msgType is not None:
+        if msgType is not None and (arsSession is None or msgText is not None):
             self.messageType = msgType
             self.messageNum = 0
             self.messageText =  msgText
             return
-        if arsSession is not None and arsSession.arsl is not None and arsSession.arsl.numItems > 0:
+        # the status of the last call of this thread on arsSession
+        if arsSession.arsl is not None and arsSession.arsl.numItems > 0:
             arstatusStruct = arsSession.arsl.statusList[0]
-        self.messageType = arstatusStruct.messageType
-        self.messageNum = arstatusStruct.messageNum
+            self.messageType = arstatusStruct.messageType
+            self.messageNum = arstatusStruct.messageNum
+        else:
+            self.messageType = arsSession.errnr
+            self.messageNum = 0
         self.messageText = arsSession.statusText()
 #        arstatusStruct.messageText
 #        if arstatusStruct.appendedText:
@@ -52,6 +73,327 @@ Output: n/a'''
                                      self.messageNum,
                                      self.messageText)
 
+class _ColumnBuilder(object):
+    '''_ColumnBuilder collects the values of a result set column by
+column instead of row by row (see convEntryListFieldValueList2Columns).
+Columns of integer, real, enum and time fields are packed into an 
+array.array as long as all their values have the same data type; as soon
+as a NULL value (or a different data type) shows up, the column falls
+back to a python list.'''
+
+    # typecodes of array.array per data type of a packable column
+    typeCodes = {cars.AR_DATA_TYPE_INTEGER: 'l',
+                 cars.AR_DATA_TYPE_REAL: 'd',
+                 cars.AR_DATA_TYPE_ENUM: 'L',
+                 cars.AR_DATA_TYPE_TIME: 'l'}
+
+    def __init__(self, convert, decoder):
+        '''Input: convert: function(ARValueStruct, decoder) returning the value
+       decoder: decoder table handed over to convert'''
+        self.convert = convert
+        self.decoder = decoder
+        self.columns = {}
+        self.dataTypes = {}
+        self.numRows = 0
+
+    def addRow(self, fieldValueList):
+        '''append the values of an ARFieldValueList as a new row'''
+        columns = self.columns
+        dataTypes = self.dataTypes
+        for i in range(fieldValueList.numItems):
+            fieldValue = fieldValueList.fieldValueList[i]
+            fieldId = fieldValue.fieldId
+            dataType = fieldValue.value.dataType
+            value = self.convert(fieldValue.value, self.decoder)
+            try:
+                column = columns[fieldId]
+            except KeyError:
+                column = self._newColumn(fieldId, dataType, value)
+            if dataTypes[fieldId] is not None and (value is None or
+                                                   dataType != dataTypes[fieldId]):
+                column = self._unpack(fieldId)
+            column.append(value)
+        self.numRows += 1
+        # not every row needs to contain every field...
+        if fieldValueList.numItems != len(columns):
+            for fieldId in columns.keys():
+                if len(columns[fieldId]) < self.numRows:
+                    self._unpack(fieldId).append(None)
+
+    def _newColumn(self, fieldId, dataType, value):
+        if self.numRows == 0 and value is not None and dataType in self.typeCodes:
+            self.columns[fieldId] = array(self.typeCodes[dataType])
+            self.dataTypes[fieldId] = dataType
+        else:
+            # the field did not show up in the rows so far
+            self.columns[fieldId] = [None] * self.numRows
+            self.dataTypes[fieldId] = None
+        return self.columns[fieldId]
+
+    def _unpack(self, fieldId):
+        if self.dataTypes[fieldId] is not None:
+            self.columns[fieldId] = self.columns[fieldId].tolist()
+            self.dataTypes[fieldId] = None
+        return self.columns[fieldId]
+
+    def result(self):
+        '''return the columns: {fieldId: column, ...}; if numpy is available,
+packed columns are handed out as numpy arrays.'''
+        if numpy is not None:
+            for fieldId in self.columns.keys():
+                if self.dataTypes[fieldId] is not None and len(self.columns[fieldId]) > 0:
+                    column = self.columns[fieldId]
+                    self.columns[fieldId] = numpy.frombuffer(column,
+                                                             dtype=column.typecode)
+        return self.columns
+
+class _FieldIndex(object):
+    '''_FieldIndex maps the names of the fields of a schema to their ids
+and back (see erARS51._getFieldIndex).'''
+
+    def __init__(self, fields):
+        '''Input: list of (fieldId, fieldName, dataType, option, createMode)'''
+        self.fields = fields
+        self.ids = dict([(field[1], field[0]) for field in fields])
+        self.names = dict([(field[0], field[1]) for field in fields])
+        self.dataTypes = dict([(field[0], field[2]) for field in fields])
+
+class QualifierTemplate(object):
+    '''QualifierTemplate is a qualifier that has been compiled once with
+placeholders and can be bound to new values without another round trip
+to the server (see erARS51.PrepareQualifier):
+    template = ars.PrepareQualifier('HPD:Help Desk', 
+                                    "'Status' = {status} AND 'Assignee' = {user}")
+    q = template.bind(status = 1, user = 'Demo')
+    ars.GetListEntryWithFields('HPD:Help Desk', q, ...)
+bind changes the value nodes of the ARQualifierStruct in place and returns
+it; therefore, a template must only be used by one thread at a time.
+When the template is not needed anymore, release it with free.'''
+
+    # values that stand in for the placeholders while the query is compiled
+    _sentinelBase = 1999990000
+    _placeholder = re.compile(r'\{(\w+)\}')
+
+    def __init__(self, arsSession, schema, query, displayTag = None):
+        self.arsSession = arsSession
+        self.schema = schema
+        self.query = query
+        self.names = []
+        def replace(match):
+            name = match.group(1)
+            if name not in self.names:
+                self.names.append(name)
+            return str(self._sentinelBase + self.names.index(name))
+        compiledQuery = self._placeholder.sub(replace, query)
+        self.qualifier = arsSession._LoadQualifierStruct(schema, compiledQuery, 
+                                                         displayTag)
+        # name -> list of (value node, copy of its original content)
+        self.nodes = dict([(name, []) for name in self.names])
+        self._findValueNodes(self.qualifier)
+        missing = [name for name in self.names if not self.nodes[name]]
+        if missing:
+            self.free()
+            raise ARError(None, 'QualifierTemplate: could not find the placeholders %s in the compiled qualifier' % (
+                                ', '.join(missing)), cars.AR_RETURN_ERROR)
+
+    def _placeholderName(self, value):
+        '''return the name of the placeholder a value node stands for, or None'''
+        if value.dataType in (cars.AR_DATA_TYPE_INTEGER, cars.AR_DATA_TYPE_TIME):
+            number = value.dataType == cars.AR_DATA_TYPE_INTEGER and value.u.intVal or value.u.timeVal
+        elif value.dataType == cars.AR_DATA_TYPE_REAL:
+            number = value.u.realVal
+        elif value.dataType in (cars.AR_DATA_TYPE_CHAR, cars.AR_DATA_TYPE_DECIMAL):
+            try:
+                number = int(value.dataType == cars.AR_DATA_TYPE_CHAR and value.u.charVal or 
+                             value.u.decimalVal)
+            except (TypeError, ValueError):
+                return None
+        else:
+            return None
+        index = int(number) - self._sentinelBase
+        if number == int(number) and 0 <= index < len(self.names):
+            return self.names[index]
+        return None
+
+    def _findOperandNodes(self, operand):
+        if operand.tag == cars.AR_VALUE:
+            name = self._placeholderName(operand.u.value)
+            if name is not None:
+                value = operand.u.value
+                self.nodes[name].append((value, cars.ARValueStruct.from_buffer_copy(value)))
+        elif operand.tag == cars.AR_ARITHMETIC and operand.u.arithOp:
+            self._findOperandNodes(operand.u.arithOp.contents.operandLeft)
+            self._findOperandNodes(operand.u.arithOp.contents.operandRight)
+
+    def _findValueNodes(self, qualifier):
+        if qualifier.operation in (cars.AR_COND_OP_AND, cars.AR_COND_OP_OR):
+            self._findValueNodes(qualifier.u.andor.operandLeft.contents)
+            self._findValueNodes(qualifier.u.andor.operandRight.contents)
+        elif qualifier.operation == cars.AR_COND_OP_NOT:
+            self._findValueNodes(qualifier.u.notQual.contents)
+        elif qualifier.operation == cars.AR_COND_OP_REL_OP:
+            self._findOperandNodes(qualifier.u.relOp.contents.operandLeft)
+            self._findOperandNodes(qualifier.u.relOp.contents.operandRight)
+
+    def bind(self, values = None, **kwargs):
+        '''bind sets the values of the placeholders.
+Input: dictionary {name: value} and/or name = value; a value can also be
+       a tuple (value, dataType), otherwise the data type is derived from
+       the python type (as in conv2ValueStruct)
+Output: ARQualifierStruct (always the same object)'''
+        if values is None:
+            values = {}
+        values = dict(values, **kwargs)
+        missing = [name for name in self.names if name not in values]
+        if missing:
+            raise ARError(None, 'QualifierTemplate.bind: no value for %s' % (
+                                ', '.join(missing)), cars.AR_RETURN_ERROR)
+        for name in self.names:
+            value = values[name]
+            dataType = None
+            if isinstance(value, tuple) and len(value) == 2:
+                (value, dataType) = value
+            for (node, original) in self.nodes[name]:
+                self.arsSession.conv2ValueStruct(node, value, dataType)
+        return self.qualifier
+
+    def free(self):
+        '''free gives the memory of the compiled qualifier back; the value
+nodes get their original content back first, as the strings that
+have been bound belong to python.'''
+        if self.qualifier is None:
+            return
+        for nodes in self.nodes.values():
+            for (node, original) in nodes:
+                memmove(addressof(node), addressof(original), sizeof(original))
+        self.nodes = {}
+        self.arsSession.Free(self.qualifier)
+        self.qualifier = None
+
+def _compileValueSetter(dataType, member, convert):
+    '''return a function that sets an ARValueStruct to a value of dataType'''
+    def setter(valueStruct, value):
+        valueStruct.dataType = dataType
+        setattr(valueStruct.u, member, convert(value))
+    return setter
+
+def _integral(convert):
+    '''return a conversion that only accepts integral numbers; anything
+else (e.g. 2.9 or '2') raises TypeError and is left to conv2ValueStruct,
+instead of being truncated'''
+    def convertIntegral(value):
+        if (isinstance(value, (int, long)) or 
+                (isinstance(value, float) and value.is_integer())):
+            return convert(value)
+        raise TypeError('%r is not an integral number' % (value, ))
+    return convertIntegral
+
+def _convertString(value):
+    if isinstance(value, basestring):
+        return value
+    return str(value)
+
+# default of the arguments of configureCache: keep the current value
+_keepCurrent = object()
+
+# data type of a field -> setter for the ARValueStruct; data types that
+# are not listed here are converted by erARS51.conv2ValueStruct
+_valueSetters = {
+    cars.AR_DATA_TYPE_KEYWORD: _compileValueSetter(cars.AR_DATA_TYPE_KEYWORD, 'keyNum', _integral(int)),
+    cars.AR_DATA_TYPE_INTEGER: _compileValueSetter(cars.AR_DATA_TYPE_INTEGER, 'intVal', _integral(int)),
+    cars.AR_DATA_TYPE_REAL: _compileValueSetter(cars.AR_DATA_TYPE_REAL, 'realVal', float),
+    cars.AR_DATA_TYPE_CHAR: _compileValueSetter(cars.AR_DATA_TYPE_CHAR, 'charVal', _convertString),
+    cars.AR_DATA_TYPE_DIARY: _compileValueSetter(cars.AR_DATA_TYPE_DIARY, 'diaryVal', _convertString),
+    cars.AR_DATA_TYPE_ENUM: _compileValueSetter(cars.AR_DATA_TYPE_ENUM, 'enumVal', _integral(int)),
+    cars.AR_DATA_TYPE_TIME: _compileValueSetter(cars.AR_DATA_TYPE_TIME, 'timeVal', _integral(long)),
+    cars.AR_DATA_TYPE_BITMASK: _compileValueSetter(cars.AR_DATA_TYPE_BITMASK, 'maskVal', _integral(long)),
+    cars.AR_DATA_TYPE_TIME_OF_DAY: _compileValueSetter(cars.AR_DATA_TYPE_TIME_OF_DAY, 'timeOfDayVal', _integral(long)),
+    cars.AR_DATA_TYPE_DECIMAL: _compileValueSetter(cars.AR_DATA_TYPE_DECIMAL, 'decimalVal', str),
+    cars.AR_DATA_TYPE_ULONG: _compileValueSetter(cars.AR_DATA_TYPE_ULONG, 'ulongVal', _integral(long)),
+    cars.AR_DATA_TYPE_DATE: _compileValueSetter(cars.AR_DATA_TYPE_DATE, 'dateVal', _integral(int)),
+}
+
+def _encodeFieldValues(arsSession, array, row, plan):
+    '''fill array with the (fieldId, value) pairs of row; plan holds one
+setter per field (see erARS51._getEncodePlan). Fields without a setter,
+None values and values that do not fit the data type of the field are
+converted by conv2ValueStruct, which derives the data type from the value.'''
+    conv2ValueStruct = arsSession.conv2ValueStruct
+    for i in range(len(row)):
+        (fieldId, value) = row[i]
+        array[i].fieldId = fieldId
+        setter = plan[i]
+        if setter is None or value is None:
+            conv2ValueStruct(array[i].value, value)
+        else:
+            try:
+                setter(array[i].value, value)
+            except (TypeError, ValueError):
+                conv2ValueStruct(array[i].value, value)
+
+class _FieldValueBuffer(object):
+    '''_FieldValueBuffer converts rows (see conv2FieldValueList) into one
+ARFieldValueList that is reused from row to row; the array only grows if a
+row has more fields than any row before. The list returned by fill is only
+valid until the next call of fill.
+If the schema is given, the values are set with the data types of the
+fields; the encode plan is looked up once per set of fieldIds, not per row.'''
+
+    def __init__(self, arsSession, size = 32, schema = None):
+        self.arsSession = arsSession
+        self.schema = schema
+        # tuple of fieldIds -> encode plan
+        self._plans = {}
+        self._allocate(size)
+
+    def _allocate(self, size):
+        self.array = (cars.ARFieldValueStruct * size)()
+        self.fieldValueList = cars.ARFieldValueList(0, self.array)
+
+    def fill(self, row):
+        '''Input: dictionary {fieldId: value} or list of (fieldId, value)
+Output: ARFieldValueList'''
+        if isinstance(row, dict):
+            row = row.items()
+        numItems = len(row)
+        if numItems > len(self.array):
+            self._allocate(max(numItems, 2 * len(self.array)))
+        fieldIds = tuple([fieldId for (fieldId, value) in row])
+        try:
+            plan = self._plans[fieldIds]
+        except KeyError:
+            plan = self.arsSession._getEncodePlan(self.schema, fieldIds)
+            self._plans[fieldIds] = plan
+        _encodeFieldValues(self.arsSession, self.array, row, plan)
+        self.fieldValueList.numItems = numItems
+        return self.fieldValueList
+
+class _MergeKey(object):
+    '''sort key of an entry (entryid, {fid: value}) for a sortList of
+(fieldId, AR_SORT_ASCENDING/AR_SORT_DESCENDING); field 1 is taken from the
+entry id. Used to merge sorted results with heapq.'''
+
+    __slots__ = ('values', 'sortList')
+
+    def __init__(self, entry, sortList):
+        self.sortList = sortList
+        self.values = []
+        for (fieldId, order) in sortList:
+            if fieldId == 1 and 1 not in entry[1]:
+                self.values.append(entry[0])
+            else:
+                self.values.append(entry[1].get(fieldId))
+
+    def __lt__(self, other):
+        for i in range(len(self.values)):
+            (mine, theirs) = (self.values[i], other.values[i])
+            if mine == theirs:
+                continue
+            if self.sortList[i][1] == cars.AR_SORT_DESCENDING:
+                return theirs < mine
+            return mine < theirs
+        return False
+
 class erARS51(ars.ARS):
     
     def __init__(self, server='', user='', password='', language='', 
@@ -73,51 +415,301 @@ class erARS51(ars.ARS):
             pass # Exception occurred
         self.Logoff()
 
+    # defaults for the internal cache; change them with configureCache
+    _cacheMaxEntries = 10000
+    _cacheMaxBytes = None
+    _cacheTimeout = 10 * 60
+    _cacheTimeouts = {}
+    # MetadataSnapshot of the server, if a metadata store is used (erARS75 and later)
+    _metadata = None
+
     def _InitializeCache(self):
         '''InitializeCache setup the internal cache for objects retrieved
-from server. This cache has a common structure:
-{ 'type_of_object' : 
-    {schema :
-        { id : object }
-    }
-}
-as 'type_of_object' are currently supported: alink, fields, filter and schema.
-for alink and filter the name is the id, for fields it is the fieldid, for
-schema (the schema definition itself) it is the string "default".
+from server. Every object in the cache is addressed by
+(type_of_object, schema, id)
+as 'type_of_object' are currently supported: alink, fields, filter, schema,
+fieldtable, joinlayout and qualifier.
+for alink and filter the name is the id and schema is "default", for fields
+it is the fieldid, for schema (the schema definition itself) it is the
+string "default" (as for joinlayout), for fieldtable it is the field type and for qualifier
+(compiled query strings) it is (query, displayTag).
 With this setup we can define one single function to retrieve objects from
-the cache.'''
-        self._cacheTimeout = 10 * 60
-        self.cache = {'alink' : {},
-                      'fields': {},
-                      'filter': {},
-                      'schema': {}}
+the cache.
+The cache is bounded (see configureCache): the least recently used objects
+are evicted and freed, as are objects that have timed out. Therefore, do not
+hold on to objects returned by GetField, GetSchema, GetFilter or 
+GetActiveLink for longer than necessary.
+If the cache exists already (e.g. for a second Login), it is emptied.'''
+        cache = getattr(self, 'cache', None)
+        if isinstance(cache, objectcache.ObjectCache):
+            cache.clear()
+            return
+        self.cache = objectcache.ObjectCache(maxEntries = self._cacheMaxEntries,
+                                             maxBytes = self._cacheMaxBytes,
+                                             timeout = self._cacheTimeout,
+                                             timeouts = self._cacheTimeouts,
+                                             freeFunction = self._FreeCachedObject)
+
+    def _FreeCachedObject(self, object_):
+        '''free an object that has been evicted from the cache; pythonic 
+objects (like the field indexes or join layouts) are left to the garbage
+collector'''
+        if isinstance(object_, Structure):
+            self.ARFree(object_)
 
     def _RetrieveObjectFromCache(self, typeOfObject,
                                  schema,
                                  objectId):
         '''Return a certain object from the cache if it was retrieved before
 and has not timed out yet.
-Input: typeOfObject (can be either  'alink', 'fields', 'filter', 'schema', 'fieldtable')
+Input: typeOfObject (can be either  'alink', 'fields', 'filter', 'schema', 'fieldtable', 'joinlayout', 'qualifier', 'encodeplan')
         schema (name of schema that the field belongs to; for alink and filter this is 'default')
         objectId (something to identify (in case of 'schema' or 'fieldtable', this is 'default')
 Output: object or None'''
-        now = time.time()
-        if self.cache[typeOfObject].has_key(schema):
-            if self.cache [typeOfObject][schema].has_key(objectId):
-                (object_, timestamp) = self.cache [typeOfObject][schema][objectId]
-                if now - timestamp < self._cacheTimeout:
-                    self.logger.debug('_RetrieveObjectFromCache: return info for %s:%s:%s from cache' % (
-                                      schema, typeOfObject, objectId))
-                    if object_ is None:
-                        self.errnr = 2 # simulate an error
-                    return object_
-                else: # after cache timeout
-                    self.ARFree(object_)
-        else: # if the cache does not know this schema yet!
-            self.cache [typeOfObject].update({schema: {}})
+        (found, object_) = self.cache.get(typeOfObject, schema, objectId)
+        if found:
+            self.logger.debug('_RetrieveObjectFromCache: return info for %s:%s:%s from cache' % (
+                              schema, typeOfObject, objectId))
+            if object_ is None:
+                self.errnr = 2 # simulate an error
+        return object_
 
     def _StoreObjectInCache(self, typeOfObject, schema, objectId, object_):
-        self.cache[typeOfObject][schema][objectId] = (object_, time.time())
+        self.cache.put(typeOfObject, schema, objectId, object_)
+
+    def cacheStats(self):
+        '''cacheStats returns the counters of the internal cache.
+Input: 
+Output: dictionary with the keys hits, misses, evictions, expirations,
+    entries and bytes (bytes only counts the top level structs)'''
+        return self.cache.stats()
+
+    def configureCache(self, maxEntries = _keepCurrent,
+                       maxBytes = _keepCurrent,
+                       timeout = None,
+                       timeouts = None):
+        '''configureCache changes the limits of the internal cache; if the
+cache exceeds the new limits, the least recently used objects are evicted
+at once.
+Input: (optional) maxEntries (maximum number of objects, None = unlimited,
+                  default: keep the current limit)
+       (optional) maxBytes (maximum size of all objects, None = unlimited,
+                  default: keep the current limit)
+       (optional) timeout (seconds after which objects expire, default: None = 
+                  keep the current timeout)
+       (optional) timeouts (dictionary {typeOfObject : seconds} to
+                  override the timeout for certain types of objects, e.g.
+                  {'fields': 3600}, default: None = keep the current timeouts)
+Output: none'''
+        if maxEntries is not _keepCurrent:
+            self._cacheMaxEntries = maxEntries
+        if maxBytes is not _keepCurrent:
+            self._cacheMaxBytes = maxBytes
+        if timeout is not None:
+            self._cacheTimeout = timeout
+        if timeouts is not None:
+            self._cacheTimeouts = dict(timeouts)
+        cache = getattr(self, 'cache', None)
+        if isinstance(cache, objectcache.ObjectCache):
+            cache.timeout = self._cacheTimeout
+            cache.timeouts = dict(self._cacheTimeouts)
+            cache.setLimits(self._cacheMaxEntries, self._cacheMaxBytes)
+        else:
+            self._InitializeCache()
+
+    def _getFieldSnapshot(self, schema, idList = None,
+                          fieldType = cars.AR_FIELD_TYPE_DATA):
+        '''_getFieldSnapshot retrieves the basic definitions of fields with one
+call to ARGetMultipleFields.
+If idList is None, the definitions of all fields of fieldType are returned;
+if a metadata store is used, they are taken from (and stored in) the 
+snapshot of the server.
+Input: schema
+       (optional) idList (default: None; can be an ARInternalIdList or a tuple of fieldids)
+       (optional) fieldType (default: cars.AR_FIELD_TYPE_DATA)
+Output: list of (fieldId, fieldName, dataType, option, createMode); raises 
+    ARError in case of failure'''
+        if idList is None and self._metadata is not None:
+            fields = self._metadata.getFields(schema, fieldType)
+            if fields is not None:
+                return fields
+        if idList is not None:
+            arIdList = self.conv2InternalIdList(idList)
+        elif fieldType == cars.AR_FIELD_TYPE_ALL:
+            # without an idList, ARGetMultipleFields returns all fields
+            arIdList = None
+        else:
+            arIdList = self.ARGetListField(schema, fieldType=fieldType)
+            if self.errnr > 1:
+                raise ARError(self)
+        fieldId2 = cars.ARInternalIdList()
+        fieldName = cars.ARNameList()
+        dataType = cars.ARUnsignedIntList()
+        option = cars.ARUnsignedIntList()
+        createMode = cars.ARUnsignedIntList()
+        try:
+            fieldInfos = self.ARGetMultipleFields(schema,
+                                                  arIdList,
+                                                  fieldId2,
+                                                  fieldName,
+                                                  dataType = dataType,
+                                                  option = option,
+                                                  createMode = createMode)
+            if self.errnr > 1:
+                raise ARError(self)
+            fields = [(field.fieldId, field.fieldName, field.dataType, 
+                       field.option, field.createMode)
+                      for field in fieldInfos.fieldList[:fieldInfos.numItems]
+                      if field.fieldId]
+        finally:
+            for list_ in (fieldId2, fieldName, dataType, option, createMode):
+                self.Free(list_)
+            if idList is None and arIdList is not None:
+                self.Free(arIdList)
+        if idList is None and self._metadata is not None:
+            self._metadata.setFields(schema, fieldType, fields)
+        return fields
+
+    def _getFieldIndex(self, schema, fieldType = cars.AR_FIELD_TYPE_ALL):
+        '''_getFieldIndex returns the name/id index of the fields of a schema;
+it is kept in the cache as 'fieldtable' (so it expires and is evicted like
+the other objects in the cache).
+Input: schema
+       (optional) fieldType (default: cars.AR_FIELD_TYPE_ALL)
+Output: _FieldIndex; raises ARError in case of failure'''
+        index = self._RetrieveObjectFromCache('fieldtable', schema, fieldType)
+        if index is None:
+            self.errnr = 0
+            index = _FieldIndex(self._getFieldSnapshot(schema, None, fieldType))
+            self._StoreObjectInCache('fieldtable', schema, fieldType, index)
+        return index
+
+    def _getEncodePlan(self, schema, fieldIds):
+        '''_getEncodePlan returns the setters that convert the values of
+fieldIds into ARValueStructs with the data types of the fields; it is
+compiled from the field index of the schema and kept in the cache
+as 'encodeplan'.
+Input: schema (None: the data types are derived from the values)
+       fieldIds (tuple of fieldIds)
+Output: tuple with one setter per fieldId (None for the fields whose
+    values are converted by conv2ValueStruct)'''
+        if schema is None:
+            return (None,) * len(fieldIds)
+        plan = self._RetrieveObjectFromCache('encodeplan', schema, fieldIds)
+        if plan is None:
+            try:
+                dataTypes = self._getFieldIndex(schema).dataTypes
+            except ARError:
+                # without the field definitions, fall back to the data types
+                # of the values
+                self.logger.warn('_getEncodePlan: no field definitions for %s: %s' % (
+                                 schema, sys.exc_info()[1]))
+                dataTypes = {}
+            self.errnr = 0
+            plan = tuple([_valueSetters.get(dataTypes.get(fieldId)) 
+                          for fieldId in fieldIds])
+            self._StoreObjectInCache('encodeplan', schema, fieldIds, plan)
+        return plan
+
+    def _LoadQualifierStruct(self, schema, query, displayTag = None):
+        '''compile a query string into an ARQualifierStruct that is not
+cached; the caller has to free it.'''
+        if query is None:
+            return None
+        elif isinstance(query, cars.ARQualifierStruct):
+            return query
+        # through the method, so that wrappers of the session (see
+        # resilience.py) see this round trip, too
+        q = self.ARLoadARQualifierStruct(schema, query, displayTag)
+        if self.errnr > 1:
+            self.logger.error ('conv2QualifierStruct: LoadQualifier failed!')
+            raise ARError(self)
+        return q
+
+    def _getJoinLayout(self, schemaString):
+        '''_getJoinLayout returns the (leaf) member forms of a join form in the
+order of the ids in its entry ids; joins of joins are flattened. For other
+forms, it returns (schemaString, ). The layout is kept in the cache as
+'joinlayout'.
+Input: schemaString
+Output: tuple of schema names; raises ARError in case of failure'''
+        layout = self._RetrieveObjectFromCache('joinlayout', schemaString, 'default')
+        if layout is not None:
+            return layout
+        self.errnr = 0
+        schema = self.GetSchema(schemaString)
+        if schema.schema.schemaType == cars.AR_SCHEMA_JOIN:
+            # copy the names before the schemas of the members are retrieved
+            memberA = schema.schema.u.join.memberA
+            memberB = schema.schema.u.join.memberB
+            layout = self._getJoinLayout(memberA) + self._getJoinLayout(memberB)
+        else:
+            layout = (schemaString, )
+        self._StoreObjectInCache('joinlayout', schemaString, 'default', layout)
+        return layout
+
+    def _GetEntryChunk(self, schema, chunk, idList):
+        '''retrieve the entries of chunk with one call of GetMultipleEntries.
+Output: list of (entryId, {fieldid: value} or None if the entry does 
+    not exist); raises ARError in case of failure'''
+        entryIdList = self._packEntryIdListList(chunk)
+        if entryIdList is None:
+            entryIdList = chunk
+        (existList, fieldValueListList) = self.GetMultipleEntries(schema, entryIdList, idList)
+        try:
+            exists = self.convBooleanList2List(existList)
+            values = self.convFieldValueListList2List(fieldValueListList)
+        finally:
+            self.Free(existList)
+            self.Free(fieldValueListList)
+        result = []
+        for i in range(len(chunk)):
+            if exists[i]:
+                result.append((chunk[i], values[i]))
+            else:
+                result.append((chunk[i], None))
+        return result
+
+    def _GetEntrySnapshots(self, schema, entryIds, fieldIds, chunkSize = 100):
+        '''retrieve the current values of fieldIds for the entries with
+GetMultipleEntries (chunkSize entries per call).
+Output: dictionary {entryId: {fieldid: value} or None if the entry does 
+    not exist}; raises ARError in case of failure'''
+        return self.GetEntries(schema, entryIds, fieldIds, chunkSize)
+
+    def _diffFieldValues(self, fieldList, snapshot):
+        '''return the list of (fieldId, value) of fieldList (dictionary or
+list of (fieldId, value)) that differ from snapshot; the core fields
+that cannot be set (Request ID, Create Date, Modified Date) are skipped.'''
+        if isinstance(fieldList, dict):
+            fieldList = fieldList.items()
+        return [(fieldId, value) for (fieldId, value) in fieldList
+                if fieldId not in (1, 3, 6) and 
+                   (fieldId not in snapshot or snapshot[fieldId] != value)]
+
+    def _getValueDecoder(self):
+        '''return the table of precompiled accessor functions (one per
+data type) that matches the character set of this session; see
+cars.ARValueStruct._decoder_.'''
+        # special handling for unicode
+        if self.context.localeInfo.charSet.lower() == 'utf-8':
+            return cars.ARValueStruct._decoder_utf8_
+        return cars.ARValueStruct._decoder_
+
+    def conv2AndQualifierStruct(self, left, right):
+        '''combine two ARQualifierStructs with AND and return the new
+ARQualifierStruct; if one of them is None, the other one is returned.
+The new struct only references left and right and is owned by python: 
+never hand it to ARFree (free left and right individually instead).'''
+        if left is None:
+            return right
+        if right is None:
+            return left
+        q = cars.ARQualifierStruct()
+        q.operation = cars.AR_COND_OP_AND
+        q.u.andor.operandLeft = pointer(left)
+        q.u.andor.operandRight = pointer(right)
+        return q
 
     def conv2ContainerTypeList(self, containerArray):
         '''take a list of containerTypes and return a ARContainerTypeList
@@ -151,65 +743,31 @@ output: AREntryIdList'''
         
         def createSchemaIdList(schemaString, entry):
             '''take a schemaString and a list of entryIds; starting
-with this schema, try to find out all involved schemas
-for the entryids (e.g. simple joins, joins of joins...)
+with this schema, find out all involved schemas for the entryids 
+(e.g. simple joins, joins of joins...); the layout of the join is
+computed once per schema (see _getJoinLayout)
 Input: schemaString: name of schema
         entry: array of entry ids
 Output: ((schema1, entryid1), (schema2, entryid2), ...) or None in case of failure'''
-#            self.logger.debug('createSchemaIdList: %s and %s' % (
-#                    schemaString, entry))
             # first check if length of tuple == 1: it's not for a join...
             # it just happens to be in a tuple; this time we just assume
             # it's a string, we don't check for integers any more...
             if len(entry) == 1:
                 return ((schemaString, entry[0]), )
-            else:
-                # self.logger.debug('    assuming a join, fetching schema')
-                # Assumption here:
-                # it is a join schema;  so we need to find the names of the 
-                # underlying forms
-                # in order to find out the max. length of the entry ids!
-                self.logger.debug('looking up %s' % schemaString)
-                try:
-                    schema = self.GetSchema(schemaString)
-                except ARError:
-                    self.logger.error(self.statusText())
-                    return None
-                # as we can have joins of joins, we need to 
-                # call ourselves recursively
-                if schema.schema.schemaType == cars.AR_SCHEMA_JOIN:
-                    # if one of the following calls fails, the result
-                    # exception will not be caught. This is on purpose!
-                    # otherwise the cause for not returning a useful result
-                    # will not be known. 
-                    schemaA = self.GetSchema(schema.schema.u.join.memberA)
-                    schemaB = self.GetSchema(schema.schema.u.join.memberB)
-                    if schemaA.schema.schemaType == cars.AR_SCHEMA_JOIN and \
-                        schemaB.schema.schemaType == cars.AR_SCHEMA_JOIN:
-                        return (createSchemaIdList(schema.schema.u.join.memberA,
-                                                   entry[:len(entry)/2])+
-                                createSchemaIdList(schema.schema.u.join.memberB, 
-                                                   entry[len(entry)/2:]))
-                    elif schemaA.schema.schemaType == cars.AR_SCHEMA_JOIN:
-                        return (createSchemaIdList(schema.schema.u.join.memberA,
-                                                   entry[:-1])+
-                               ((schema.schema.u.join.memberB, entry[-1]),)
-                                )
-                    elif schemaB.schema.schemaType == cars.AR_SCHEMA_JOIN:
-                        return (((schema.schema.u.join.memberA, entry[0]),)+
-                                createSchemaIdList(schema.schema.u.join.memberB,
-                                                   entry[1:])
-                                )
-                    else:
-                        return ((schema.schema.u.join.memberA, entry[0]),
-                                (schema.schema.u.join.memberB, entry[1]))
-                else: # this should actually not happen!
-                    # we assume we have a join schema, but the schemaType is not join?
-                    # throw an error!
-                    self.logger.error('''createSchemaIdList: wrong type of entry id %s 
+            try:
+                layout = self._getJoinLayout(schemaString)
+            except ARError:
+                self.logger.error(self.statusText())
+                self.errnr = 2
+                return None
+            if len(layout) != len(entry):
+                # we assume we have a join schema, but the schemaType is not join
+                # or the number of ids does not match its member forms
+                self.logger.error('''createSchemaIdList: wrong type of entry id %s 
 for this schema %s''' % (entry, schemaString))
-                    self.errnr = 2
-                    return None
+                self.errnr = 2
+                return None
+            return tuple(zip(layout, entry))
 
 #        self.logger.debug('conv2EntryIdList for %s and %s' % (
 #                schemaString, entry))
@@ -278,26 +836,75 @@ for this schema %s''' % (entry, schemaString))
     def conv2EntryIdListList (self, schema, entryIdArray):
         '''take an array of entryids and convert them to a
 AREntryIdListList. 
-Input: schema (not used any more)
-       entryIdArray (pythonic list of entryids)
+Input: schema (only needed for join forms)
+       entryIdArray (pythonic list of entryids; for join forms, an entry id
+           is either a string like 'id1|id2' or a tuple (id1, id2))
 Output: AREntryIdListList'''
         if isinstance(entryIdArray, cars.AREntryIdListList):
             return entryIdArray
-        tempArray = (cars.AREntryIdType * len(entryIdArray))()
-        for i in range(len(entryIdArray)):
-            # TODO: here we need the exact field information for
-            # padEntryid!
-            tempArray[i][:] = self.padEntryid(entryIdArray[i])[:]
+        # for join forms, every entry id consists of one id per member form
+        numSegments = 1
+        for entryId in entryIdArray:
+            if isinstance(entryId, (tuple, list)) or '|' in str(entryId):
+                numSegments = len(self._getJoinLayout(schema))
+                break
+        numEntries = len(entryIdArray)
+        tempArray = (cars.AREntryIdType * (numEntries * numSegments))()
+        if numSegments == 1:
+            for i in range(numEntries):
+                # TODO: here we need the exact field information for
+                # padEntryid!
+                tempArray[i][:] = self.padEntryid(entryIdArray[i])[:]
+        else:
+            filler = '\0' * (cars.AR_MAX_ENTRYID_SIZE + 1)
+            for i in range(numEntries):
+                entryId = entryIdArray[i]
+                if not isinstance(entryId, (tuple, list)):
+                    entryId = str(entryId).split('|')
+                if len(entryId) != numSegments:
+                    self.logger.error('conv2EntryIdListList: wrong type of entry id %s for this schema %s' % (
+                                      entryIdArray[i], schema))
+                    self.errnr = 2
+                    return None
+                for j in range(numSegments):
+                    segment = str(entryId[j])
+                    tempArray[i * numSegments + j][:] = (segment + filler[len(segment):])[:]
         # this is a list of lists!
         # the question now is which one stores the single entry ids
         # to retrieve? First try: the inner list
 
-        secondList = (cars.AREntryIdList * len(entryIdArray))()
-        for i in range(len(entryIdArray)):
+        secondList = (cars.AREntryIdList * numEntries)()
+        for i in range(numEntries):
+            secondList[i].numItems = numSegments
+            secondList[i].entryIdList = pointer(tempArray[i * numSegments])
+            
+        return cars.AREntryIdListList(numEntries, secondList)
+
+    def _packEntryIdListList(self, entryIds):
+        '''build the AREntryIdListList for a list of simple entry ids (no
+join forms) in one pass: the ids are padded like padEntryid does without
+a prefix and copied into the array at once.
+Output: AREntryIdListList or None if the ids cannot be packed (e.g. the
+    ids of join forms); then use conv2EntryIdListList'''
+        size = cars.AR_MAX_ENTRYID_SIZE + 1
+        padded = []
+        for entryId in entryIds:
+            if isinstance(entryId, (tuple, list)):
+                return None
+            entryId = str(entryId)
+            if entryId and entryId[0] != '0':
+                entryId = entryId.zfill(cars.AR_MAX_ENTRYID_SIZE)
+            if len(entryId) > cars.AR_MAX_ENTRYID_SIZE or '|' in entryId:
+                return None
+            padded.append(entryId)
+        numEntries = len(padded)
+        buffer_ = ''.join([entryId + '\0' * (size - len(entryId)) for entryId in padded])
+        tempArray = (cars.AREntryIdType * numEntries).from_buffer_copy(buffer_)
+        secondList = (cars.AREntryIdList * numEntries)()
+        for i in range(numEntries):
             secondList[i].numItems = 1
             secondList[i].entryIdList = pointer(tempArray[i])
-            
-        return cars.AREntryIdListList(len(entryIdArray), secondList)
+        return cars.AREntryIdListList(numEntries, secondList)
 
     def conv2EntryListFieldList(self, fieldList, schema):
         '''conv2EntryListFieldList: take a tuple/array/list of 
@@ -345,8 +952,10 @@ take the information from the schema...'''
     def conv2FieldValueList(self, schema, fieldList):
         '''conv2FieldValueList: take a dict or a tuple/array/list of (fieldId, value)
 and return an ARFieldValueList
-the schema used to be necessary as this function tried to get
-more detailed information about the fields.
+the schema is used to look up the data types of the fields (see 
+_getEncodePlan), so that e.g. integers for enum, time or decimal fields are
+sent with the correct data type; if schema is None, the data types are
+derived from the values.
 Special case attachment: (fieldId, (name, origSize, compSize, filename))
              *please note* only filenames currently supported, no buffers!
 Special case coords: (fieldid, (numItems, x1, y1, x2, y2...))'''
@@ -354,19 +963,14 @@ Special case coords: (fieldid, (numItems, x1, y1, x2, y2...))'''
             return fieldList
         if fieldList is None:
             return None
+        if isinstance(fieldList, dict):
+            fieldList = fieldList.items()
         # create a temporary array that we will assign to the fieldvaluelist
         # afterwards....
         tempArray = (cars.ARFieldValueStruct * len(fieldList))()
-        if isinstance(fieldList, (tuple, list)):
-            for i in range(len(fieldList)):
-                tempArray[i].fieldId = fieldList[i][0]
-                self.conv2ValueStruct(tempArray[i].value,
-                                      fieldList[i][1])
-        elif isinstance(fieldList, dict):
-            for (fieldId, i) in zip(fieldList.keys(), range(len(fieldList))):
-                tempArray[i].fieldId = fieldId
-                self.conv2ValueStruct(tempArray[i].value,
-                                      fieldList[fieldId])
+        plan = self._getEncodePlan(schema, 
+                                   tuple([field[0] for field in fieldList]))
+        _encodeFieldValues(self, tempArray, fieldList, plan)
         return cars.ARFieldValueList(len(fieldList), tempArray)
 
             # now create the correct ARValueStruct!
@@ -441,6 +1045,16 @@ and return ARInternalIdList'''
             tempArray[i][:] = names[i][:]+temp[:255-len(names[i])]
         return cars.ARNameList(len(names), tempArray)
 
+    def conv2OrQualifierStruct(self, left, right):
+        '''combine two ARQualifierStructs with OR and return the new
+ARQualifierStruct (see conv2AndQualifierStruct; left and right must not
+be None). The new struct is owned by python: never hand it to ARFree.'''
+        q = cars.ARQualifierStruct()
+        q.operation = cars.AR_COND_OP_OR
+        q.u.andor.operandLeft = pointer(left)
+        q.u.andor.operandRight = pointer(right)
+        return q
+
     def conv2PermList(self, permArray):
         '''take a list of (groupid, permission) and turn it
 into an ARPermissionList'''
@@ -453,22 +1067,44 @@ into an ARPermissionList'''
         return cars.ARPermissionList(len(permArray), tempArray)
 
     def conv2QualifierStruct(self, schema, query, displayTag=None):
-        if query is None:
-            return None
-        elif isinstance(query, cars.ARQualifierStruct):
+        '''take a query string and return the compiled ARQualifierStruct.
+Compiled qualifiers are kept in the cache (as 'qualifier', keyed by 
+(query, displayTag)), so that a query string is sent to the server for
+parsing only once; the result belongs to the cache, do not free it!
+If several threads share this session (see enableThreadSharing) and the
+cache is bounded, another thread may evict and free the qualifier at any
+time; the methods of erARS pin it while they use it (see
+_pinQualifierStruct).
+Input: schema
+       query (string; None or an ARQualifierStruct are returned unchanged)
+       (optional) displayTag (name of the view to resolve field labels, default: None)
+Output: ARQualifierStruct; raises ARError in case of failure'''
+        if query is None or isinstance(query, cars.ARQualifierStruct):
             return query
-        else:
-            q = cars.ARQualifierStruct()
-            self.errnr = self.arapi.ARLoadARQualifierStruct(byref(self.context),
-                                                   schema,
-                                                   displayTag,
-                                                   query,
-                                                   byref(q),
-                                                   byref(self.arsl))
-            if self.errnr > 1:
-                self.logger.error ('conv2QualifierStruct: LoadQualifier failed!')
-                raise ARError(self)
-            return q
+        key = (query, displayTag)
+        q = self._RetrieveObjectFromCache('qualifier', schema, key)
+        if q is None:
+            q = self._LoadQualifierStruct(schema, query, displayTag)
+            self._StoreObjectInCache('qualifier', schema, key, q)
+        return q
+
+    def _pinQualifierStruct(self, schema, query, displayTag = None):
+        '''like conv2QualifierStruct, but the qualifier is pinned in the cache:
+if another thread (see enableThreadSharing) evicts it while it is handed
+to the server, it is only freed by _unpinQualifierStruct.'''
+        if query is None or isinstance(query, cars.ARQualifierStruct):
+            return query
+        key = (query, displayTag)
+        (found, q) = self.cache.get('qualifier', schema, key, pin = True)
+        if q is None:
+            q = self._LoadQualifierStruct(schema, query, displayTag)
+            self.cache.put('qualifier', schema, key, q, pin = True)
+        return q
+
+    def _unpinQualifierStruct(self, query, q):
+        '''release the pin of _pinQualifierStruct(schema, query)'''
+        if q is not query:
+            self.cache.unpin(q)
 
     def conv2ReferenceTypeList(self, refList):
         '''take list of reference types and return an ARReferenceTypeList'''
@@ -487,6 +1123,27 @@ into an ARPermissionList'''
             self.logger.error('conv2ReferenceTypeList: received reflist: %s' % (
                                                             refList))
 
+    def conv2RelOpQualifierStruct(self, fieldId, value, 
+                                  operation = cars.AR_REL_OP_EQUAL,
+                                  dataType = None):
+        '''build the ARQualifierStruct for 'fieldId' <operation> value without
+a round trip to the server (as conv2QualifierStruct would need).
+Input: fieldId
+       value
+       (optional) operation (AR_REL_OP_*, default: AR_REL_OP_EQUAL)
+       (optional) dataType (data type of value, see conv2ValueStruct; default: None)
+Output: ARQualifierStruct; it is owned by python, never hand it to ARFree'''
+        relOp = cars.ARRelOpStruct()
+        relOp.operation = operation
+        relOp.operandLeft.tag = cars.AR_FIELD
+        relOp.operandLeft.u.fieldId = fieldId
+        relOp.operandRight.tag = cars.AR_VALUE
+        self.conv2ValueStruct(relOp.operandRight.u.value, value, dataType)
+        q = cars.ARQualifierStruct()
+        q.operation = cars.AR_COND_OP_REL_OP
+        q.u.relOp = pointer(relOp)
+        return q
+
     def conv2ServerInfoList(self, serverInfoList):
         if isinstance(serverInfoList, cars.ARServerInfoList):
             return serverInfoList
@@ -741,35 +1398,52 @@ multiple entries into a pythonic list of entryid strings.'''
         '''take an AREntryListFieldValueList (e.g. result of
 GetListEntryWithFields) and return a dictionary:
     {entryid1: {fid1: value, fid2: value...}, entryid2: ....}'''
-        return dict([self.convEntryListFieldValueStruct2List(obj.entryList[i])
+        decoder = self._getValueDecoder()
+        return dict([self.convEntryListFieldValueStruct2List(obj.entryList[i], decoder)
                     for i in range(obj.numItems)])
 
     def convEntryListFieldValueList2List(self, obj):
         '''take an AREntryListFieldValueList (e.g. result of
 GetListEntryWithFields) and return a list:
     ((entryid1, {fid1: value, fid2: value...}), (entryid2, {}),  ....)'''
-        return [self.convEntryListFieldValueStruct2List(obj.entryList[i])
+        decoder = self._getValueDecoder()
+        return [self.convEntryListFieldValueStruct2List(obj.entryList[i], decoder)
                     for i in range(obj.numItems)]
                             
+    def convEntryListFieldValueList2Columns(self, obj):
+        '''take an AREntryListFieldValueList (e.g. result of
+GetListEntryWithFields) and return the result column by column:
+    ([entryid1, entryid2, ...], {fid1: column1, fid2: column2, ...})
+Columns of integer, real, enum and time fields without NULL values are
+array.array objects (or numpy arrays, if numpy is installed), all other
+columns are lists.'''
+        builder = _ColumnBuilder(self.convValueStruct2Value, self._getValueDecoder())
+        entryIds = []
+        for i in range(obj.numItems):
+            entryIds.append(self.convEntryIdList2String(obj.entryList[i].entryId))
+            builder.addRow(obj.entryList[i].entryValues.contents)
+        return (entryIds, builder.result())
+
     def convEntryListFieldValueList2StringDict(self, obj):
         '''take an AREntryListFieldValueList (e.g. result of
 GetListEntryWithFields) and return a dictionary:
     {entryid1: {"fid1": value, "fid2": value...}, entryid2: ....} '''
-        return dict([self.convEntryListFieldValueStruct2StringList(obj.entryList[i])
+        decoder = self._getValueDecoder()
+        return dict([self.convEntryListFieldValueStruct2StringList(obj.entryList[i], decoder)
                     for i in range(obj.numItems)])
 
-    def convEntryListFieldValueStruct2List(self, obj):
+    def convEntryListFieldValueStruct2List(self, obj, decoder = None):
         '''take an AREntryListFieldValueStruct and return 
 [entryid, {fid1: value, fid2:value, ...}]'''
         return [self.convEntryIdList2String(obj.entryId), 
-                self.convFieldValueList2Dict(obj.entryValues.contents)]
+                self.convFieldValueList2Dict(obj.entryValues.contents, decoder)]
 
-    def convEntryListFieldValueStruct2StringList(self, obj):
+    def convEntryListFieldValueStruct2StringList(self, obj, decoder = None):
         '''take an AREntryListFieldValueStruct and return 
 [entryid, {"fid1": value, "fid2":value, ...}]; the dict
 can be passed to a template string.'''
         return [self.convEntryIdList2String(obj.entryId), 
-                self.convFieldValueList2StringDict(obj.entryValues.contents)]
+                self.convFieldValueList2StringDict(obj.entryValues.contents, decoder)]
                 
     def convEntryListList2EntryIdListList(self, obj):
         '''EntryListList is returned by GetListEntry, but GetMultipleEntries
@@ -820,32 +1494,50 @@ Output: ('execute query on', queryList.server,
                               eLS.listStyle)
             raise ValueError
 
-    def convFieldValueStruct2List (self, obj):
+    def convFieldValueStruct2List (self, obj, decoder = None):
         '''take an ARFieldValueStruct and return [fieldid, value]'''
-        return [obj.fieldId, self.convValueStruct2Value(obj.value)]
+        return [obj.fieldId, self.convValueStruct2Value(obj.value, decoder)]
 
-    def convFieldValueStruct2StringList (self, obj):
+    def convFieldValueStruct2StringList (self, obj, decoder = None):
         '''take an ARFieldValueStruct and return [str(fieldid), value] '''
-        return [str(obj.fieldId), self.convValueStruct2Value(obj.value)]
+        return [str(obj.fieldId), self.convValueStruct2Value(obj.value, decoder)]
         
-    def convFieldValueList2Dict (self, obj):
+    def convFieldValueList2Dict (self, obj, decoder = None):
         '''take an ARFieldValueList and returns a dictionary of
 fieldid: value for all fieldids in the list'''
-        return dict([self.convFieldValueStruct2List(obj.fieldValueList[i])
+        if decoder is None:
+            decoder = self._getValueDecoder()
+        return dict([self.convFieldValueStruct2List(obj.fieldValueList[i], decoder)
                 for i in range(obj.numItems)])
 
-    def convFieldValueList2StringDict (self, obj):
+    def convFieldValueList2StringDict (self, obj, decoder = None):
         '''take an ARFieldValueList and returns a dictionary of
 str(fieldid): value for all fieldids in the list; this is
 especially useful in combination with string formatting, then
 you can have: 'value of fieldid: %(1)s' % dict'''
-        return dict([self.convFieldValueStruct2StringList(obj.fieldValueList[i])
+        if decoder is None:
+            decoder = self._getValueDecoder()
+        return dict([self.convFieldValueStruct2StringList(obj.fieldValueList[i], decoder)
                 for i in range(obj.numItems)])
                 
+    def convFieldValueListList2Columns (self, obj, existList = None):
+        '''take an ARFieldValueListList (e.g. result of GetMultipleEntries)
+and return the values column by column: {fid1: column1, fid2: column2, ...}
+(see convEntryListFieldValueList2Columns).
+Input: obj (ARFieldValueListList)
+       (optional) existList (pythonic list of booleans; rows, that are 
+               flagged False, are skipped; default: None)'''
+        builder = _ColumnBuilder(self.convValueStruct2Value, self._getValueDecoder())
+        for i in range(obj.numItems):
+            if existList is None or existList[i]:
+                builder.addRow(obj.valueListList[i])
+        return builder.result()
+
     def convFieldValueListList2List (self, obj):
         '''take an ARFieldValueListList and returns a list of
 [{fieldid: value for all fieldids in the list}]'''
-        return [self.convFieldValueList2Dict(obj.valueListList[i])
+        decoder = self._getValueDecoder()
+        return [self.convFieldValueList2Dict(obj.valueListList[i], decoder)
                 for i in range(obj.numItems)]
 
     def convGroupInfoList2Dict(self, obj):
@@ -876,7 +1568,9 @@ you can have: 'value of fieldid: %(1)s' % dict'''
                      for i in range(obj.numItems)])
 
     def convPropList2Dict(self, obj):
-        return dict([(obj.props[i].prop, self.convValueStruct2Value(obj.props[i].value))
+        decoder = self._getValueDecoder()
+        return dict([(obj.props[i].prop, self.convValueStruct2Value(obj.props[i].value,
+                                                                    decoder))
                     for i in range (obj.numItems)])
         
     def convServerInfoList2Dict(self, serverInfoList):
@@ -896,14 +1590,25 @@ lookup fails for any value, we just return the list with the numerical values'''
             return self.convServerInfoList2List(serverInfoList)
                  
     def convServerInfoList2List(self, serverInfoList):
+        decoder = self._getValueDecoder()
         return [(serverInfoList.serverInfoList[i].operation, 
-                 self.convValueStruct2Value(serverInfoList.serverInfoList[i].value)) 
+                 self.convValueStruct2Value(serverInfoList.serverInfoList[i].value,
+                                            decoder)) 
                  for i in range(serverInfoList.numItems)]
 
     def convServerNameList2List (self, serverNameList):
         return [serverNameList.nameList[i].value
                 for i in range(serverNameList.numItems)]
         
+    def convStatusList2List(self, statusList):
+        '''takes an ARStatusList and returns the following list:
+((messageType, messageNum, messageText, appendedText), ...)'''
+        return [(statusList.statusList[i].messageType,
+                 statusList.statusList[i].messageNum,
+                 statusList.statusList[i].messageText,
+                 statusList.statusList[i].appendedText) 
+                for i in range(statusList.numItems)]
+
     def convStatusHistoryList2List(self, statHistList):
         return [self.convStatusHistoryStruct2List(statHistList.statHistList[i]) 
                  for i in range(statHistList.numItems) ]
@@ -933,40 +1638,32 @@ lookup fails for any value, we just return the list with the numerical values'''
                  userLicenseList.licenseList[i].lastAccess) 
         for i in range(userLicenseList.numItems)]
 
-    def convValueStruct2Value(self, obj):
-        # special handling for unicode
-        if self.context.localeInfo.charSet.lower() == 'utf-8':
-            if obj.dataType == cars.AR_DATA_TYPE_CHAR:
-                return obj.u.charVal.decode('utf-8')
-            elif  obj.dataType == cars.AR_DATA_TYPE_ATTACH:
-                return (obj.u.attachVal.contents.name.decode('utf-8'), 
-                        obj.u.attachVal.contents.origSize, 
-                        obj.u.attachVal.contents.compSize)
+    def convValueStruct2Value(self, obj, decoder = None):
+        '''take an ARValueStruct and return the pythonic value.
+Input: obj (ARValueStruct)
+       (optional) decoder (decoder table as returned by _getValueDecoder;
+               hand it over when converting many values in a row)
+Output: value'''
+        if decoder is None:
+            decoder = self._getValueDecoder()
         try:
-            if obj.dataType in (cars.AR_DATA_TYPE_NULL,
-                                cars.AR_DATA_TYPE_VIEW):
-                return None
-#            if obj.dataType == cars.AR_DATA_TYPE_ATTACH:
-#                return (obj.u.attachVal.contents.name, 
-#                        obj.u.attachVal.contents.origSize, 
-#                        obj.u.attachVal.contents.compSize)
-            return eval('obj.%s' % (cars.ARValueStruct._mapping_so_ [obj.dataType]))
+            return decoder[obj.dataType](obj)
         except KeyError:
-            try: 
-                return eval('%s' % (cars.ARValueStruct._mapping_co_ [obj.dataType]))
-            except KeyError:
-                raise ARError(None,
-                              'unknown ARValueStruct type: %d!' % obj.dataType,
-                              cars.AR_RETURN_ERROR)
-
-    def convValueList2List(self, obj):
-        return [self.convValueStruct2Value(obj.valueList[i])
+            raise ARError(None,
+                          'unknown ARValueStruct type: %d!' % obj.dataType,
+                          cars.AR_RETURN_ERROR)
+
+    def convValueList2List(self, obj, decoder = None):
+        if decoder is None:
+            decoder = self._getValueDecoder()
+        return [self.convValueStruct2Value(obj.valueList[i], decoder)
                 for i in range(obj.numItems)]
 
     def convValueListList2List(self, obj):
         '''a SQL command executed through ARSystem API returns a ValueListList. Per result line
 you get the values of the query. This function returns a pythonic list of lists.'''
-        return [self.convValueList2List(obj.valueListList[i])
+        decoder = self._getValueDecoder()
+        return [self.convValueList2List(obj.valueListList[i], decoder)
                 for i in range(obj.numItems)]
 
     def CreateActiveLink (self, 
@@ -1111,6 +1808,37 @@ Output: /'''
                                         type_,references,removeFlag,helpText,
                                         owner,changeDiary,objPropList)
 
+    def CreateEntries(self, schema, rows, batchSize = 100):
+        '''CreateEntries creates many new entries in the indicated schema.
+
+The rows are converted one after the other into the same ARFieldValueList.
+Before 6.3 every entry is created with its own call of ARCreateEntry;
+from 6.3 on, the rows are sent in bulk entry transactions of batchSize entries.
+Input: schema
+       rows (iterable of dictionaries {fieldid: value} or lists of (fieldid, value))
+       (optional) batchSize (number of entries per bulk transaction; default: 100)
+Output: (entryIds, errors): list of the new entry ids in the order of rows
+        (None for the rows that could not be created) and a dictionary
+        {index of row: status text} for those rows'''
+        self.errnr = 0
+        buffer_ = _FieldValueBuffer(self, schema = schema)
+        entryIds = []
+        errors = {}
+        for row in rows:
+            try:
+                entryId = self.ARCreateEntry(schema, buffer_.fill(row))
+            except Exception:
+                # the row cannot be converted
+                errors[len(entryIds)] = 'Status: %s' % (sys.exc_info()[1])
+                entryIds.append(None)
+                continue
+            if self.errnr > 1:
+                errors[len(entryIds)] = self.statusText()
+                entryId = None
+            entryIds.append(entryId)
+        self.errnr = errors and 2 or 0
+        return (entryIds, errors)
+
     def CreateEntry(self, schema, fieldList):
         '''CreateEntry creates a new entry in the indicated schema.
 
@@ -1572,6 +2300,97 @@ Output: currencyRatio'''
     def GetCurrentServer (self):
         return self.ARGetCurrentServer()
     
+    def GetEntries(self, schema, entryIds, idList = None, chunkSize = 100,
+                   workers = 1, pool = None):
+        '''GetEntries retrieves many entries by their entry ids.
+
+The ids are sent in chunks of chunkSize ids per call of GetMultipleEntries
+(the server limits the number of entries per call), either over this 
+session or over workers sessions in parallel (taken from pool, or logged 
+in with the parameters of this session).
+Input: schema
+       entryIds (list of entry ids; for join forms, see conv2EntryIdListList)
+       (optional) idList (list of fieldIds, default: None = all fields)
+       (optional) chunkSize (number of entry ids per call, default: 100)
+       (optional) workers (number of parallel sessions, default: 1 = this session)
+       (optional) pool (SessionPool to take the sessions from, default: None)
+Output: OrderedDict {entryId: {fieldid: value} or None if the entry does not
+    exist} in the order of entryIds; raises ARError in case of failure'''
+        keys = []
+        for entryId in entryIds:
+            if isinstance(entryId, list):
+                entryId = tuple(entryId)
+            keys.append(entryId)
+        # every id is retrieved only once
+        unique = list(OrderedDict.fromkeys(keys))
+        chunks = [unique[start:start + chunkSize] 
+                  for start in range(0, len(unique), chunkSize)]
+        arIdList = self.conv2InternalIdList(idList)
+        results = {}
+        if (workers <= 1 and pool is None) or len(chunks) <= 1:
+            for chunk in chunks:
+                results.update(self._GetEntryChunk(schema, chunk, arIdList))
+        else:
+            self._GetEntryChunksParallel(schema, chunks, arIdList, results,
+                                         workers, pool)
+        return OrderedDict([(key, results[key]) for key in keys])
+
+    def _GetEntryChunksParallel(self, schema, chunks, idList, results,
+                                workers, pool):
+        '''retrieve chunks with several sessions and store the entries 
+in results; raises the first ARError of the workers'''
+        chunkQueue = queue.Queue()
+        for chunk in chunks:
+            chunkQueue.put(chunk)
+        lock = threading.Lock()
+        failures = []
+
+        def work():
+            try:
+                session = pool.acquire()
+            except Exception:
+                failures.append(sys.exc_info()[1])
+                return
+            try:
+                while not failures:
+                    try:
+                        chunk = chunkQueue.get_nowait()
+                    except queue.Empty:
+                        break
+                    entries = session._GetEntryChunk(schema, chunk, idList)
+                    lock.acquire()
+                    try:
+                        results.update(entries)
+                    finally:
+                        lock.release()
+            except Exception:
+                failures.append(sys.exc_info()[1])
+            finally:
+                pool.release(session)
+
+        ownPool = pool is None
+        if ownPool:
+            (server, user, password, language, authString, tcpport, rpcnumber) = self._loginParameters
+            pool = SessionPool(server, user, password, language, authString, 
+                               tcpport, rpcnumber,
+                               maxSessions = workers,
+                               sessionClass = self.__class__)
+        threads = []
+        try:
+            for i in range(min(workers, pool.maxSessions, len(chunks))):
+                thread = threading.Thread(target = work,
+                                          name = 'GetEntries(%s)' % schema)
+                thread.setDaemon(True)
+                thread.start()
+                threads.append(thread)
+        finally:
+            for thread in threads:
+                thread.join()
+            if ownPool:
+                pool.close()
+        if failures:
+            raise failures[0]
+
     def GetEntry(self, schemaString, entry, idList = None):
         '''GetEntry retrieves the form entry with the indicated ID.
 
@@ -1622,10 +2441,13 @@ Input: schema
        groupByList
 Output: results'''
         self.errnr = 0
-        q = self.conv2QualifierStruct(schema, query)
         groupbylist = self.conv2InternalIdList(groupByList)
-        return self.ARGetEntryStatistics(schema, q, target, 
-                            statistic, groupbylist)
+        q = self._pinQualifierStruct(schema, query)
+        try:
+            return self.ARGetEntryStatistics(schema, q, target, 
+                                statistic, groupbylist)
+        finally:
+            self._unpinQualifierStruct(query, q)
 
     def GetEscalation(self, name):
         '''GetEscalation
@@ -1769,7 +2591,6 @@ Output: (list ((entryid , shortdesc) , ...), numMatches) or raise ARError in cas
 It is important that the query looks something like this:
 'field' = "value" (please note the quotation marks).'''
         self.errnr = 0
-        q = self.conv2QualifierStruct(schema, query)
         arGetListFields = self.conv2EntryListFieldList(getListFields, schema)
         if self.errnr > 1:
             self.logger.error('GetListEntry: converting getListFields failed!')
@@ -1778,12 +2599,16 @@ It is important that the query looks something like this:
         if self.errnr > 1:
             self.logger.error('GetListEntry: converting sort list failed!')
             raise ARError(None, 'GetListEntry: converting sort list failed!', cars.AR_RETURN_ERROR)
-        result = self.ARGetListEntry(schema, 
-                                       q,
-                                       arGetListFields,
-                                       arSortList,
-                                       firstRetrieve,
-                                       maxRetrieve)
+        q = self._pinQualifierStruct(schema, query)
+        try:
+            result = self.ARGetListEntry(schema, 
+                                           q,
+                                           arGetListFields,
+                                           arSortList,
+                                           firstRetrieve,
+                                           maxRetrieve)
+        finally:
+            self._unpinQualifierStruct(query, q)
         if result is None:
             raise ARError(self)
         else:
@@ -1797,7 +2622,8 @@ It is important that the query looks something like this:
                                 getListFields=None, 
                                 sortList=None,
                                 firstRetrieve=cars.AR_START_WITH_FIRST_ENTRY,
-                                maxRetrieve=cars.AR_NO_MAX_LIST_RETRIEVE):
+                                maxRetrieve=cars.AR_NO_MAX_LIST_RETRIEVE,
+                                columnar = False):
         '''GetListEntryWithFields retrieve a list of entries for a schema.
 
 GetListEntryWithFields retrieve a list of entries/objects for a
@@ -1811,10 +2637,12 @@ Input: schema/form name
        (optional) sortList (default: None)
        (optional) firstRetrieve (default: AR_START_WITH_FIRST_ENTRY)
        (optional) maxRetrieve (default: AR_NO_MAX_LIST_RETRIEVE)
+       (optional) columnar (default: False; if True, the result is returned
+                column by column, see convEntryListFieldValueList2Columns)
 Output: (list ((entryid , { fid1 : value1, ...}), ()....), numMatches) or raise ARError
-    in case of failure'''
+    in case of failure; in columnar mode:
+    (([entryid1, ...], {fid1: column1, ...}), numMatches)'''
         self.errnr = 0
-        q = self.conv2QualifierStruct(schema, query)
         arGetListFields = self.conv2EntryListFieldList(getListFields, schema)
         if self.errnr > 1:
             self.logger.error('GetListEntryWithFields: converting getListFields failed!')
@@ -1823,17 +2651,24 @@ Output: (list ((entryid , { fid1 : value1, ...}), ()....), numMatches) or raise
         if self.errnr > 1:
             self.logger.error('GetListEntryWithFields: converting sort list failed!')
             raise ARError(None, 'GetListEntry: converting sort list failed!', cars.AR_RETURN_ERROR)
-        result = self.ARGetListEntryWithFields(schema, 
-                                             q,
-                                             arGetListFields,
-                                             arSortList,
-                                             firstRetrieve,
-                                             maxRetrieve)
+        q = self._pinQualifierStruct(schema, query)
+        try:
+            result = self.ARGetListEntryWithFields(schema, 
+                                                 q,
+                                                 arGetListFields,
+                                                 arSortList,
+                                                 firstRetrieve,
+                                                 maxRetrieve)
+        finally:
+            self._unpinQualifierStruct(query, q)
         if result is None:
             raise ARError(self)
         else:
             (entryListFieldValueList, numMatches) = result
-            pythonicResult = self.convEntryListFieldValueList2List(entryListFieldValueList)
+            if columnar:
+                pythonicResult = self.convEntryListFieldValueList2Columns(entryListFieldValueList)
+            else:
+                pythonicResult = self.convEntryListFieldValueList2List(entryListFieldValueList)
             self.Free(entryListFieldValueList)
             return (pythonicResult, numMatches)
     
@@ -2134,7 +2969,8 @@ Output: currencyRatioSets
 
     def GetMultipleEntries(self, schema, 
                            entryIdArray, 
-                           idList=None):
+                           idList=None,
+                           columnar = False):
         '''GetMultipleEntries retrieve a list of entries.
 
 GetMultipleEntries retrieve a list of entries/objects for a
@@ -2147,7 +2983,10 @@ Input: schema/form name
            by ARGetListEntry) or an AREntryIdListList (as required by ARGetMultipleEntries)
        (optional) idList: an array of zero or more field IDs  to be retrieved, this can either
            be a pythonic array of fieldIds or an ARInternalIdList       
-Output: (ARBooleanList, ARFieldValueListList)'''
+       (optional) columnar (default: False; if True, the entries are returned
+           column by column, see convFieldValueListList2Columns)
+Output: (ARBooleanList, ARFieldValueListList); in columnar mode:
+        ([entryid1, ...], {fid1: column1, ...}) for the entries that exist'''
         if isinstance(entryIdArray, cars.AREntryIdListList):
             entryIdList = entryIdArray
         elif isinstance(entryIdArray, cars.AREntryListList):
@@ -2158,7 +2997,17 @@ Output: (ARBooleanList, ARFieldValueListList)'''
         result = self.ARGetMultipleEntries(schema, entryIdList, arIdList)
         if self.errnr > 1:
             raise ARError(self)
-        return result
+        if not columnar:
+            return result
+        (existList, fieldValueListList) = result
+        exists = self.convBooleanList2List(existList)
+        # as the ids of the server (e.g. 'id1|id2' for join forms)
+        entryIds = self.convEntryIdListList2List(entryIdList)
+        pythonicResult = ([entryIds[i] for i in range(len(exists)) if exists[i]],
+                          self.convFieldValueListList2Columns(fieldValueListList, exists))
+        self.Free(existList)
+        self.Free(fieldValueListList)
+        return pythonicResult
 
     def GetMultipleExtFieldCandidates(self, schema):
         '''GetMultipleExtFieldCandidates
@@ -2442,12 +3291,186 @@ Output: ARQualifierStruct'''
                cacheId = 0,
                operationTime = 0,
                sessionId = 0):
+        # remember how we logged in, to log in more sessions (see MergeEntries)
+        self._loginParameters = (server, username, password, language, 
+                                 authString, tcpport, rpcnumber)
         ars.ARS.Login(self, server, username, password, language, 
                authString, tcpport, rpcnumber, cacheId,
                operationTime, sessionId)
         if self.errnr < 2:
             self._InitializeCache()
             
+    def MergeEntries(self, schema, rows,
+                     mergeType = cars.AR_MERGE_ENTRY_DUP_ERROR,
+                     workers = 4,
+                     batchSize = 100,
+                     keyFields = (1, ),
+                     pool = None,
+                     queueSize = None,
+                     callback = None):
+        '''MergeEntries merges many entries into the indicated form, using
+several sessions in parallel.
+
+The rows are distributed over workers threads, each with its own session
+(the sessions of pool that are free, or logged in with the parameters of
+this session; if no session is free, the rows are merged on this session);
+rows with the same values in keyFields always go to the same worker, so
+that they are merged in the order of rows. Every worker sends its rows in bulk
+entry transactions of batchSize rows (from 6.3 on; older servers get one
+ARMergeEntry call per row). The queue of every worker holds at most
+queueSize rows: if the workers cannot keep up, reading rows blocks, so
+that memory stays flat for huge inputs.
+Input: schema
+       rows (iterable of dictionaries {fieldid: value} or lists of (fieldid, value))
+       (optional) mergeType (default: cars.AR_MERGE_ENTRY_DUP_ERROR)
+       (optional) workers (number of parallel sessions, default: 4)
+       (optional) batchSize (number of rows per bulk transaction, default: 100)
+       (optional) keyFields (fieldids that identify an entry, default: (1, );
+                  rows without any of these fields are distributed round robin)
+       (optional) pool (SessionPool to take the sessions from, default: None;
+                  this session may be one of the pool)
+       (optional) queueSize (default: None = 2 * batchSize)
+       (optional) callback (function(index, entryId, error) that is called for
+                  every row; if given, the outcomes are not collected)
+Output: (entryIds, errors, statistics): list of entry ids in the order of rows
+        (None for the rows that failed), a dictionary {index of row: status text}
+        for the failed rows (both None if a callback is given) and a
+        dictionary with the keys rows, errors, seconds and rowsPerSecond'''
+        start = time.time()
+        if queueSize is None:
+            queueSize = 2 * batchSize
+        lock = threading.Lock()
+        entryIds = []
+        errors = {}
+        counters = {'errors' : 0}
+        def report(index, entryId, error):
+            lock.acquire()
+            try:
+                if error is not None:
+                    counters['errors'] += 1
+                if callback is not None:
+                    callback(index, entryId, error)
+                else:
+                    entryIds[index] = entryId
+                    if error is not None:
+                        errors[index] = error
+            finally:
+                lock.release()
+
+        def work(session, rowQueue):
+            buffer_ = _FieldValueBuffer(session, schema = schema)
+            def queueCall(row):
+                session.ARMergeEntry(schema, buffer_.fill(row), mergeType)
+            finished = False
+            while not finished:
+                item = rowQueue.get()
+                if item is None:
+                    break
+                batch = [item]
+                while len(batch) < batchSize:
+                    try:
+                        item = rowQueue.get(True, 0.05)
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        finished = True
+                        break
+                    batch.append(item)
+                try:
+                    if hasattr(session, '_SendBulkEntries'):
+                        session._SendBulkEntries(batch, queueCall, 'mergeEntryReturn', report)
+                    else:
+                        for (index, row) in batch:
+                            try:
+                                entryId = session.ARMergeEntry(schema, buffer_.fill(row), mergeType)
+                            except Exception:
+                                # the row cannot be converted
+                                report(index, None, 'Status: %s' % (sys.exc_info()[1]))
+                                continue
+                            if session.errnr > 1:
+                                report(index, None, session.statusText())
+                            else:
+                                report(index, entryId, None)
+                except Exception:
+                    # report the rows of this batch and carry on, otherwise
+                    # reading the rows would block forever
+                    error = str(sys.exc_info()[1])
+                    for (index, row) in batch:
+                        report(index, None, error)
+
+        ownPool = pool is None and workers > 1
+        if ownPool:
+            (server, user, password, language, authString, tcpport, rpcnumber) = self._loginParameters
+            pool = SessionPool(server, user, password, language, authString, 
+                               tcpport, rpcnumber,
+                               maxSessions = workers,
+                               sessionClass = self.__class__)
+        sessions = []
+        threads = []
+        queues = []
+        numRows = 0
+        try:
+            if pool is not None:
+                # never wait for a session, as the caller might hold one
+                # of the pool itself
+                while len(sessions) < workers:
+                    try:
+                        sessions.append(pool.acquire(block = False))
+                    except ARError:
+                        self.logger.info('MergeEntries: only %d of %d sessions available' % (
+                                         len(sessions), workers))
+                        break
+            if not sessions:
+                sessions.append(self)
+            for session in sessions:
+                rowQueue = queue.Queue(queueSize)
+                thread = threading.Thread(target = work, args = (session, rowQueue),
+                                          name = 'MergeEntries(%s)' % schema)
+                thread.setDaemon(True)
+                thread.start()
+                queues.append(rowQueue)
+                threads.append(thread)
+            for row in rows:
+                if isinstance(row, dict):
+                    key = tuple([row.get(fieldId) for fieldId in keyFields])
+                else:
+                    values = dict(row)
+                    key = tuple([values.get(fieldId) for fieldId in keyFields])
+                if key.count(None) == len(key):
+                    worker = numRows % len(queues)
+                else:
+                    try:
+                        worker = hash(key) % len(queues)
+                    except TypeError: # e.g. a list as value
+                        worker = hash(repr(key)) % len(queues)
+                if callback is None:
+                    lock.acquire()
+                    entryIds.append(None)
+                    lock.release()
+                queues[worker].put((numRows, row))
+                numRows += 1
+        finally:
+            for rowQueue in queues:
+                rowQueue.put(None)
+            for thread in threads:
+                thread.join()
+            if pool is not None:
+                for session in sessions:
+                    if session is not self:
+                        pool.release(session)
+                if ownPool:
+                    pool.close()
+        seconds = time.time() - start
+        statistics = {'rows': numRows,
+                      'errors': counters['errors'],
+                      'seconds': seconds,
+                      'rowsPerSecond': seconds and numRows / seconds or 0.0}
+        self.logger.debug('MergeEntries: %(rows)d rows, %(errors)d errors, %(rowsPerSecond).1f rows/sec' % (
+                          statistics))
+        if callback is not None:
+            return (None, None, statistics)
+        return (entryIds, errors, statistics)
+
     def MergeEntry(self, schema,
                    fieldList,
                    mergeType = cars.AR_MERGE_ENTRY_DUP_ERROR):
@@ -2614,6 +3637,65 @@ Output: errnr'''
                        changeDiary,
                        objPropList)
 
+    def SetEntriesIfChanged(self, schema, 
+                            entries, 
+                            snapshots = None, 
+                            option = None,
+                            chunkSize = 100):
+        '''SetEntriesIfChanged updates many entries, but only sends those
+fields whose values differ from the current values of the entry; entries
+without changes are not touched at all (so no filters fire for them).
+The current values are taken from snapshots; entries that are not in 
+snapshots are retrieved with GetMultipleEntries (chunkSize entries per call).
+The Modified Date (field 6) of the snapshot is handed over as getTime,
+so an entry that has been changed by somebody else since the snapshot
+was taken is not overwritten (the server returns an error instead).
+Input:  schema
+        entries: dictionary {entryId: fieldList} or list of (entryId, fieldList),
+            fieldList as for SetEntry
+        (optional) snapshots: dictionary {entryId: {fieldid: value}} with the 
+            current values (should contain field 6; default: None)
+        (optional) option (for join forms only, see SetEntry)
+        (optional) chunkSize (default: 100)
+Output: (changed, errors): dictionary {entryId: [fieldid, ...]} of the fields
+        that have been sent per updated entry and dictionary {entryId: status text}
+        for the entries that could not be updated'''
+        if isinstance(entries, dict):
+            entries = entries.items()
+        if snapshots is None:
+            snapshots = {}
+        missing = [entryId for (entryId, fieldList) in entries 
+                   if entryId not in snapshots]
+        if missing:
+            fieldIds = set([6])
+            for (entryId, fieldList) in entries:
+                if entryId not in snapshots:
+                    if isinstance(fieldList, dict):
+                        fieldIds.update(fieldList.keys())
+                    else:
+                        fieldIds.update([fieldId for (fieldId, value) in fieldList])
+            snapshots = dict(snapshots)
+            snapshots.update(self._GetEntrySnapshots(schema, missing, 
+                                                     sorted(fieldIds), chunkSize))
+        changed = {}
+        errors = {}
+        for (entryId, fieldList) in entries:
+            snapshot = snapshots.get(entryId)
+            if snapshot is None:
+                errors[entryId] = 'SetEntriesIfChanged: entry does not exist'
+                continue
+            delta = self._diffFieldValues(fieldList, snapshot)
+            if not delta:
+                continue
+            try:
+                self.SetEntry(schema, entryId, delta, snapshot.get(6) or 0, option)
+                changed[entryId] = [fieldId for (fieldId, value) in delta]
+            except Exception:
+                # not the status list: the error might come from a conversion
+                errors[entryId] = str(sys.exc_info()[1])
+        self.errnr = errors and 2 or 0
+        return (changed, errors)
+
     def SetEntry(self, schema, 
                  entryId, 
                  fieldList, 
@@ -2643,6 +3725,36 @@ Output: errnr or raise ARError in case of failure'''
             raise ARError(self)
         return result
 
+    def SetEntryIfChanged(self, schema, 
+                          entryId, 
+                          fieldList, 
+                          snapshot = None, 
+                          option = None):
+        '''SetEntryIfChanged updates the entry, but only sends those fields
+whose values differ from the current values (see SetEntriesIfChanged); if
+nothing has changed, the entry is not touched.
+Input:  schema
+        entryId
+        fieldList: a dict or a list of tuples: ((fieldid, value), (fieldid, value), ...)
+        (optional) snapshot: dictionary {fieldid: value} with the current values
+            (should contain field 6; default: None: retrieve them from the server)
+        (optional) option (for join forms only, see SetEntry)
+Output: list of the fieldids that have been sent (empty if nothing has
+    changed) or raise ARError in case of failure'''
+        if snapshot is None:
+            if isinstance(fieldList, dict):
+                fieldIds = fieldList.keys()
+            else:
+                fieldIds = [fieldId for (fieldId, value) in fieldList]
+            snapshot = self._GetEntrySnapshots(schema, [entryId], 
+                                               sorted(set(fieldIds) | set([6])))[entryId]
+            if snapshot is None:
+                raise ARError(None, 'SetEntryIfChanged: entry does not exist!', cars.AR_RETURN_ERROR)
+        delta = self._diffFieldValues(fieldList, snapshot)
+        if delta:
+            self.SetEntry(schema, entryId, delta, snapshot.get(6) or 0, option)
+        return [fieldId for (fieldId, value) in delta]
+
     def SetEscalation(self, name, 
                         newName = None,
                         escalationTm = None, 
@@ -3167,29 +4279,10 @@ input: schema
         (optional) idList (default: None; can be an ARInternalIdList or a tuple of fieldids)
         fieldType: (default: data fields)
 output: dictionary {fieldid1: name1, fieldid2: name2,...} or None in case of failure'''
-        # if not given, retrieve all field ids for this table
         if idList is None:
-            idList = self.ARGetListField(schema, fieldType=fieldType)
-            if self.errnr > 1:
-                raise ARError(self)
-        idList = self.conv2InternalIdList(idList)
-        existList = cars.ARBooleanList()
-        fieldId2  = cars.ARInternalIdList()
-        fieldName = cars.ARNameList()
-        fieldInfos = self.ARGetMultipleFields(schema,
-                                              idList,
-                                              None,
-                                              fieldName)
-        
-        if self.errnr > 1:
-            self.logger.error('GetMultipleFields failed!')
-            raise ARError(self)
-        fieldNames = dict([(fieldInfos.fieldList[i].fieldId, fieldInfos.fieldList[i].fieldName) 
-                           for i in range(fieldInfos.numItems)])
-        self.Free(existList)
-        self.Free(fieldId2)
-        self.Free(fieldName)
-        return fieldNames
+            return dict(self._getFieldIndex(schema, fieldType).names)
+        fields = self._getFieldSnapshot(schema, idList, fieldType)
+        return dict([(field[0], field[1]) for field in fields])
 
     def GetControlStructFields(self):
         '''GetControlStructFields returns the single pieces of the control record.
@@ -3206,16 +4299,13 @@ Output: (cacheId, errnr, operationTime, user, password, localeInfo, ,
     def GetFieldByName(self, schemaString, fieldName):
         '''GetFieldByName is a shortcut function that combines ars_GetListField 
 and ars_GetField. Given a schema name and field name, it returns the field id. 
-If you need more than a few field id's, use GetFieldTable. 
+The name/id index of all fields of the schema is retrieved with one call
+and kept in the cache, so looking up many names costs only one round trip
+(see also PreloadFieldIndex).
 Input: schemaString
        fieldName
 Output: fieldid or None in case of failure'''
-        fields = self.GetFieldTable(schemaString, 
-                                    fieldType=cars.AR_FIELD_TYPE_ALL)
-        try:
-            return fields[fieldName]
-        except KeyError:
-            return None
+        return self._getFieldIndex(schemaString).ids.get(fieldName)
     
     def GetFieldTable (self, schemaString, idList=None, 
                        fieldType=cars.AR_FIELD_TYPE_DATA):
@@ -3231,26 +4321,572 @@ Input: schemaString
        (optional) idList (default: None; can be an ARInternalIdList or a tuple of fieldids)
        (optional) fieldType (default: cars.AR_FIELD_TYPE_DATA)
 Output: dictionary of {field_name : field_id, ...} or None in case of failure"""
-        # if not given, retrieve all field ids for this table
-
         if idList is None:
-            idList = self.ARGetListField(schemaString, fieldType=fieldType)
-            if self.errnr > 1:
+            return dict(self._getFieldIndex(schemaString, fieldType).ids)
+        fields = self._getFieldSnapshot(schemaString, idList, fieldType)
+        return dict([(field[1], field[0]) for field in fields])
+
+    def IterListEntryWithFields(self, schema, 
+                                query = None,
+                                getListFields = None,
+                                sortList = None,
+                                pageSize = 1000,
+                                prefetch = True,
+                                keyField = None):
+        '''IterListEntryWithFields walks through all entries of a schema
+matching the query, page by page.
+
+In contrast to GetListEntryWithFields, not the complete result is loaded
+at once: the entries are fetched in pages of pageSize entries (using 
+firstRetrieve/maxRetrieve), so that memory stays flat no matter how many
+entries match, and the server's limit of entries per call does not truncate
+the result. Every page is converted and its AREntryListFieldValueList freed
+before the next one is retrieved.
+With prefetch, the next page is retrieved and converted on a worker thread
+while the caller handles the current one. While iterating, do not use this
+session for other calls, as the worker thread is using it!
+Paging with firstRetrieve makes the server run the query again and skip
+all entries of the previous pages, so deep pages get slower and slower.
+If you hand over a keyField, keyset pagination is used instead: the
+entries are sorted by this field (and by field 1, to break ties) and every
+page continues after the last entry seen:
+'keyField' > lastKey OR ('keyField' = lastKey AND '1' > lastRequestId).
+(On join forms, field 1 only holds the id of the first member form and is
+not unique; entries with the same key and field 1 are skipped with a small
+offset instead.) The key field should be indexed and must not contain NULL
+values.
+Input: schema/form name
+       (optional) query string or ARQualifierStruct (default: None)
+       (optional) getListFields: list of fieldids (fid1, fid2, ...) (default: None)
+       (optional) sortList (default: None, which sorts by request id, as a stable
+                  sort order is necessary for paging; ignored for keyset pagination)
+       (optional) pageSize (default: 1000)
+       (optional) prefetch (default: True)
+       (optional) keyField (default: None; fieldid for keyset pagination, e.g. 1;
+                  for fields other than 1 getListFields must be given and
+                  will be extended by keyField)
+Output: generator of (entryid , { fid1 : value1, ...}); raises ARError
+    in case of failure'''
+        self.errnr = 0
+        if keyField is not None:
+            keyField = int(keyField)
+            sortList = ((keyField, cars.AR_SORT_ASCENDING), )
+            if keyField != 1:
+                sortList += ((1, cars.AR_SORT_ASCENDING), )
+                if not getListFields:
+                    raise ARError(None, 'IterListEntryWithFields: keyset pagination on field %d needs getListFields!' % (
+                                        keyField), cars.AR_RETURN_ERROR)
+                fieldIds = [isinstance(field, (tuple, list)) and int(field[0]) or int(field)
+                            for field in getListFields]
+                if keyField not in fieldIds:
+                    getListFields = list(getListFields) + [keyField]
+        # the qualifier is used for a long time: do not share it with the cache
+        q = self._LoadQualifierStruct(schema, query)
+        arGetListFields = self.conv2EntryListFieldList(getListFields, schema)
+        if self.errnr > 1:
+            self.logger.error('IterListEntryWithFields: converting getListFields failed!')
+            raise ARError(None, 'IterListEntryWithFields: converting getListFields failed!', cars.AR_RETURN_ERROR)
+        if sortList is None:
+            sortList = ((1, cars.AR_SORT_ASCENDING), )
+        arSortList = self.conv2SortList (sortList)
+        if self.errnr > 1:
+            self.logger.error('IterListEntryWithFields: converting sort list failed!')
+            raise ARError(None, 'IterListEntryWithFields: converting sort list failed!', cars.AR_RETURN_ERROR)
+
+        def fetchPage(qualifier, firstRetrieve):
+            '''retrieve and convert one page: (list of entries, numMatches)'''
+            result = self.ARGetListEntryWithFields(schema, 
+                                                   qualifier,
+                                                   arGetListFields,
+                                                   arSortList,
+                                                   firstRetrieve,
+                                                   pageSize)
+            if result is None:
                 raise ARError(self)
-        idList = self.conv2InternalIdList(idList)
-        existList = cars.ARBooleanList()
-        fieldName = cars.ARNameList()
-        fieldInfos = self.ARGetMultipleFields(schemaString,
-                                              idList,
-                                              None,
-                                              fieldName)
+            (entryListFieldValueList, numMatches) = result
+            try:
+                page = self.convEntryListFieldValueList2List(entryListFieldValueList)
+            finally:
+                self.Free(entryListFieldValueList)
+            return (page, numMatches)
+
+        def fetchPages():
+            '''generate (list of entries, isLastPage)'''
+            firstRetrieve = cars.AR_START_WITH_FIRST_ENTRY
+            while True:
+                (page, numMatches) = fetchPage(q, firstRetrieve)
+                firstRetrieve += len(page)
+                last = len(page) == 0 or firstRetrieve >= numMatches
+                yield (page, last)
+                if last:
+                    return
+
+        def fetchKeysetPages():
+            '''generate (list of entries, isLastPage) with keyset pagination'''
+            if keyField != 1:
+                keyDataType = self._getFieldIndex(schema).dataTypes.get(keyField)
+            # the position of an entry in the sort order: (requestId, ) or
+            # (key, requestId)
+            lastPosition = None
+            # entries at lastPosition that have been handed out already;
+            # only needed on join forms, where the position is not unique
+            seen = set()
+            while True:
+                if lastPosition is None:
+                    (page, numMatches) = fetchPage(q, cars.AR_START_WITH_FIRST_ENTRY)
+                    firstRetrieve = 0
+                else:
+                    if seen:
+                        operation = cars.AR_REL_OP_GREATER_EQUAL
+                        firstRetrieve = len(seen)
+                    else:
+                        operation = cars.AR_REL_OP_GREATER
+                        firstRetrieve = 0
+                    seekQualifier = self.conv2RelOpQualifierStruct(1, lastPosition[-1],
+                                                                   operation,
+                                                                   cars.AR_DATA_TYPE_CHAR)
+                    if keyField != 1:
+                        # 'keyField' > lastKey OR ('keyField' = lastKey AND '1' > lastRequestId)
+                        seekQualifier = self.conv2OrQualifierStruct(
+                            self.conv2RelOpQualifierStruct(keyField, lastPosition[0],
+                                                           cars.AR_REL_OP_GREATER,
+                                                           keyDataType),
+                            self.conv2AndQualifierStruct(
+                                self.conv2RelOpQualifierStruct(keyField, lastPosition[0],
+                                                               cars.AR_REL_OP_EQUAL,
+                                                               keyDataType),
+                                seekQualifier))
+                    (page, numMatches) = fetchPage(self.conv2AndQualifierStruct(q, seekQualifier),
+                                                   firstRetrieve)
+                last = len(page) == 0 or firstRetrieve + len(page) >= numMatches
+                newEntries = []
+                for entry in page:
+                    # for join forms, the entry id consists of the ids of the
+                    # member forms; field 1 of the join refers to the first one
+                    requestId = entry[0].split('|')[0]
+                    if keyField == 1:
+                        position = (requestId, )
+                    else:
+                        position = (entry[1][keyField], requestId)
+                    if position != lastPosition:
+                        lastPosition = position
+                        seen = set()
+                    elif entry[0] in seen:
+                        continue
+                    if requestId != entry[0]:
+                        seen.add(entry[0])
+                    newEntries.append(entry)
+                if not newEntries and not last:
+                    raise ARError(None, 'IterListEntryWithFields: keyset pagination on field %d does not make progress!' % (
+                                        keyField), cars.AR_RETURN_ERROR)
+                yield (newEntries, last)
+                if last:
+                    return
+
+        if keyField is not None:
+            fetchPages = fetchKeysetPages
+
+        try:
+            if not prefetch:
+                for (page, last) in fetchPages():
+                    for entry in page:
+                        yield entry
+                return
+
+            # the worker hands over one page at a time; as the queue can
+            # only hold one page, at most three pages are in memory
+            pages = queue.Queue(1)
+            stop = threading.Event()
+            def worker():
+                try:
+                    for (page, last) in fetchPages():
+                        pages.put((page, last, None))
+                        if stop.isSet():
+                            return
+                except Exception:
+                    # with the traceback of the worker
+                    pages.put((None, True, sys.exc_info()))
+            thread = threading.Thread(target=worker,
+                                      name='IterListEntryWithFields(%s)' % schema)
+            thread.setDaemon(True)
+            thread.start()
+            try:
+                while True:
+                    (page, last, excInfo) = pages.get()
+                    if excInfo is not None:
+                        raise excInfo[0], excInfo[1], excInfo[2]
+                    for entry in page:
+                        yield entry
+                    if last:
+                        break
+            finally:
+                # the caller might have stopped early: let the worker finish
+                # the page it is working on and make sure it can hand it over
+                stop.set()
+                while thread.isAlive():
+                    try:
+                        pages.get(True, 0.1)
+                    except queue.Empty:
+                        pass
+                thread.join()
+        finally:
+            if q is not query:
+                self.Free(q)
+
+    # data types of the fields that ScanListEntryWithFields can partition
+    # by (besides field 1); decimal fields are split with real values
+    _scanDataTypes = {cars.AR_DATA_TYPE_INTEGER: cars.AR_DATA_TYPE_INTEGER,
+                      cars.AR_DATA_TYPE_TIME: cars.AR_DATA_TYPE_TIME,
+                      cars.AR_DATA_TYPE_DATE: cars.AR_DATA_TYPE_DATE,
+                      cars.AR_DATA_TYPE_ULONG: cars.AR_DATA_TYPE_ULONG,
+                      cars.AR_DATA_TYPE_REAL: cars.AR_DATA_TYPE_REAL,
+                      cars.AR_DATA_TYPE_DECIMAL: cars.AR_DATA_TYPE_REAL}
+
+    def _getStatistic(self, schema, qualifier, fieldId, statistic):
+        '''return one statistic (AR_STAT_OP_*) of the entries matching 
+qualifier; fieldId is the target (None for AR_STAT_OP_COUNT)'''
+        target = None
+        if fieldId is not None:
+            target = cars.ARFieldValueOrArithStruct()
+            target.tag = cars.AR_FIELD
+            target.u.fieldId = fieldId
+        result = self.GetEntryStatistics(schema, qualifier, target, statistic)
         if self.errnr > 1:
             raise ARError(self)
-        fieldNames = dict([(fieldInfos.fieldList[i].fieldName, fieldInfos.fieldList[i].fieldId) 
-                           for i in range(fieldInfos.numItems)])
-        self.Free(existList)
-        self.Free(fieldName)
-        return fieldNames
+        try:
+            if not result.numItems:
+                return None
+            return self.convValueStruct2Value(result.resultList[0].result)
+        finally:
+            self.Free(result)
+
+    def _probeKeySpace(self, schema, qualifier, partitionField):
+        '''find the range of the values of partitionField among the entries
+matching qualifier: GetEntryStatistics tells the number of entries and, 
+for numeric and time fields, the lowest and highest value; for field 1,
+the lowest and highest request id are retrieved with a sorted 
+GetListEntryWithFields.
+Output: (dataType, lowest, highest, count); lowest and highest are None 
+    if no entry matches; raises ARError in case of failure'''
+        count = self._getStatistic(schema, qualifier, None, cars.AR_STAT_OP_COUNT)
+        if partitionField == 1:
+            lowest = highest = None
+            if count:
+                (first, numMatches) = self.GetListEntryWithFields(schema, qualifier, (1, ),
+                                                     ((1, cars.AR_SORT_ASCENDING), ), 
+                                                     maxRetrieve = 1)
+                (last, numMatches) = self.GetListEntryWithFields(schema, qualifier, (1, ),
+                                                     ((1, cars.AR_SORT_DESCENDING), ), 
+                                                     maxRetrieve = 1)
+                if first and last:
+                    (lowest, highest) = (first[0][0], last[0][0])
+            return (cars.AR_DATA_TYPE_CHAR, lowest, highest, count)
+        dataType = self._getFieldIndex(schema).dataTypes.get(partitionField)
+        if dataType not in self._scanDataTypes:
+            raise ARError(None, 'ScanListEntryWithFields: cannot partition by field %d of type %s!' % (
+                          partitionField, cars.ars_const['AR_DATA_TYPE'].get(dataType, dataType)), 
+                          cars.AR_RETURN_ERROR)
+        dataType = self._scanDataTypes[dataType]
+        lowest = highest = None
+        if count:
+            lowest = self._getStatistic(schema, qualifier, partitionField, 
+                                        cars.AR_STAT_OP_MINIMUM)
+            highest = self._getStatistic(schema, qualifier, partitionField, 
+                                         cars.AR_STAT_OP_MAXIMUM)
+        if lowest is not None and highest is not None:
+            if dataType == cars.AR_DATA_TYPE_REAL:
+                (lowest, highest) = (float(lowest), float(highest))
+            else:
+                (lowest, highest) = (int(lowest), int(highest))
+        return (dataType, lowest, highest, count)
+
+    def _partitionBoundaries(self, dataType, lowest, highest, partitions):
+        '''split [lowest, highest] into partitions ranges of the same size.
+Output: sorted list of the lower boundaries of the ranges (without the
+    first range), i.e. partitions - 1 values or less if the range is small;
+    None if the values cannot be split (request ids with different 
+    prefixes or lengths)'''
+        format_ = None
+        if dataType == cars.AR_DATA_TYPE_CHAR:
+            # request ids: a prefix and a number filled with zeroes
+            match = re.match(r'^(\D*)(\d+)$', lowest)
+            other = re.match(r'^(\D*)(\d+)$', highest)
+            if (match is None or other is None or match.group(1) != other.group(1) or
+                    len(match.group(2)) != len(other.group(2))):
+                return None
+            prefix = match.group(1)
+            digits = len(match.group(2))
+            format_ = lambda number: '%s%s' % (prefix, str(number).zfill(digits))
+            (lowest, highest) = (int(match.group(2)), int(other.group(2)))
+        boundaries = []
+        for k in range(1, partitions):
+            if dataType == cars.AR_DATA_TYPE_REAL:
+                boundary = lowest + k * (highest - lowest) / float(partitions)
+            else:
+                boundary = lowest + k * (highest - lowest + 1) // partitions
+            if boundary > lowest and (not boundaries or boundary > boundaries[-1]):
+                boundaries.append(boundary)
+        if format_ is not None:
+            boundaries = [format_(boundary) for boundary in boundaries]
+        return boundaries
+
+    def _partitionQualifiers(self, qualifier, partitionField, dataType, boundaries):
+        '''return one qualifier per range: 'partitionField' < boundaries[0],
+boundaries[0] <= 'partitionField' < boundaries[1], ..., 
+'partitionField' >= boundaries[-1], each combined with qualifier; the
+qualifiers are owned by python.'''
+        if not boundaries:
+            return [qualifier]
+        qualifiers = []
+        for k in range(len(boundaries) + 1):
+            rangeQualifier = None
+            if k > 0:
+                rangeQualifier = self.conv2RelOpQualifierStruct(partitionField, 
+                                                                boundaries[k - 1],
+                                                                cars.AR_REL_OP_GREATER_EQUAL,
+                                                                dataType)
+            if k < len(boundaries):
+                rangeQualifier = self.conv2AndQualifierStruct(rangeQualifier,
+                                                              self.conv2RelOpQualifierStruct(partitionField, 
+                                                                                             boundaries[k],
+                                                                                             cars.AR_REL_OP_LESS,
+                                                                                             dataType))
+            qualifiers.append(self.conv2AndQualifierStruct(qualifier, rangeQualifier))
+        return qualifiers
+
+    def ScanListEntryWithFields(self, schema, 
+                                query = None,
+                                getListFields = None,
+                                partitionField = 1,
+                                partitions = 4,
+                                ordered = False,
+                                sortList = None,
+                                pageSize = 1000,
+                                bufferPages = 2,
+                                pool = None):
+        '''ScanListEntryWithFields reads all entries of a schema matching the
+query with several sessions in parallel.
+
+First, the key space of partitionField (field 1 or a numeric or time 
+field) is probed with GetEntryStatistics (number of entries, lowest and 
+highest value); then the range is split into partitions disjoint ranges
+of the same size, and every range is read with IterListEntryWithFields 
+on its own session: the first one on this session, the others on sessions
+that are free in pool (or logged in with the parameters of this session).
+There are only as many partitions as sessions: if pool has fewer free 
+sessions than partitions, the key space is split into fewer ranges.
+While iterating, do not use this session for other calls, as a worker
+thread is using it! Entries whose partitionField is NULL are not found.
+The entries of all partitions are handed out as one stream: in the order
+they arrive (ordered = False), or merge-sorted by sortList. Every
+partition keeps at most bufferPages pages of pageSize entries that have
+not been handed out yet; if ordered is set and the sortList starts with
+partitionField in ascending order, the ranges are handed out one after
+the other, so the buffers limit how far the other partitions read ahead.
+Input: schema/form name
+       (optional) query string or ARQualifierStruct (default: None)
+       (optional) getListFields: list of fieldids (fid1, fid2, ...) (default: None);
+                  for ordered scans, it must contain the fields of sortList
+       (optional) partitionField (fieldid, default: 1)
+       (optional) partitions (number of ranges and sessions, default: 4)
+       (optional) ordered (default: False)
+       (optional) sortList (order of an ordered scan, default: None = 
+                  partitionField ascending)
+       (optional) pageSize (default: 1000)
+       (optional) bufferPages (default: 2)
+       (optional) pool (SessionPool to take the sessions from, default: None;
+                  only the sessions that are free are used; this session
+                  may be one of the pool)
+Output: generator of (entryid , { fid1 : value1, ...}); raises ARError
+    in case of failure'''
+        self.errnr = 0
+        partitionField = int(partitionField)
+        ownPool = pool is None
+        if ownPool:
+            (server, user, password, language, authString, tcpport, rpcnumber) = self._loginParameters
+            pool = SessionPool(server, user, password, language, authString, 
+                               tcpport, rpcnumber,
+                               maxSessions = max(partitions - 1, 1),
+                               sessionClass = self.__class__)
+        # every partition needs a session at the same time (the merge waits
+        # for the first page of all of them): take the sessions before the
+        # key space is split, and never wait for a session, as the caller
+        # might hold one of the pool itself
+        sessions = [self]
+        q = scan = None
+        try:
+            while len(sessions) < partitions:
+                try:
+                    sessions.append(pool.acquire(block = False))
+                except ARError:
+                    self.logger.info('ScanListEntryWithFields: only %d of %d sessions available' % (
+                                     len(sessions), partitions))
+                    break
+            q = self._LoadQualifierStruct(schema, query)
+            (dataType, lowest, highest, count) = self._probeKeySpace(schema, q, partitionField)
+            self.logger.debug('ScanListEntryWithFields: %s entries in %s, field %d from %s to %s' % (
+                              count, schema, partitionField, lowest, highest))
+            if not count or lowest is None:
+                return
+            boundaries = self._partitionBoundaries(dataType, lowest, highest,
+                                                   min(len(sessions), count))
+            if boundaries is None:
+                raise ARError(None, 'ScanListEntryWithFields: cannot split the values %s to %s of field %d!' % (
+                              lowest, highest, partitionField), cars.AR_RETURN_ERROR)
+            qualifiers = self._partitionQualifiers(q, partitionField, dataType, 
+                                                   boundaries)
+            if ordered:
+                if sortList is None:
+                    sortList = ((partitionField, cars.AR_SORT_ASCENDING), )
+                sortList = [isinstance(field, (tuple, list)) and 
+                                (int(field[0]), field[1]) or
+                                (int(field), cars.AR_SORT_ASCENDING)
+                            for field in sortList]
+                descending = [(isinstance(order, str) and order[:1] == 'd') or
+                              order == cars.AR_SORT_DESCENDING
+                              for (fieldId, order) in sortList]
+                sortList = [(fieldId, descending[i] and cars.AR_SORT_DESCENDING or 
+                                      cars.AR_SORT_ASCENDING)
+                            for (i, (fieldId, order)) in enumerate(sortList)]
+            scan = self._scanPartitions(schema, qualifiers, getListFields, 
+                                        ordered and sortList or None, 
+                                        pageSize, bufferPages, sessions)
+            for entry in scan:
+                yield entry
+        finally:
+            if scan is not None:
+                # stop the worker threads before their sessions are released
+                scan.close()
+            if q is not None and q is not query:
+                self.Free(q)
+            for session in sessions[1:]:
+                pool.release(session)
+            if ownPool:
+                pool.close()
+
+    def _scanPartitions(self, schema, qualifiers, getListFields, sortList,
+                        pageSize, bufferPages, sessions):
+        '''read every qualifier on its own session (of sessions) and generate
+the merged stream of entries (see ScanListEntryWithFields); without 
+sortList, the entries are handed out as they arrive.'''
+        stop = threading.Event()
+        numPartitions = len(qualifiers)
+        if sortList is None:
+            queues = [queue.Queue(bufferPages * numPartitions)] * numPartitions
+        else:
+            queues = [queue.Queue(bufferPages) for i in range(numPartitions)]
+
+        def put(pages, item):
+            '''hand over an item unless the consumer has stopped'''
+            while not stop.isSet():
+                try:
+                    pages.put(item, True, 0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def work(index):
+            pages = queues[index]
+            try:
+                page = []
+                for entry in sessions[index].IterListEntryWithFields(schema, qualifiers[index],
+                                                                     getListFields, sortList,
+                                                                     pageSize, prefetch = False):
+                    page.append(entry)
+                    if len(page) >= pageSize:
+                        if not put(pages, (index, page, None)):
+                            return
+                        page = []
+                if page and not put(pages, (index, page, None)):
+                    return
+                # an empty page tells that the partition is complete
+                put(pages, (index, [], None))
+            except Exception:
+                put(pages, (index, None, sys.exc_info()[1]))
+
+        threads = []
+        try:
+            for index in range(numPartitions):
+                thread = threading.Thread(target = work, args = (index, ),
+                                          name = 'ScanListEntryWithFields(%s, %d)' % (
+                                                 schema, index))
+                thread.setDaemon(True)
+                thread.start()
+                threads.append(thread)
+
+            def nextPage(pages):
+                while True:
+                    # with a timeout, so that KeyboardInterrupt gets through
+                    try:
+                        (index, page, error) = pages.get(True, 0.5)
+                        break
+                    except queue.Empty:
+                        pass
+                if error is not None:
+                    raise error
+                return (index, page)
+
+            if sortList is None:
+                running = numPartitions
+                while running:
+                    (index, page) = nextPage(queues[0])
+                    if not page:
+                        running -= 1
+                    for entry in page:
+                        yield entry
+                return
+
+            # merge the sorted partitions: the heap holds the next entry
+            # of every partition that is not complete yet
+            heap = []
+            pages = {}
+            def push(index):
+                if not pages[index]:
+                    (index, page) = nextPage(queues[index])
+                    if not page:
+                        return
+                    page.reverse()
+                    pages[index] = page
+                entry = pages[index].pop()
+                heapq.heappush(heap, (_MergeKey(entry, sortList), index, entry))
+            for index in range(numPartitions):
+                pages[index] = []
+                push(index)
+            while heap:
+                (key, index, entry) = heapq.heappop(heap)
+                yield entry
+                push(index)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def PrepareQualifier(self, schema, query, displayTag = None):
+        '''PrepareQualifier compiles a query with placeholders once; the 
+placeholders can then be bound to values again and again without a round
+trip to the server. Placeholders are written as {name} in place of a value:
+    template = ars.PrepareQualifier(schema, "'Status' < {status} AND 'Submitter' = {user}")
+    ars.GetListEntryWithFields(schema, template.bind(status = 4, user = 'Demo'))
+Placeholders stand for values only (not for field names or operators).
+Input: schema
+       query (string with placeholders)
+       (optional) displayTag (name of the view to resolve field labels, default: None)
+Output: QualifierTemplate (release it with its free method); raises ARError in
+    case of failure'''
+        return QualifierTemplate(self, schema, query, displayTag)
+
+    def PreloadFieldIndex(self, schemas, fieldType = cars.AR_FIELD_TYPE_ALL):
+        '''PreloadFieldIndex fills the name/id index (as used by GetFieldByName,
+GetFieldTable and GetAllFieldNames) for a list of schemas in one pass,
+e.g. at startup; for every schema that is not in the cache yet, one call
+to ARGetMultipleFields is necessary.
+Input: schemas (list of schema names)
+       (optional) fieldType (default: cars.AR_FIELD_TYPE_ALL)
+Output: dictionary {schema : {field_name : field_id, ...}, ...}; raises
+    ARError in case of failure'''
+        return dict([(schema, dict(self._getFieldIndex(schema, fieldType).ids))
+                     for schema in schemas])
 
 class erARS(erARS51):
     pass
@@ -3496,7 +5132,6 @@ Output: (list ((entryid , shortdesc) , ...), numMatches) or raise ARError in cas
 It is important that the query looks something like this:
 'field' = "value" (please note the quotation marks).
 '''
-            q = self.conv2QualifierStruct(schema, query)
             arGetListFields = self.conv2EntryListFieldList(getListFields, schema)
             if self.errnr > 1:
                 self.logger.error('GetListEntry: converting getListFields failed!')
@@ -3505,13 +5140,17 @@ It is important that the query looks something like this:
             if self.errnr > 1:
                 self.logger.error('GetListEntry: converting sort list failed!')
                 raise ARError(None, 'GetListEntry: converting sort list failed!', cars.AR_RETURN_ERROR)
-            result = self.ARGetListEntry(schema, 
-                                       q,
-                                       arGetListFields,
-                                       arSortList,
-                                       firstRetrieve,
-                                       maxRetrieve,
-                                       useLocale)
+            q = self._pinQualifierStruct(schema, query)
+            try:
+                result = self.ARGetListEntry(schema, 
+                                           q,
+                                           arGetListFields,
+                                           arSortList,
+                                           firstRetrieve,
+                                           maxRetrieve,
+                                           useLocale)
+            finally:
+                self._unpinQualifierStruct(query, q)
             if result is None:
                 raise ARError(self)
             else:
@@ -3526,7 +5165,8 @@ It is important that the query looks something like this:
                                     sortList=None,
                                     firstRetrieve=cars.AR_START_WITH_FIRST_ENTRY,
                                     maxRetrieve=cars.AR_NO_MAX_LIST_RETRIEVE,
-                                    useLocale = False):
+                                    useLocale = False,
+                                    columnar = False):
             '''GetListEntryWithFields retrieve a list of entries for a schema.
 
 GetListEntryWithFields retrieve a list of entries/objects for a
@@ -3540,10 +5180,12 @@ Input: schema/form name
        (optional) firstRetrieve (default: AR_START_WITH_FIRST_ENTRY)
        (optional) maxRetrieve (default: AR_NO_MAX_LIST_RETRIEVE)
        (optional) useLocale (default: False)
+       (optional) columnar (default: False; if True, the result is returned
+                column by column, see convEntryListFieldValueList2Columns)
 Output: (list ((entryid , { fid1 : value1, ...}), ()....), numMatches) or raise ARError in case of failure.
+In columnar mode: (([entryid1, ...], {fid1: column1, ...}), numMatches)
 It is important that the query looks something like this:
 'field' = "value" (please note the quotation marks).'''
-            q = self.conv2QualifierStruct(schema, query)
             arGetListFields = self.conv2EntryListFieldList(getListFields, schema)
             if self.errnr > 1:
                 self.logger.error('GetListEntryWithFields: converting getListFields failed!')
@@ -3552,18 +5194,25 @@ It is important that the query looks something like this:
             if self.errnr > 1:
                 self.logger.error('GetListEntryWithFields: converting sort list failed!')
                 raise ARError(None, 'GetListEntry: converting sort list failed!', cars.AR_RETURN_ERROR)
-            result = self.ARGetListEntryWithFields(schema, 
-                                                     q,
-                                                     arGetListFields,
-                                                     arSortList,
-                                                     firstRetrieve,
-                                                     maxRetrieve,
-                                                     useLocale)
+            q = self._pinQualifierStruct(schema, query)
+            try:
+                result = self.ARGetListEntryWithFields(schema, 
+                                                         q,
+                                                         arGetListFields,
+                                                         arSortList,
+                                                         firstRetrieve,
+                                                         maxRetrieve,
+                                                         useLocale)
+            finally:
+                self._unpinQualifierStruct(query, q)
             if result is None:
                 raise ARError(self)
             else:
                 (entryListFieldValueList, numMatches) = result
-                pythonicResult = self.convEntryListFieldValueList2List(entryListFieldValueList)
+                if columnar:
+                    pythonicResult = self.convEntryListFieldValueList2Columns(entryListFieldValueList)
+                else:
+                    pythonicResult = self.convEntryListFieldValueList2List(entryListFieldValueList)
                 self.Free(entryListFieldValueList)
                 return (pythonicResult, numMatches)
     
@@ -4090,6 +5739,119 @@ not be sent to the server until the trailing call is made.
 Input:
 Output: errnr'''
             return self.ARBeginBulkEntryTransaction()
+
+        def _BulkEntryTransaction(self, batch, queueCall, returnType, report):
+            '''send one bulk entry transaction: queueCall(row) is called for 
+every (index, row) in batch (e.g. ARCreateEntry), returnType is the member of
+the ARBulkEntryReturn union that holds the result of these calls 
+('createEntryReturn' or 'mergeEntryReturn'); report(index, entryId, error) is
+called for every row that has been created or has failed. Returns the list of
+(index, row) that have been rolled back because of errors of other rows.
+Rows that cannot be converted are reported and left out; if anything else
+goes wrong while the calls are queued, the transaction is cancelled, so
+that later calls of this session are not queued into it.
+From the beginning to the end of the transaction, the lock of the session
+is held, so that the calls of other threads (see enableThreadSharing) are
+not queued into it either.'''
+            self.lock.acquire()
+            try:
+                if self.BeginBulkEntryTransaction() > 1:
+                    raise ARError(self)
+                queued = []
+                try:
+                    for (index, row) in batch:
+                        try:
+                            queueCall(row)
+                        except Exception:
+                            report(index, None, 'Status: %s' % (sys.exc_info()[1]))
+                            continue
+                        if self.errnr > 1:
+                            report(index, None, self.statusText())
+                        else:
+                            queued.append((index, row))
+                except:
+                    excInfo = sys.exc_info()
+                    self.Free(self.EndBulkEntryTransaction(cars.AR_BULK_ENTRY_ACTION_CANCEL))
+                    raise excInfo[0], excInfo[1], excInfo[2]
+                result = self.EndBulkEntryTransaction()
+            finally:
+                self.lock.release()
+            failed = self.errnr > 1
+            transactionStatus = self.statusText()
+            rolledBack = []
+            try:
+                for i in range(len(queued)):
+                    (index, row) = queued[i]
+                    if i < result.numItems:
+                        entryReturn = getattr(result.entryReturnList[i].u, returnType)
+                        status = [item for item in self.convStatusList2List(entryReturn.status)
+                                  if item[0] >= cars.AR_RETURN_ERROR]
+                    else:
+                        entryReturn = None
+                        status = []
+                    if status:
+                        report(index, None, 'Status: ' + '\n'.join(['%s (%d): %s' % (
+                                                  cars.ars_const['AR_RETURN'][item[0]], item[1], item[2])
+                                                  for item in status]))
+                    elif failed or entryReturn is None:
+                        # this row was fine, but the transaction was rolled back
+                        rolledBack.append((index, row))
+                    else:
+                        report(index, entryReturn.entryId, None)
+            finally:
+                self.Free(result)
+            if failed and len(rolledBack) == len(queued):
+                # no single row is to blame (e.g. the connection failed)
+                for (index, row) in rolledBack:
+                    report(index, None, transactionStatus)
+                return []
+            return rolledBack
+
+        def _SendBulkEntries(self, batch, queueCall, returnType, report):
+            '''send the rows of batch in a bulk entry transaction (see
+_BulkEntryTransaction); rows that have been rolled back because of other
+rows are sent once more without the failing rows.'''
+            rolledBack = self._BulkEntryTransaction(batch, queueCall, returnType, report)
+            if rolledBack:
+                rolledBack = self._BulkEntryTransaction(rolledBack, queueCall, returnType, report)
+                for (index, row) in rolledBack:
+                    report(index, None, 'bulk transaction has been rolled back twice')
+
+        def CreateEntries(self, schema, rows, batchSize = 100):
+            '''CreateEntries creates many new entries in the indicated schema.
+
+The rows are converted one after the other into the same ARFieldValueList
+and sent in bulk entry transactions of batchSize entries. A bulk
+transaction is executed in one database transaction: if one row fails,
+the other rows of the batch are rolled back; they are then sent once more
+in a new transaction without the failing rows.
+Input: schema
+       rows (iterable of dictionaries {fieldid: value} or lists of (fieldid, value))
+       (optional) batchSize (number of entries per bulk transaction; default: 100)
+Output: (entryIds, errors): list of the new entry ids in the order of rows
+        (None for the rows that could not be created) and a dictionary
+        {index of row: status text} for those rows'''
+            self.errnr = 0
+            buffer_ = _FieldValueBuffer(self, schema = schema)
+            entryIds = []
+            errors = {}
+            batch = []
+            def queueCall(row):
+                self.ARCreateEntry(schema, buffer_.fill(row))
+            def report(index, entryId, error):
+                entryIds[index] = entryId
+                if error is not None:
+                    errors[index] = error
+            for row in rows:
+                batch.append((len(entryIds), row))
+                entryIds.append(None)
+                if len(batch) >= batchSize:
+                    self._SendBulkEntries(batch, queueCall, 'createEntryReturn', report)
+                    batch = []
+            if batch:
+                self._SendBulkEntries(batch, queueCall, 'createEntryReturn', report)
+            self.errnr = errors and 2 or 0
+            return (entryIds, errors)
     
         def EndBulkEntryTransaction(self, actionType = cars.AR_BULK_ENTRY_ACTION_SEND):
             '''EndBulkEntryTransaction marks the ending of a series of entry API function calls that 
@@ -4098,21 +5860,29 @@ of one transaction. All calls related to create, set, delete,
 and merge operations made before this API call and after the 
 preceding ARBeginBulkEntryTransaction call will be sent to the
 server when this call is issued and executed within a single 
-database transaction.'''
-            return self.AREndBulkEntryTransaction()
+database transaction.
+Input: (optional) actionType (default = cars.AR_BULK_ENTRY_ACTION_SEND)
+Output: ARBulkEntryReturnList'''
+            return self.AREndBulkEntryTransaction(actionType)
 
-        def GetEntryBlock(self, entryBlockList, blockNumber = 0):
+        def GetEntryBlock(self, entryBlockList, blockNumber = 0, columnar = False):
             '''GetEntryBlock retrieves a list of entries contained in a block of entries 
 retrieved using ARGetListEntryBlocks.
 
 Input: entryBlockList
        (optional) blockNumber (default = 0)
+       (optional) columnar (default: False; if True, the block is returned
+                column by column, see convEntryListFieldValueList2Columns)
 Output: dictionary {entryid: {fieldid1 : value, ...}, ...} 
-        or None in case of failure'''
+        or None in case of failure; in columnar mode:
+        ([entryid1, ...], {fieldid1: column1, ...})'''
             result = self.ARGetEntryBlock(entryBlockList, blockNumber)
             if self.errnr > 1:
                 raise ARError(self)
-            pythonicResult = self.convEntryListFieldValueList2Dict(result)
+            if columnar:
+                pythonicResult = self.convEntryListFieldValueList2Columns(result)
+            else:
+                pythonicResult = self.convEntryListFieldValueList2Dict(result)
             self.Free(result)
             return pythonicResult
     
@@ -4135,7 +5905,6 @@ Output: (entryBlockList (AREntryBlockList),
          numReturnedRows, 
          numMatches) 
          or None in case of failure'''
-            q = self.conv2QualifierStruct(schema, query)
             arGetListFields = self.conv2EntryListFieldList(getListFields, schema)
             if self.errnr > 1:
                 self.logger.error('GetListEntryBlocks: ERROR: converting getListFields failed!')
@@ -4144,14 +5913,18 @@ Output: (entryBlockList (AREntryBlockList),
             if self.errnr > 1:
                 self.logger.error('GetListEntryBlocks: ERROR: converting sort list failed!')
                 raise ARError(None, 'GetListEntryBlocks: ERROR: converting sort list failed!', cars.AR_RETURN_ERROR)
-            result = self.ARGetListEntryBlocks(schema, 
-                                             q,
-                                             arGetListFields,
-                                             arSortList,
-                                             numRowsPerBlock,
-                                             firstRetrieve,
-                                             maxRetrieve,
-                                             useLocale)
+            q = self._pinQualifierStruct(schema, query)
+            try:
+                result = self.ARGetListEntryBlocks(schema, 
+                                                 q,
+                                                 arGetListFields,
+                                                 arSortList,
+                                                 numRowsPerBlock,
+                                                 firstRetrieve,
+                                                 maxRetrieve,
+                                                 useLocale)
+            finally:
+                self._unpinQualifierStruct(query, q)
             if self.errnr > 1:
                 raise ARError(self)
             return result
@@ -4247,6 +6020,8 @@ the nameList parameter.'''
                    cacheId = 0,
                    operationTime = 0,
                    sessionId = 0):
+            self._loginParameters = (server, username, password, language, 
+                                     authString, tcpport, rpcnumber)
             ars.ARS.Login(self, server, username, password, language, 
                authString, tcpport, rpcnumber, charSet, timeZone,customDateFormat,
                customTimeFormat, separators, cacheId,
@@ -5213,12 +6988,10 @@ Output: '''
 modify, and delete operations for each type of server object.
 Input:
 Output: ARObjectChangeTimestampList or None in case of failure'''
-            result = self.ARGetObjectChangeTimes()
-            if self.errnr > 1:
-                raise ARError(self)
-            pythonicResult = self.convObjectChangeTimestampList2List(result)
-#            self.Free(result)
-            return pythonicResult
+            with self.autoFree(self.ARGetObjectChangeTimes()) as result:
+                if self.errnr > 1:
+                    raise ARError(self)
+                return self.convObjectChangeTimestampList2List(result)
         
         def GetOneEntryWithFields(self, schema,
                                     qualifier = None,
@@ -5239,14 +7012,17 @@ Input: schema (ARNameType)
        (default) sortList (ARSortList, default = None)
        (default) useLocale (ARBoolean, default = False)
 Output: (entryList (AREntryListFieldValueList), numMatches (c_uint))'''
-            q = self.conv2QualifierStruct(schema, query)
             arGetListFields = self.conv2EntryListFieldList(getListFields, schema)
             arSortList = self.conv2SortList(sortList)
-            result = self.ARGetOneEntryWithFields(schema,
-                                                  q,
-                                                  arGetListFields,
-                                                  arSortList,
-                                                  useLocale)
+            q = self._pinQualifierStruct(schema, query)
+            try:
+                result = self.ARGetOneEntryWithFields(schema,
+                                                      q,
+                                                      arGetListFields,
+                                                      arSortList,
+                                                      useLocale)
+            finally:
+                self._unpinQualifierStruct(query, q)
             if self.errnr > 1:
                 raise ARError(self)
             else:
@@ -5588,6 +7364,189 @@ ARTimestamp *modifiedDate,
 ARImageDataStruct imageContent
 Output: errnr'''
             raise ars.pyARSNotImplemented
+
+        ###########################################################################
+        #
+        #
+        # persistent metadata store
+        #
+        #
+
+        # object types whose names are kept in the metadata store
+        _metadataNameTypes = (cars.AR_STRUCT_ITEM_SCHEMA,
+                              cars.AR_STRUCT_ITEM_ACTIVE_LINK,
+                              cars.AR_STRUCT_ITEM_FILTER,
+                              cars.AR_STRUCT_ITEM_ESCALATION)
+        _metadataStore = None
+
+        def _InitializeCache(self):
+            erARS71._InitializeCache(self)
+            if self._metadataStore is not None:
+                try:
+                    self._validateMetadataStore()
+                except (ARError, EnvironmentError) as e:
+                    # the session works without the store, just slower
+                    self.logger.error('_InitializeCache: metadata store not used: %s' % (e))
+                    self._metadata = None
+
+        def _getMetadataNames(self, objectType, getList):
+            '''return the names of objectType from the metadata snapshot; if
+they are not known yet, call getList and store the result'''
+            names = self._metadata.getNames(objectType)
+            if names is None:
+                names = getList()
+                if names is None:
+                    return None
+                self._metadata.setNames(objectType, names)
+            return list(names)
+
+        def _refreshMetadata(self, snapshot, objectType, oldTimes, newTimes):
+            '''bring the part of the snapshot for objectType up to date; the
+server reported a change from oldTimes to newTimes (createTime, changeTime, 
+deleteTime)'''
+            if objectType in (cars.AR_STRUCT_ITEM_SCHEMA,
+                              cars.AR_STRUCT_ITEM_FIELD,
+                              cars.AR_STRUCT_ITEM_VUI):
+                # changes to fields and views change the schema's timestamp as well
+                if oldTimes is None:
+                    snapshot.fields = {}
+                    snapshot.setNames(cars.AR_STRUCT_ITEM_SCHEMA, None)
+                    return
+                if oldTimes[2] != newTimes[2]: # something has been deleted
+                    schemas = erARS71.GetListSchema(self, 
+                                                    schemaType = cars.AR_LIST_SCHEMA_ALL | cars.AR_HIDDEN_INCREMENT)
+                    if schemas is None:
+                        raise ARError(self)
+                    snapshot.retainSchemas(schemas)
+                    snapshot.setNames(cars.AR_STRUCT_ITEM_SCHEMA, None)
+                if oldTimes[:2] != newTimes[:2]: # something has been created or modified
+                    changedSince = max(oldTimes[:2])
+                    schemas = erARS71.GetListSchema(self, changedSince,
+                                                    schemaType = cars.AR_LIST_SCHEMA_ALL | cars.AR_HIDDEN_INCREMENT)
+                    if schemas is None:
+                        raise ARError(self)
+                    self.logger.debug('_refreshMetadata: %d schemas have changed' % (len(schemas)))
+                    for schema in schemas:
+                        snapshot.invalidateSchema(schema)
+                    snapshot.setNames(cars.AR_STRUCT_ITEM_SCHEMA, None)
+            elif objectType in self._metadataNameTypes:
+                if oldTimes is None or oldTimes[2] != newTimes[2]:
+                    # deleted objects cannot be retrieved with changedSince
+                    snapshot.setNames(objectType, None)
+                elif snapshot.getNames(objectType) is not None:
+                    getList = {cars.AR_STRUCT_ITEM_ACTIVE_LINK: erARS71.GetListActiveLink,
+                               cars.AR_STRUCT_ITEM_FILTER: erARS71.GetListFilter,
+                               cars.AR_STRUCT_ITEM_ESCALATION: erARS71.GetListEscalation}[objectType]
+                    names = getList(self, None, max(oldTimes[:2]))
+                    if names is None:
+                        raise ARError(self)
+                    snapshot.addNames(objectType, names)
+
+        def _validateMetadataStore(self):
+            '''load the snapshot of the server from the metadata store and
+bring it up to date with one call to GetObjectChangeTimes'''
+            server = self.context.server
+            changeTimes = dict([(change[0], tuple(change[1:])) 
+                                for change in self.GetObjectChangeTimes()])
+            snapshot = self._metadataStore.load(server)
+            if snapshot is None:
+                self.logger.debug('_validateMetadataStore: no metadata for %s yet' % (server))
+                snapshot = metadatastore.MetadataSnapshot(server)
+            else:
+                for (objectType, newTimes) in changeTimes.items():
+                    oldTimes = snapshot.changeTimes.get(objectType)
+                    if oldTimes != newTimes:
+                        self._refreshMetadata(snapshot, objectType, oldTimes, newTimes)
+            snapshot.changeTimes = changeTimes
+            self._metadata = snapshot
+            self._metadataStore.save(snapshot)
+
+        def GetListActiveLink (self, schema=None, 
+                               changedSince=0, 
+                               objPropList = None):
+            if (self._metadata is None or schema is not None or 
+                changedSince != 0 or objPropList is not None):
+                return erARS71.GetListActiveLink(self, schema, changedSince, objPropList)
+            return self._getMetadataNames(cars.AR_STRUCT_ITEM_ACTIVE_LINK,
+                                          lambda: erARS71.GetListActiveLink(self))
+        GetListActiveLink.__doc__ = erARS71.GetListActiveLink.__doc__
+
+        def GetListEscalation (self, schema=None,
+                               changedSince = 0,
+                               objPropList = None):
+            if (self._metadata is None or schema is not None or 
+                changedSince != 0 or objPropList is not None):
+                return erARS71.GetListEscalation(self, schema, changedSince, objPropList)
+            return self._getMetadataNames(cars.AR_STRUCT_ITEM_ESCALATION,
+                                          lambda: erARS71.GetListEscalation(self))
+        GetListEscalation.__doc__ = erARS71.GetListEscalation.__doc__
+
+        def GetListFilter(self, schema=None, 
+                          changedSince=0, 
+                          objPropList = None):
+            if (self._metadata is None or schema is not None or 
+                changedSince != 0 or objPropList is not None):
+                return erARS71.GetListFilter(self, schema, changedSince, objPropList)
+            return self._getMetadataNames(cars.AR_STRUCT_ITEM_FILTER,
+                                          lambda: erARS71.GetListFilter(self))
+        GetListFilter.__doc__ = erARS71.GetListFilter.__doc__
+
+        def GetListSchema(self, changedSince=0, 
+                          schemaType=cars.AR_HIDDEN_INCREMENT,
+                          name='', 
+                          fieldIdArray=None, 
+                          objPropList=None):
+            if (self._metadata is None or changedSince != 0 or
+                schemaType != cars.AR_HIDDEN_INCREMENT or name != '' or 
+                fieldIdArray is not None or objPropList is not None):
+                return erARS71.GetListSchema(self, changedSince, schemaType, 
+                                             name, fieldIdArray, objPropList)
+            return self._getMetadataNames(cars.AR_STRUCT_ITEM_SCHEMA,
+                                          lambda: erARS71.GetListSchema(self))
+        GetListSchema.__doc__ = erARS71.GetListSchema.__doc__
+
+        def Logoff (self):
+            try:
+                self.saveMetadataStore()
+            except EnvironmentError as e:
+                # the metadata is lost, but the session must end anyway
+                self.logger.error('Logoff: metadata store not saved: %s' % (e))
+            return erARS71.Logoff(self)
+
+        def saveMetadataStore(self):
+            '''saveMetadataStore writes the metadata that has been retrieved
+since the login to the metadata store (this happens automatically at Logoff;
+there, errors are only logged).
+Input:
+Output: none; raises EnvironmentError if the store cannot be written'''
+            if self._metadata is not None and self._metadata.dirty:
+                self._metadataStore.save(self._metadata)
+
+        def useMetadataStore(self, store):
+            '''useMetadataStore makes the session keep the field definitions (as used
+by GetFieldTable, GetAllFieldNames and GetFieldByName) and the lists of schemas,
+active links, filters and escalations in a persistent metadata store, so that
+other processes do not have to retrieve them again.
+At login, the snapshot of the server is validated with one call to
+GetObjectChangeTimes: only those object types that have changed on the server
+since the snapshot was taken are refreshed (for schemas, using the changedSince
+parameter of GetListSchema).
+    session = erARS()
+    session.useMetadataStore(metadatastore.MetadataStore('/var/cache/pyars'))
+    session.Login(server, user, password)
+The complete definitions that GetSchema and GetField return are C structures;
+they are not kept in the store, GetSchema and GetField still ask the server.
+Input: store (metadatastore.MetadataStore or a directory name; None switches
+            the store off)
+Output: none'''
+            if isinstance(store, basestring):
+                store = metadatastore.MetadataStore(store)
+            self._metadataStore = store
+            self._metadata = None
+            if store is not None and self.context is not None and \
+                    getattr(self, 'cache', None) is not None:
+                # we are logged in already
+                self._validateMetadataStore()
                     
     class erARS(erARS75):
         pass 
@@ -6991,3 +8950,218 @@ if float(cars.version) >= 81:
         pass
     class erARS(erARS81):
         pass
+
+class SessionPool(object):
+    '''SessionPool hands out logged-in erARS sessions to several threads.
+
+The calls of one erARS session (its control record) are serialized (see
+enableThreadSharing), and logging in for every request is slow.
+The pool logs in sessions lazily when they are needed (up to maxSessions)
+and hands them out one at a time:
+    pool = SessionPool('server', 'user', 'password', maxSessions = 8)
+    with pool.session() as ars:
+        ars.GetListEntryWithFields(...)
+    pool.close()
+Sessions that have been idle for more than verifyInterval seconds, or
+whose last call failed, are checked with VerifyUser before they are
+handed out again; if the server does not know the session anymore, it is
+logged in again.
+As ctypes releases the GIL while a call to the arapi is running, the
+calls of several threads overlap on the server.'''
+
+    def __init__(self, server, user, password, language = '',
+                 authString = '',
+                 tcpport = 0,
+                 rpcnumber = 0,
+                 maxSessions = 4,
+                 verifyInterval = 60,
+                 sessionClass = None):
+        '''Input: server, user, password, (optional) language, authString, 
+                 tcpport, rpcnumber: parameters for Login
+       (optional) maxSessions (maximum number of sessions, default: 4)
+       (optional) verifyInterval (seconds a session may be idle before
+                  it is checked with VerifyUser, default: 60)
+       (optional) sessionClass (class of the sessions, default: erARS)'''
+        self.server = server
+        self.user = user
+        self.password = password
+        self.language = language
+        self.authString = authString
+        self.tcpport = tcpport
+        self.rpcnumber = rpcnumber
+        self.maxSessions = maxSessions
+        self.verifyInterval = verifyInterval
+        if sessionClass is None:
+            sessionClass = erARS
+        self.sessionClass = sessionClass
+        self._lock = threading.Condition(threading.Lock())
+        self._idle = [] # list of (session, time of release, needs verification)
+        self._numSessions = 0 # logged in sessions, idle or checked out
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _login(self, session = None):
+        '''log in a new session (or the given one again); raise ARError
+in case of failure'''
+        if session is None:
+            session = self.sessionClass()
+        session.Login(self.server, self.user, self.password,
+                      self.language, self.authString, 
+                      self.tcpport, self.rpcnumber)
+        if session.errnr > 1:
+            msg = 'SessionPool: login to %s as %s failed: %s' % (self.server,
+                                                               self.user,
+                                                               session.statusText())
+            session.logger.error(msg)
+            raise ARError(None, msg, cars.AR_RETURN_ERROR)
+        return session
+
+    def _verify(self, session):
+        '''decide if the server still knows the session'''
+        if session.VerifyUser() is not None:
+            return True
+        session.logger.info('SessionPool: session to %s is not valid anymore, login again' % (
+                                                                self.server))
+        return False
+
+    def acquire(self, block = True, timeout = None):
+        '''acquire checks out a session; the session has to be given 
+back with release!
+Input: (optional) block (wait for a session if all sessions are in use 
+                  and maxSessions is reached, default: True)
+       (optional) timeout (seconds to wait at most, default: None (forever))
+Output: erARS session; raises ARError if no session is available or the
+    login failed'''
+        if timeout is not None:
+            deadline = time.time() + timeout
+        self._lock.acquire()
+        try:
+            while True:
+                if self._closed:
+                    raise ARError(None, 'SessionPool: the pool has been closed!',
+                                  cars.AR_RETURN_ERROR)
+                if self._idle:
+                    (session, released, suspect) = self._idle.pop()
+                    break
+                if self._numSessions < self.maxSessions:
+                    # reserve the slot; the login itself runs without the lock
+                    self._numSessions += 1
+                    session = None
+                    break
+                if not block:
+                    raise ARError(None, 'SessionPool: all %d sessions are in use!' % (
+                                        self.maxSessions), cars.AR_RETURN_ERROR)
+                if timeout is None:
+                    self._lock.wait()
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise ARError(None, 'SessionPool: no session available after %s seconds!' % (
+                                            timeout), cars.AR_RETURN_ERROR)
+                    self._lock.wait(remaining)
+        finally:
+            self._lock.release()
+
+        # the session has to be logged off if it cannot be handed out
+        loggedIn = session is not None
+        try:
+            if session is None:
+                session = self._login()
+            elif ((suspect or time.time() - released > self.verifyInterval) and
+                    not self._verify(session)):
+                # log off only once, even if the new login fails
+                loggedIn = False
+                session.Logoff()
+                session = self._login(session)
+            # release looks at the failures while the session is checked out
+            session.lastErrnr = 0
+            return session
+        except Exception:
+            # the slot is free again for somebody else
+            if loggedIn:
+                session.Logoff()
+            self._discard()
+            raise
+
+    def release(self, session, discard = False):
+        '''release gives a session back to the pool.
+Input: session (as returned by acquire)
+       (optional) discard (log off the session instead of keeping it, 
+                  default: False)
+Output: none'''
+        if discard or self._closed:
+            session.Logoff()
+            self._discard()
+            return
+        # the failures of all threads that used the session, not only of
+        # the one that releases it
+        suspect = session.lastErrnr > 1
+        self._lock.acquire()
+        try:
+            self._idle.append((session, time.time(), suspect))
+            self._lock.notify()
+        finally:
+            self._lock.release()
+
+    def _discard(self):
+        '''forget about a session that has been checked out'''
+        self._lock.acquire()
+        try:
+            self._numSessions -= 1
+            self._lock.notify()
+        finally:
+            self._lock.release()
+
+    def session(self, block = True, timeout = None):
+        '''session returns a context manager that checks out a session
+and gives it back at the end of the with statement:
+    with pool.session() as ars:
+        ...
+Input: (optional) block, timeout (see acquire)
+Output: context manager; raises ARError if no session is available'''
+        return _PooledSession(self, block, timeout)
+
+    def stats(self):
+        '''return (number of sessions, number of idle sessions)'''
+        self._lock.acquire()
+        try:
+            return (self._numSessions, len(self._idle))
+        finally:
+            self._lock.release()
+
+    def close(self):
+        '''close logs off all idle sessions; sessions that are checked out 
+are logged off when they are released.'''
+        self._lock.acquire()
+        try:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+            self._numSessions -= len(idle)
+            self._lock.notifyAll()
+        finally:
+            self._lock.release()
+        for (session, released, suspect) in idle:
+            session.Logoff()
+
+class _PooledSession(object):
+    '''context manager returned by SessionPool.session'''
+
+    def __init__(self, pool, block, timeout):
+        self.pool = pool
+        self.block = block
+        self.timeout = timeout
+        self.ars = None
+
+    def __enter__(self):
+        self.ars = self.pool.acquire(self.block, self.timeout)
+        return self.ars
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.pool.release(self.ars)
+        self.ars = None
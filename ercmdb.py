@@ -87,28 +87,23 @@ class erCMDB11(CMDB, erars.erARS):
                 getObjectStruct.instanceId,
                 self.convAttributeValueList2List(getObjectStruct.attributeValueList))
 
-    # unfortunately, I have to declary a copy from erars.convValueStruct2Value
-    # here, as ARValueStruct seems to be loaded from ccmdb instead of cars...
-    def convValueStruct2Value(self, obj):
+    # ARValueStruct seems to be loaded from ccmdb instead of cars, therefore
+    # we hand out the decoder table compiled by ccmdb to the conversion 
+    # functions of erars (e.g. convPropList2Dict)
+    def _getValueDecoder(self):
         # special handling for unicode
-        if obj.dataType == ccmdb.AR_DATA_TYPE_CHAR and \
-        self.context.localeInfo.charSet.lower() == 'utf-8':
-            return obj.u.charVal.decode('utf-8') 
-#            string = obj.u.charVal
-#            self.logger.debug('before unicode conversion: %s' % string)
-#            ustring = string.decode('utf-8') 
-#            self.logger.debug('after unicode conversion: %s' % ustring)
-#            return ustring
+        if self.context.localeInfo.charSet.lower() == 'utf-8':
+            return ccmdb.ARValueStruct._decoder_utf8_
+        return ccmdb.ARValueStruct._decoder_
+
+    def convValueStruct2Value(self, obj, decoder = None):
+        if decoder is None:
+            decoder = self._getValueDecoder()
         try:
-            if obj.dataType == ccmdb.AR_DATA_TYPE_NULL:
-                return None
-            return eval('obj.%s' % (ccmdb.ARValueStruct._mapping_so_ [obj.dataType]))
+            return decoder[obj.dataType](obj)
         except KeyError:
-            try: 
-                return eval('obj.%s' % (ccmdb.ARValueStruct._mapping_co_ [obj.dataType]))
-            except KeyError:
-                self.logger.error('unknown ARValueStruct type!')
-                return None
+            self.logger.error('unknown ARValueStruct type!')
+            return None
 
     def getClassHierarchy(self, namespace = ccmdb.BMC_namespace, 
                           baseclass = ccmdb.BMC_baseclass):
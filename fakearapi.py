@@ -0,0 +1,1131 @@
+#######################################################################
+#
+# This is an in-process fake of the arapi shared library for pyars.
+# (C) 2004-2015 by Ergorion
+#
+# FakeArapi stands in for the CDLL that cars loads: it implements the
+# main entry points of the C API against synthetic forms that are kept
+# in memory, and fills the ctypes structs of the loaded _carsNN module
+# just like the real library. This allows to run and benchmark the
+# python layers without a Remedy server; a configurable latency per call
+# separates the client side overhead from the network.
+#
+# Either load cars with the fake instead of a library:
+#     PYARS_LIBRARIES=fake PYARS_API_VERSION=81 python myscript.py
+# or install it after cars has been imported (before the sessions are
+# created):
+#     from pyars import fakearapi
+#     arapi = fakearapi.install()
+#     arapi.addForm('Sample', [(536870913, 'Counter', cars.AR_DATA_TYPE_INTEGER)])
+#     arapi.populate('Sample', 10000)
+#
+# Supported: ARInitialization, ARTermination, ARSetServerPort, ARVerifyUser,
+# ARGetListSchema, ARGetListField, ARGetMultipleFields,
+# ARLoadARQualifierStruct, ARGetListEntryWithFields, ARGetEntry,
+# ARGetMultipleEntries, ARGetEntryStatistics, ARCreateEntry, ARSetEntry,
+# ARMergeEntry, ARDeleteEntry, the bulk entry transactions and all Free*
+# functions (they do nothing: the memory belongs to python). All other
+# AR* calls fail with an error status. Join forms are not supported.
+# As on the server, the values of new and changed entries are converted to
+# the data types of their fields; a value that does not match (e.g. 'abc'
+# for an INTEGER field) fails the call with ERROR (305).
+#
+
+from ctypes import pointer
+import re
+import threading
+import time
+
+# the name that selects the fake in PYARS_LIBRARIES or pyars.configure
+libraryName = 'fake'
+
+# message numbers of the status lists (as used by the AR System server)
+ERROR_NETWORK = 90
+ERROR_NO_SUCH_ENTRY = 302
+ERROR_NO_SUCH_FORM = 303
+ERROR_DATA_TYPE = 305
+ERROR_DUPLICATE_ENTRY = 382
+ERROR_QUALIFIER = 1587
+# message numbers of the fake itself
+ERROR_NOT_IMPLEMENTED = 8750
+ERROR_ENTRY_MODIFIED = 8751
+ERROR_ROLLED_BACK = 8752
+ERROR_BULK_TRANSACTION = 8753
+
+def _deref(argument):
+    '''return the object behind byref(object); other arguments are
+returned as they are'''
+    return getattr(argument, '_obj', argument)
+
+class FakeForm(object):
+    '''FakeForm is a regular form with its fields and entries.'''
+
+    def __init__(self, name, fields):
+        '''Input: name
+       fields (list of (fieldId, fieldName, dataType))'''
+        self.name = name
+        self.fields = list(fields)
+        self.fieldIds = [field[0] for field in self.fields]
+        self.dataTypes = dict([(field[0], field[2]) for field in self.fields])
+        self.ids = dict([(field[1], field[0]) for field in self.fields])
+        # entryId -> {fieldId: value}
+        self.entries = {}
+        self.order = []
+        self.nextId = 1
+        # counts the changes of the entries; the results of queries are
+        # kept until the next change (see FakeArapi._select)
+        self.changes = 0
+        self.selections = {}
+
+    def newEntryId(self):
+        entryId = '%015d' % (self.nextId)
+        self.nextId += 1
+        return entryId
+
+    def fieldId(self, reference):
+        '''return the fieldId for a field name or id (as string)'''
+        if reference in self.ids:
+            return self.ids[reference]
+        try:
+            fieldId = int(reference)
+        except ValueError:
+            return None
+        if fieldId in self.dataTypes:
+            return fieldId
+        return None
+
+class FakeArapi(object):
+    '''FakeArapi implements the entry points of the arapi (see the module
+documentation).'''
+
+    def __init__(self, carsModule = None, latency = 0.0, latencies = None):
+        '''Input: (optional) carsModule (the module with the structs, default: pyars.cars)
+       (optional) latency (seconds every call takes, default: 0.0)
+       (optional) latencies (dictionary {function name: seconds} that overrides
+                  latency for certain calls, default: None)'''
+        if carsModule is None:
+            from pyars import cars as carsModule
+        self.cars = carsModule
+        self._name = libraryName
+        self.latency = latency
+        self.latencies = dict(latencies or {})
+        self.forms = {}
+        # function name -> number of calls
+        self.calls = {}
+        # function name -> list of (messageNum, messageText) that the next
+        # calls will fail with
+        self._injectedErrors = {}
+        # id of the control struct -> list of queued bulk operations
+        self._bulkTransactions = {}
+        # while the server is down, every call fails with ERROR_NETWORK
+        self.serverDown = False
+        self._lock = threading.RLock()
+
+##############################################################
+#
+# configuration of the fake
+#
+
+    def coreFields(self):
+        '''the core fields that every form has'''
+        cars = self.cars
+        return [(1, 'Request ID', cars.AR_DATA_TYPE_CHAR),
+                (2, 'Submitter', cars.AR_DATA_TYPE_CHAR),
+                (3, 'Create Date', cars.AR_DATA_TYPE_TIME),
+                (4, 'Assigned To', cars.AR_DATA_TYPE_CHAR),
+                (5, 'Last Modified By', cars.AR_DATA_TYPE_CHAR),
+                (6, 'Modified Date', cars.AR_DATA_TYPE_TIME),
+                (7, 'Status', cars.AR_DATA_TYPE_ENUM),
+                (8, 'Short Description', cars.AR_DATA_TYPE_CHAR)]
+
+    def addForm(self, name, fields = None):
+        '''addForm creates a form with the core fields and fields.
+Input: name
+       (optional) fields (list of (fieldId, fieldName, dataType), default: None)
+Output: FakeForm'''
+        form = FakeForm(name, self.coreFields() + list(fields or []))
+        self._lock.acquire()
+        try:
+            self.forms[name] = form
+        finally:
+            self._lock.release()
+        return form
+
+    def syntheticValue(self, dataType, fieldName, i):
+        '''the value of a field in the i-th synthetic entry'''
+        cars = self.cars
+        if dataType == cars.AR_DATA_TYPE_INTEGER:
+            return i
+        elif dataType == cars.AR_DATA_TYPE_REAL:
+            return i / 3.0
+        elif dataType == cars.AR_DATA_TYPE_ENUM:
+            return i % 4
+        elif dataType == cars.AR_DATA_TYPE_TIME:
+            return 1400000000 + i
+        elif dataType == cars.AR_DATA_TYPE_DECIMAL:
+            return '%d.%02d' % (i, i % 100)
+        return '%s %d' % (fieldName, i)
+
+    def populate(self, name, numEntries, rowFunction = None):
+        '''populate adds synthetic entries to a form.
+Input: name
+       numEntries
+       (optional) rowFunction (returns the dictionary {fieldId: value} of the
+                  i-th entry; default: values derived from the data types)
+Output: list of the new entryIds'''
+        form = self.forms[name]
+        entryIds = []
+        self._lock.acquire()
+        try:
+            for i in range(numEntries):
+                if rowFunction is not None:
+                    row = dict(rowFunction(i))
+                else:
+                    row = dict([(fieldId, self.syntheticValue(dataType, fieldName, i))
+                                for (fieldId, fieldName, dataType) in form.fields
+                                if fieldId != 1])
+                entryIds.append(self._insert(form, row, 'Demo'))
+        finally:
+            self._lock.release()
+        return entryIds
+
+    def injectError(self, functionName, messageNum, messageText = 'injected error',
+                    count = 1):
+        '''injectError lets the next count calls of functionName fail.'''
+        self._lock.acquire()
+        try:
+            self._injectedErrors.setdefault(functionName, []).extend(
+                                            [(messageNum, messageText)] * count)
+        finally:
+            self._lock.release()
+
+    def setServerDown(self, down = True):
+        '''setServerDown lets all calls fail as if the server could not be
+reached (until it is called with down = False).'''
+        self.serverDown = down
+
+    def resetCounters(self):
+        self.calls = {}
+
+##############################################################
+#
+# helpers
+#
+
+    def _setStatus(self, status, messageType = 0, messageNum = 0,
+                   messageText = None, appendedText = None):
+        '''fill the ARStatusList and return messageType'''
+        status = _deref(status)
+        if status is None:
+            return messageType
+        if messageText is None:
+            status.numItems = 0
+        else:
+            array = (self.cars.ARStatusStruct * 1)()
+            array[0].messageType = messageType
+            array[0].messageNum = messageNum
+            array[0].messageText = messageText
+            array[0].appendedText = appendedText
+            status.statusList = array
+            status.numItems = 1
+        return messageType
+
+    def _error(self, status, messageNum, messageText, appendedText = None):
+        return self._setStatus(status, self.cars.AR_RETURN_ERROR,
+                               messageNum, messageText, appendedText)
+
+    def _enter(self, name, status):
+        '''bookkeeping at the start of every call: count the call, wait
+for the latency and return an injected error (or 0)'''
+        self.calls[name] = self.calls.get(name, 0) + 1
+        latency = self.latencies.get(name, self.latency)
+        if latency:
+            time.sleep(latency)
+        if self.serverDown:
+            return self._error(status, ERROR_NETWORK,
+                               'Cannot establish a network connection to the AR System server')
+        if self._injectedErrors.get(name):
+            self._lock.acquire()
+            try:
+                errors = self._injectedErrors.get(name)
+                if errors:
+                    (messageNum, messageText) = errors.pop(0)
+                    return self._error(status, messageNum, messageText)
+            finally:
+                self._lock.release()
+        self._setStatus(status)
+        return 0
+
+    def _form(self, name, status):
+        '''return (form, 0) or (None, error code)'''
+        try:
+            return (self.forms[name], 0)
+        except KeyError:
+            return (None, self._error(status, ERROR_NO_SUCH_FORM,
+                                      'Form does not exist on server', name))
+
+    def _insert(self, form, row, user, entryId = None):
+        now = int(time.time())
+        row = dict(row)
+        if entryId is None:
+            entryId = form.newEntryId()
+        row[1] = entryId
+        row.setdefault(2, user)
+        row.setdefault(3, now)
+        row.setdefault(5, user)
+        row.setdefault(6, now)
+        row.setdefault(7, 0)
+        if entryId not in form.entries:
+            form.order.append(entryId)
+        form.entries[entryId] = row
+        form.changes += 1
+        return entryId
+
+    def _decodeFieldValueList(self, fieldList):
+        '''ARFieldValueList -> {fieldId: value}'''
+        fieldList = _deref(fieldList)
+        if fieldList is None:
+            return {}
+        decoder = self.cars.ARValueStruct._decoder_
+        row = {}
+        for i in range(fieldList.numItems):
+            value = fieldList.fieldValueList[i].value
+            row[fieldList.fieldValueList[i].fieldId] = decoder[value.dataType](value)
+        return row
+
+    def _convertRow(self, form, values):
+        '''convert the values of a new or changed entry to the data types
+of the fields, as the server does (e.g. '42' for an INTEGER field).
+Output: (row, 0, None) or (None, messageNum, messageText) if a value does
+    not match the data type of its field'''
+        cars = self.cars
+        row = {}
+        for (fieldId, value) in values.items():
+            dataType = form.dataTypes.get(fieldId)
+            if value is not None:
+                try:
+                    if dataType in (cars.AR_DATA_TYPE_INTEGER, cars.AR_DATA_TYPE_ENUM,
+                                    cars.AR_DATA_TYPE_TIME, cars.AR_DATA_TYPE_BITMASK,
+                                    cars.AR_DATA_TYPE_ULONG, cars.AR_DATA_TYPE_DATE,
+                                    cars.AR_DATA_TYPE_TIME_OF_DAY,
+                                    cars.AR_DATA_TYPE_KEYWORD):
+                        value = int(value)
+                    elif dataType == cars.AR_DATA_TYPE_REAL:
+                        value = float(value)
+                except (TypeError, ValueError):
+                    return (None, ERROR_DATA_TYPE,
+                            'Value does not match data type: %s' % (fieldId))
+            row[fieldId] = value
+        return (row, 0, None)
+
+    def _decodeEntryId(self, entryIdList):
+        entryIdList = _deref(entryIdList)
+        return '.'.join([entryIdList.entryIdList[i].value
+                         for i in range(entryIdList.numItems)])
+
+    def _setValue(self, valueStruct, value, dataType):
+        '''set an ARValueStruct to a python value of dataType'''
+        cars = self.cars
+        if value is None:
+            valueStruct.dataType = cars.AR_DATA_TYPE_NULL
+            return
+        valueStruct.dataType = dataType
+        if dataType == cars.AR_DATA_TYPE_INTEGER:
+            valueStruct.u.intVal = int(value)
+        elif dataType == cars.AR_DATA_TYPE_REAL:
+            valueStruct.u.realVal = float(value)
+        elif dataType == cars.AR_DATA_TYPE_ENUM:
+            valueStruct.u.enumVal = int(value)
+        elif dataType == cars.AR_DATA_TYPE_TIME:
+            valueStruct.u.timeVal = int(value)
+        elif dataType == cars.AR_DATA_TYPE_DECIMAL:
+            valueStruct.u.decimalVal = str(value)
+        elif dataType == cars.AR_DATA_TYPE_DIARY:
+            valueStruct.u.diaryVal = str(value)
+        elif dataType == cars.AR_DATA_TYPE_BITMASK:
+            valueStruct.u.maskVal = int(value)
+        elif dataType == cars.AR_DATA_TYPE_ULONG:
+            valueStruct.u.ulongVal = int(value)
+        elif dataType == cars.AR_DATA_TYPE_DATE:
+            valueStruct.u.dateVal = int(value)
+        elif dataType == cars.AR_DATA_TYPE_TIME_OF_DAY:
+            valueStruct.u.timeOfDayVal = int(value)
+        elif dataType == cars.AR_DATA_TYPE_KEYWORD:
+            valueStruct.u.keyNum = int(value)
+        else:
+            valueStruct.dataType = cars.AR_DATA_TYPE_CHAR
+            valueStruct.u.charVal = str(value)
+
+    def _fillFieldValueList(self, fieldValueList, form, row, fieldIds):
+        array = (self.cars.ARFieldValueStruct * len(fieldIds))()
+        for i in range(len(fieldIds)):
+            array[i].fieldId = fieldIds[i]
+            self._setValue(array[i].value, row.get(fieldIds[i]),
+                           form.dataTypes.get(fieldIds[i]))
+        fieldValueList.fieldValueList = array
+        fieldValueList.numItems = len(fieldIds)
+
+    def _requestedFieldIds(self, form, idList):
+        '''the fieldIds of an ARInternalIdList (all fields if None)'''
+        idList = _deref(idList)
+        if idList is None:
+            return list(form.fieldIds)
+        return [idList.internalIdList[i] for i in range(idList.numItems)
+                if idList.internalIdList[i] in form.dataTypes]
+
+    def _allocateList(self, listStruct, numItems):
+        '''give an XXXList struct numItems zeroed elements'''
+        (memberName, memberType) = listStruct._fields_[1][:2]
+        setattr(listStruct, memberName, (memberType._type_ * numItems)())
+        listStruct.numItems = numItems
+
+    def _context(self, context):
+        return _deref(context)
+
+##############################################################
+#
+# qualifiers
+#
+
+    _tokenizer = re.compile(r'''\s*(?:(?P<field>'[^']*')|(?P<string>"[^"]*")|
+                                  (?P<number>-?\d+(?:\.\d+)?)|
+                                  (?P<keyword>\$NULL\$)|
+                                  (?P<operator>!=|<=|>=|=|<|>|\(|\)|&&|\|\||!)|
+                                  (?P<word>[A-Za-z]+))''', re.VERBOSE)
+
+    def _tokenize(self, query):
+        tokens = []
+        position = 0
+        query = query.strip()
+        while position < len(query):
+            match = self._tokenizer.match(query, position)
+            if match is None or match.end() == position:
+                raise ValueError('cannot parse qualifier at: %s' % (query[position:]))
+            position = match.end()
+            for kind in ('field', 'string', 'number', 'keyword', 'operator', 'word'):
+                if match.group(kind) is not None:
+                    value = match.group(kind)
+                    if kind == 'word':
+                        value = value.upper()
+                        kind = 'operator'
+                    tokens.append((kind, value))
+                    break
+        return tokens
+
+    def _parseQualifier(self, form, query, qualifier):
+        '''parse query into qualifier (ARQualifierStruct); supports AND, OR,
+NOT, parentheses and the relational operators between 'fields', numbers,
+"strings" and $NULL$. The nodes of the tree are kept alive by the
+qualifier (attribute _nodes).'''
+        cars = self.cars
+        tokens = self._tokenize(query)
+        position = [0]
+        nodes = []
+        def newNode(class_):
+            node = class_()
+            nodes.append(node)
+            return node
+        def peek():
+            if position[0] < len(tokens):
+                return tokens[position[0]]
+            return (None, None)
+        def take():
+            token = peek()
+            position[0] += 1
+            return token
+        def parseBinary(operators, operation, parse):
+            left = parse()
+            while peek() in operators:
+                take()
+                right = parse()
+                node = newNode(cars.ARQualifierStruct)
+                node.operation = operation
+                node.u.andor.operandLeft = pointer(left)
+                node.u.andor.operandRight = pointer(right)
+                left = node
+            return left
+        def parseOr():
+            return parseBinary((('operator', 'OR'), ('operator', '||')),
+                               cars.AR_COND_OP_OR, parseAnd)
+        def parseAnd():
+            return parseBinary((('operator', 'AND'), ('operator', '&&')),
+                               cars.AR_COND_OP_AND, parseNot)
+        def parseNot():
+            if peek() in (('operator', 'NOT'), ('operator', '!')):
+                take()
+                operand = parseNot()
+                node = newNode(cars.ARQualifierStruct)
+                node.operation = cars.AR_COND_OP_NOT
+                node.u.notQual = pointer(operand)
+                return node
+            elif peek() == ('operator', '('):
+                take()
+                node = parseOr()
+                if take() != ('operator', ')'):
+                    raise ValueError('missing )')
+                return node
+            return parseRelOp()
+        relOps = {'=': cars.AR_REL_OP_EQUAL, '!=': cars.AR_REL_OP_NOT_EQUAL,
+                  '<': cars.AR_REL_OP_LESS, '<=': cars.AR_REL_OP_LESS_EQUAL,
+                  '>': cars.AR_REL_OP_GREATER, '>=': cars.AR_REL_OP_GREATER_EQUAL,
+                  'LIKE': cars.AR_REL_OP_LIKE}
+        def parseOperand(operand):
+            (kind, value) = take()
+            if kind == 'field':
+                fieldId = form.fieldId(value[1:-1])
+                if fieldId is None:
+                    raise ValueError('unknown field %s' % (value))
+                operand.tag = cars.AR_FIELD
+                operand.u.fieldId = fieldId
+                return
+            operand.tag = cars.AR_VALUE
+            if kind == 'string':
+                self._setValue(operand.u.value, value[1:-1], cars.AR_DATA_TYPE_CHAR)
+            elif kind == 'number' and '.' in value:
+                self._setValue(operand.u.value, float(value), cars.AR_DATA_TYPE_REAL)
+            elif kind == 'number':
+                self._setValue(operand.u.value, int(value), cars.AR_DATA_TYPE_INTEGER)
+            elif kind == 'keyword':
+                self._setValue(operand.u.value, None, cars.AR_DATA_TYPE_NULL)
+            else:
+                raise ValueError('unexpected %s' % (value))
+        def parseRelOp():
+            relOp = newNode(cars.ARRelOpStruct)
+            parseOperand(relOp.operandLeft)
+            (kind, value) = take()
+            if kind != 'operator' or value not in relOps:
+                raise ValueError('unknown operator %s' % (value))
+            relOp.operation = relOps[value]
+            parseOperand(relOp.operandRight)
+            node = newNode(cars.ARQualifierStruct)
+            node.operation = cars.AR_COND_OP_REL_OP
+            node.u.relOp = pointer(relOp)
+            return node
+        root = parseOr()
+        if position[0] != len(tokens):
+            raise ValueError('unexpected %s' % (peek()[1]))
+        pointer(qualifier)[0] = root
+        qualifier._nodes = nodes
+
+    def _compileOperand(self, operand):
+        '''return a function row -> value of the operand'''
+        cars = self.cars
+        if operand.tag == cars.AR_FIELD:
+            fieldId = operand.u.fieldId
+            return lambda row: row.get(fieldId)
+        elif operand.tag == cars.AR_VALUE:
+            value = operand.u.value
+            value = cars.ARValueStruct._decoder_[value.dataType](value)
+            return lambda row: value
+        elif operand.tag == cars.AR_ARITH:
+            arithOp = operand.u.arithOp.contents
+            right = self._compileOperand(arithOp.operandRight)
+            if arithOp.operation == cars.AR_ARITH_OP_NEGATE:
+                def negate(row):
+                    value = right(row)
+                    return value is not None and -value or None
+                return negate
+            left = self._compileOperand(arithOp.operandLeft)
+            function = {cars.AR_ARITH_OP_ADD: lambda a, b: a + b,
+                        cars.AR_ARITH_OP_SUBTRACT: lambda a, b: a - b,
+                        cars.AR_ARITH_OP_MULTIPLY: lambda a, b: a * b,
+                        cars.AR_ARITH_OP_DIVIDE: lambda a, b: a / b,
+                        cars.AR_ARITH_OP_MODULO: lambda a, b: a % b}[arithOp.operation]
+            def arith(row):
+                (a, b) = (left(row), right(row))
+                if a is None or b is None:
+                    return None
+                return function(a, b)
+            return arith
+        raise ValueError('unsupported operand tag %d' % (operand.tag))
+
+    def _like(self, value, pattern):
+        if value is None or pattern is None:
+            return False
+        expression = ''.join([{'%': '.*', '_': '.'}.get(c, re.escape(c))
+                              for c in str(pattern)])
+        return re.match('^%s$' % (expression), str(value), re.DOTALL) is not None
+
+    def _compileQualifier(self, qualifier):
+        '''translate an ARQualifierStruct into a function row -> boolean'''
+        cars = self.cars
+        operation = qualifier.operation
+        if operation == cars.AR_COND_OP_NONE:
+            return lambda row: True
+        elif operation in (cars.AR_COND_OP_AND, cars.AR_COND_OP_OR):
+            left = self._compileQualifier(qualifier.u.andor.operandLeft.contents)
+            right = self._compileQualifier(qualifier.u.andor.operandRight.contents)
+            if operation == cars.AR_COND_OP_AND:
+                return lambda row: left(row) and right(row)
+            return lambda row: left(row) or right(row)
+        elif operation == cars.AR_COND_OP_NOT:
+            operand = self._compileQualifier(qualifier.u.notQual.contents)
+            return lambda row: not operand(row)
+        elif operation == cars.AR_COND_OP_REL_OP:
+            relOp = qualifier.u.relOp.contents
+            left = self._compileOperand(relOp.operandLeft)
+            right = self._compileOperand(relOp.operandRight)
+            if relOp.operation == cars.AR_REL_OP_EQUAL:
+                return lambda row: left(row) == right(row)
+            elif relOp.operation == cars.AR_REL_OP_NOT_EQUAL:
+                return lambda row: left(row) != right(row)
+            elif relOp.operation == cars.AR_REL_OP_LIKE:
+                return lambda row: self._like(left(row), right(row))
+            compare = {cars.AR_REL_OP_LESS: lambda a, b: a < b,
+                       cars.AR_REL_OP_LESS_EQUAL: lambda a, b: a <= b,
+                       cars.AR_REL_OP_GREATER: lambda a, b: a > b,
+                       cars.AR_REL_OP_GREATER_EQUAL: lambda a, b: a >= b}.get(relOp.operation)
+            if compare is not None:
+                def relation(row):
+                    (a, b) = (left(row), right(row))
+                    if a is None or b is None:
+                        return False
+                    return compare(a, b)
+                return relation
+        raise ValueError('unsupported qualifier operation %d' % (operation))
+
+    def _signature(self, qualifier):
+        '''a hashable description of an ARQualifierStruct'''
+        cars = self.cars
+        def operand(operand):
+            if operand.tag == cars.AR_FIELD:
+                return ('field', operand.u.fieldId)
+            elif operand.tag == cars.AR_VALUE:
+                value = operand.u.value
+                return ('value', value.dataType,
+                        cars.ARValueStruct._decoder_[value.dataType](value))
+            elif operand.tag == cars.AR_ARITH:
+                arithOp = operand.u.arithOp.contents
+                return ('arith', arithOp.operation, operand(arithOp.operandLeft),
+                        operand(arithOp.operandRight))
+            raise ValueError('unsupported operand tag %d' % (operand.tag))
+        operation = qualifier.operation
+        if operation in (cars.AR_COND_OP_AND, cars.AR_COND_OP_OR):
+            return (operation, self._signature(qualifier.u.andor.operandLeft.contents),
+                    self._signature(qualifier.u.andor.operandRight.contents))
+        elif operation == cars.AR_COND_OP_NOT:
+            return (operation, self._signature(qualifier.u.notQual.contents))
+        elif operation == cars.AR_COND_OP_REL_OP:
+            relOp = qualifier.u.relOp.contents
+            return (operation, relOp.operation, operand(relOp.operandLeft),
+                    operand(relOp.operandRight))
+        return (operation, )
+
+    def _select(self, form, qualifier, sortList = None):
+        '''return the entryIds of form that match qualifier, sorted by sortList.
+Like the database of a server, the fake does not evaluate the same query 
+again for every page: the result is kept until the entries of the form
+change.'''
+        qualifier = _deref(qualifier)
+        sortList = _deref(sortList)
+        key = (qualifier is not None and self._signature(qualifier) or None,
+               sortList is not None and tuple([(sortList.sortList[i].fieldId,
+                                                sortList.sortList[i].sortOrder)
+                                               for i in range(sortList.numItems)]) or None)
+        (changes, entryIds) = form.selections.get(key, (None, None))
+        if changes == form.changes:
+            return entryIds
+        entryIds = self._evaluate(form, qualifier, sortList)
+        if len(form.selections) >= 64:
+            form.selections.clear()
+        form.selections[key] = (form.changes, entryIds)
+        return entryIds
+
+    def _evaluate(self, form, qualifier, sortList):
+        if qualifier is None:
+            entryIds = list(form.order)
+        else:
+            matches = self._compileQualifier(qualifier)
+            entries = form.entries
+            entryIds = [entryId for entryId in form.order if matches(entries[entryId])]
+        if sortList is not None:
+            # sort by the last key first, so that the first key wins
+            for i in reversed(range(sortList.numItems)):
+                fieldId = sortList.sortList[i].fieldId
+                entryIds.sort(key = lambda entryId: form.entries[entryId].get(fieldId),
+                              reverse = sortList.sortList[i].sortOrder == self.cars.AR_SORT_DESCENDING)
+        return entryIds
+
+##############################################################
+#
+# the entry points of the arapi
+#
+
+    def ARInitialization(self, context, status):
+        return self._enter('ARInitialization', status)
+
+    def ARTermination(self, context, status):
+        error = self._enter('ARTermination', status)
+        self._bulkTransactions.pop(id(self._context(context)), None)
+        return error
+
+    def ARSetServerPort(self, context, server, port, rpcProgNum, status):
+        return self._enter('ARSetServerPort', status)
+
+    def ARVerifyUser(self, context, adminFlag, subAdminFlag, customFlag, status):
+        error = self._enter('ARVerifyUser', status)
+        if error:
+            return error
+        for flag in (adminFlag, subAdminFlag, customFlag):
+            flag = _deref(flag)
+            if flag is not None:
+                flag.value = 1
+        return 0
+
+    def ARGetListSchema(self, context, *args):
+        '''(changedSince, schemaType, name, fieldIdList, [objPropList], nameList, status)'''
+        error = self._enter('ARGetListSchema', args[-1])
+        if error:
+            return error
+        nameList = _deref(args[-2])
+        names = sorted(self.forms.keys())
+        self._allocateList(nameList, len(names))
+        for i in range(len(names)):
+            nameList.nameList[i].value = names[i]
+        return 0
+
+    def ARGetListField(self, context, schema, fieldType, changedSince, *args):
+        '''(..., [objPropList], idList, status)'''
+        error = self._enter('ARGetListField', args[-1])
+        if error:
+            return error
+        (form, error) = self._form(schema, args[-1])
+        if error:
+            return error
+        idList = _deref(args[-2])
+        if fieldType & self.cars.AR_FIELD_TYPE_DATA:
+            fieldIds = form.fieldIds
+        else:
+            fieldIds = []
+        self._allocateList(idList, len(fieldIds))
+        for i in range(len(fieldIds)):
+            idList.internalIdList[i] = fieldIds[i]
+        return 0
+
+    def ARGetMultipleFields(self, context, schema, idList, existList, fieldId2,
+                            fieldName, fieldMap, dataType, option, createMode, *args):
+        '''the arguments after createMode depend on the version; they are
+filled with empty elements'''
+        status = args[-1]
+        error = self._enter('ARGetMultipleFields', status)
+        if error:
+            return error
+        (form, error) = self._form(schema, status)
+        if error:
+            return error
+        idList = _deref(idList)
+        if idList is None:
+            fieldIds = list(form.fieldIds)
+        else:
+            fieldIds = [idList.internalIdList[i] for i in range(idList.numItems)]
+        numItems = len(fieldIds)
+        for listStruct in (existList, fieldId2, fieldName, fieldMap, dataType,
+                           option, createMode) + args[:-1]:
+            listStruct = _deref(listStruct)
+            if listStruct is not None:
+                self._allocateList(listStruct, numItems)
+        (existList, fieldId2, fieldName, dataType, option, createMode) = [
+                    _deref(argument) for argument in (existList, fieldId2, fieldName,
+                                                      dataType, option, createMode)]
+        names = dict([(field[0], field[1]) for field in form.fields])
+        for i in range(numItems):
+            fieldId = fieldIds[i]
+            exists = fieldId in form.dataTypes
+            existList.booleanList[i] = exists
+            if not exists:
+                continue
+            if fieldId2 is not None:
+                fieldId2.internalIdList[i] = fieldId
+            if fieldName is not None:
+                fieldName.nameList[i].value = names[fieldId]
+            if dataType is not None:
+                dataType.intList[i] = form.dataTypes[fieldId]
+            if option is not None:
+                if fieldId in (1, 3, 6):
+                    option.intList[i] = self.cars.AR_FIELD_OPTION_SYSTEM
+                else:
+                    option.intList[i] = self.cars.AR_FIELD_OPTION_OPTIONAL
+            if createMode is not None:
+                createMode.intList[i] = 1
+        return 0
+
+    def ARLoadARQualifierStruct(self, context, schema, displayTag, qualString,
+                                qualifier, status):
+        error = self._enter('ARLoadARQualifierStruct', status)
+        if error:
+            return error
+        (form, error) = self._form(schema, status)
+        if error:
+            return error
+        qualifier = _deref(qualifier)
+        if not qualString or not qualString.strip():
+            qualifier.operation = self.cars.AR_COND_OP_NONE
+            return 0
+        try:
+            self._parseQualifier(form, qualString, qualifier)
+        except (ValueError, KeyError):
+            return self._error(status, ERROR_QUALIFIER, 'Error in qualification',
+                               qualString)
+        return 0
+
+    def ARGetListEntryWithFields(self, context, schema, query, getListFields,
+                                 sortList, firstRetrieve, maxRetrieve, *args):
+        '''(..., [useLocale], entryList, numMatches, status)'''
+        status = args[-1]
+        error = self._enter('ARGetListEntryWithFields', status)
+        if error:
+            return error
+        (form, error) = self._form(schema, status)
+        if error:
+            return error
+        entryList = _deref(args[-3])
+        numMatches = _deref(args[-2])
+        self._lock.acquire()
+        try:
+            try:
+                entryIds = self._select(form, query, sortList)
+            except ValueError:
+                return self._error(status, ERROR_QUALIFIER, 'Error in qualification')
+            getListFields = _deref(getListFields)
+            if getListFields is None:
+                fieldIds = list(form.fieldIds)
+            else:
+                fieldIds = [getListFields.fieldsList[i].fieldId
+                            for i in range(getListFields.numItems)]
+            if numMatches is not None:
+                numMatches.value = len(entryIds)
+            entryIds = entryIds[firstRetrieve:]
+            if maxRetrieve:
+                entryIds = entryIds[:maxRetrieve]
+            self._allocateList(entryList, len(entryIds))
+            for i in range(len(entryIds)):
+                entry = entryList.entryList[i]
+                ids = (self.cars.AREntryIdType * 1)()
+                ids[0].value = entryIds[i]
+                entry.entryId.entryIdList = ids
+                entry.entryId.numItems = 1
+                fieldValueList = self.cars.ARFieldValueList()
+                self._fillFieldValueList(fieldValueList, form,
+                                         form.entries[entryIds[i]], fieldIds)
+                entry.entryValues = pointer(fieldValueList)
+        finally:
+            self._lock.release()
+        return 0
+
+    def ARGetEntry(self, context, schema, entryId, idList, fieldList, status):
+        error = self._enter('ARGetEntry', status)
+        if error:
+            return error
+        (form, error) = self._form(schema, status)
+        if error:
+            return error
+        entryId = self._decodeEntryId(entryId)
+        self._lock.acquire()
+        try:
+            if entryId not in form.entries:
+                return self._error(status, ERROR_NO_SUCH_ENTRY,
+                                   'Entry does not exist in database', entryId)
+            self._fillFieldValueList(_deref(fieldList), form, form.entries[entryId],
+                                     self._requestedFieldIds(form, idList))
+        finally:
+            self._lock.release()
+        return 0
+
+    def ARGetMultipleEntries(self, context, schema, entryIdList, idList,
+                             existList, fieldList, status):
+        error = self._enter('ARGetMultipleEntries', status)
+        if error:
+            return error
+        (form, error) = self._form(schema, status)
+        if error:
+            return error
+        entryIdList = _deref(entryIdList)
+        existList = _deref(existList)
+        fieldList = _deref(fieldList)
+        numItems = entryIdList.numItems
+        fieldIds = self._requestedFieldIds(form, idList)
+        self._allocateList(existList, numItems)
+        self._allocateList(fieldList, numItems)
+        self._lock.acquire()
+        try:
+            for i in range(numItems):
+                entryId = self._decodeEntryId(entryIdList.entryIdList[i])
+                row = form.entries.get(entryId)
+                existList.booleanList[i] = row is not None
+                if row is not None:
+                    self._fillFieldValueList(fieldList.valueListList[i], form,
+                                             row, fieldIds)
+        finally:
+            self._lock.release()
+        return 0
+
+    def ARGetEntryStatistics(self, context, schema, qualifier, target, statistic,
+                             groupByList, results, status):
+        '''supports AR_STAT_OP_COUNT, _SUM, _AVERAGE, _MINIMUM and _MAXIMUM
+without groupByList; target has to be a field'''
+        cars = self.cars
+        error = self._enter('ARGetEntryStatistics', status)
+        if error:
+            return error
+        (form, error) = self._form(schema, status)
+        if error:
+            return error
+        if _deref(groupByList) is not None and _deref(groupByList).numItems > 0:
+            return self._error(status, ERROR_NOT_IMPLEMENTED,
+                               'fake arapi: groupByList is not supported')
+        self._lock.acquire()
+        try:
+            try:
+                entryIds = self._select(form, qualifier)
+            except ValueError:
+                return self._error(status, ERROR_QUALIFIER, 'Error in qualification')
+            target = _deref(target)
+            values = []
+            dataType = cars.AR_DATA_TYPE_INTEGER
+            if target is not None and target.tag == cars.AR_FIELD:
+                dataType = form.dataTypes.get(target.u.fieldId, dataType)
+                values = [form.entries[entryId].get(target.u.fieldId)
+                          for entryId in entryIds]
+                values = [value for value in values if value is not None]
+        finally:
+            self._lock.release()
+        if statistic == cars.AR_STAT_OP_COUNT:
+            (result, dataType) = (len(entryIds), cars.AR_DATA_TYPE_INTEGER)
+        elif not values:
+            result = None
+        elif statistic == cars.AR_STAT_OP_SUM:
+            result = sum(values)
+        elif statistic == cars.AR_STAT_OP_AVERAGE:
+            (result, dataType) = (float(sum(values)) / len(values), cars.AR_DATA_TYPE_REAL)
+        elif statistic == cars.AR_STAT_OP_MINIMUM:
+            result = min(values)
+        elif statistic == cars.AR_STAT_OP_MAXIMUM:
+            result = max(values)
+        else:
+            return self._error(status, ERROR_NOT_IMPLEMENTED,
+                               'fake arapi: statistic %d is not supported' % (statistic))
+        results = _deref(results)
+        self._allocateList(results, 1)
+        self._setValue(results.resultList[0].result, result, dataType)
+        return 0
+
+##############################################################
+#
+# entry points that change entries; in a bulk entry transaction, the
+# calls are queued until AREndBulkEntryTransaction
+#
+
+    def _queueOrRun(self, context, status, operation, callType):
+        '''operation() returns (entryId, messageNum, messageText); it is
+executed now or queued in the bulk transaction of the context
+(callType is the AR_BULK_ENTRY_* type of the call)'''
+        context = self._context(context)
+        queue = self._bulkTransactions.get(id(context))
+        if queue is not None:
+            queue.append((callType, operation))
+            return (None, 0)
+        self._lock.acquire()
+        try:
+            (entryId, messageNum, messageText) = operation()
+        finally:
+            self._lock.release()
+        if messageNum:
+            return (None, self._error(status, messageNum, messageText))
+        return (entryId, 0)
+
+    def ARCreateEntry(self, context, schema, fieldList, entryId, status):
+        error = self._enter('ARCreateEntry', status)
+        if error:
+            return error
+        (form, error) = self._form(schema, status)
+        if error:
+            return error
+        values = self._decodeFieldValueList(fieldList)
+        user = self._context(context).user
+        def create():
+            (row, messageNum, messageText) = self._convertRow(form, values)
+            if messageNum:
+                return (None, messageNum, messageText)
+            newEntryId = row.get(1)
+            if newEntryId is not None and newEntryId in form.entries:
+                return (None, ERROR_DUPLICATE_ENTRY,
+                        'The value(s) for this entry violate a unique index')
+            return (self._insert(form, row, user, newEntryId), 0, None)
+        (newEntryId, error) = self._queueOrRun(context, status, create,
+                                               self.cars.AR_BULK_ENTRY_CREATE)
+        if newEntryId is not None:
+            _deref(entryId).value = newEntryId
+        return error
+
+    def ARSetEntry(self, context, schema, entryIdList, fieldList, getTime, option,
+                   status):
+        error = self._enter('ARSetEntry', status)
+        if error:
+            return error
+        (form, error) = self._form(schema, status)
+        if error:
+            return error
+        entryId = self._decodeEntryId(entryIdList)
+        values = self._decodeFieldValueList(fieldList)
+        user = self._context(context).user
+        def set_():
+            (newValues, messageNum, messageText) = self._convertRow(form, values)
+            if messageNum:
+                return (None, messageNum, messageText)
+            row = form.entries.get(entryId)
+            if row is None:
+                return (None, ERROR_NO_SUCH_ENTRY, 'Entry does not exist in database')
+            if getTime and row.get(6, 0) > getTime:
+                return (None, ERROR_ENTRY_MODIFIED,
+                        'The entry has been modified since it was retrieved')
+            row.update(newValues)
+            form.changes += 1
+            row[5] = user
+            row[6] = max(int(time.time()), row.get(6, 0))
+            return (entryId, 0, None)
+        return self._queueOrRun(context, status, set_,
+                                self.cars.AR_BULK_ENTRY_SET)[1]
+
+    def ARDeleteEntry(self, context, schema, entryIdList, option, status):
+        error = self._enter('ARDeleteEntry', status)
+        if error:
+            return error
+        (form, error) = self._form(schema, status)
+        if error:
+            return error
+        entryId = self._decodeEntryId(entryIdList)
+        def delete():
+            if form.entries.pop(entryId, None) is None:
+                return (None, ERROR_NO_SUCH_ENTRY, 'Entry does not exist in database')
+            form.order.remove(entryId)
+            form.changes += 1
+            return (entryId, 0, None)
+        return self._queueOrRun(context, status, delete,
+                                self.cars.AR_BULK_ENTRY_DELETE)[1]
+
+    def ARMergeEntry(self, context, schema, fieldList, mergeType, *args):
+        '''(..., [query, multimatchOption], entryId, status); the duplicate
+handling is decided on field 1 (Request ID)'''
+        cars = self.cars
+        (entryId, status) = args[-2:]
+        error = self._enter('ARMergeEntry', status)
+        if error:
+            return error
+        (form, error) = self._form(schema, status)
+        if error:
+            return error
+        values = self._decodeFieldValueList(fieldList)
+        user = self._context(context).user
+        mergeType = mergeType & 0x0f
+        def merge():
+            (row, messageNum, messageText) = self._convertRow(form, values)
+            if messageNum:
+                return (None, messageNum, messageText)
+            existingId = row.get(1)
+            if existingId is None or existingId not in form.entries:
+                return (self._insert(form, row, user, existingId), 0, None)
+            if mergeType == cars.AR_MERGE_ENTRY_DUP_ERROR:
+                return (None, ERROR_DUPLICATE_ENTRY,
+                        'The value(s) for this entry violate a unique index')
+            elif mergeType in (cars.AR_MERGE_ENTRY_DUP_NEW_ID, cars.AR_MERGE_ENTRY_GEN_NEW_ID):
+                newRow = dict(row)
+                del newRow[1]
+                return (self._insert(form, newRow, user), 0, None)
+            elif mergeType == cars.AR_MERGE_ENTRY_DUP_OVERWRITE:
+                return (self._insert(form, row, user, existingId), 0, None)
+            form.entries[existingId].update(row)
+            form.changes += 1
+            return (existingId, 0, None)
+        (newEntryId, error) = self._queueOrRun(context, status, merge,
+                                               self.cars.AR_BULK_ENTRY_MERGE)
+        if newEntryId is not None:
+            _deref(entryId).value = newEntryId
+        return error
+
+    def ARBeginBulkEntryTransaction(self, context, status):
+        error = self._enter('ARBeginBulkEntryTransaction', status)
+        if error:
+            return error
+        context = self._context(context)
+        if id(context) in self._bulkTransactions:
+            return self._error(status, ERROR_BULK_TRANSACTION,
+                               'a bulk entry transaction has already been started')
+        self._bulkTransactions[id(context)] = []
+        return 0
+
+    def AREndBulkEntryTransaction(self, context, actionType, returnList, status):
+        cars = self.cars
+        error = self._enter('AREndBulkEntryTransaction', status)
+        queue = self._bulkTransactions.pop(id(self._context(context)), None)
+        if error:
+            return error
+        if queue is None:
+            return self._error(status, ERROR_NOT_IMPLEMENTED,
+                               'no bulk entry transaction has been started')
+        returnList = _deref(returnList)
+        if actionType != cars.AR_BULK_ENTRY_ACTION_SEND:
+            self._allocateList(returnList, 0)
+            return 0
+        self._allocateList(returnList, len(queue))
+        self._lock.acquire()
+        try:
+            # the transaction is rolled back if one of the calls fails
+            saved = dict([(name, (dict([(entryId, dict(row)) for (entryId, row) in form.entries.items()]),
+                                  list(form.order), form.nextId))
+                          for (name, form) in self.forms.items()])
+            failed = False
+            for i in range(len(queue)):
+                (callType, operation) = queue[i]
+                (entryId, messageNum, messageText) = operation()
+                entryReturn = returnList.entryReturnList[i]
+                entryReturn.entryCallType = callType
+                if callType in (cars.AR_BULK_ENTRY_CREATE, cars.AR_BULK_ENTRY_MERGE):
+                    # createEntryReturn and mergeEntryReturn share the layout
+                    entryStatus = entryReturn.u.createEntryReturn.status
+                    if entryId is not None:
+                        entryReturn.u.createEntryReturn.entryId = entryId
+                else:
+                    entryStatus = entryReturn.u.setEntryReturn
+                if messageNum:
+                    failed = True
+                    self._setStatus(entryStatus, cars.AR_RETURN_ERROR,
+                                    messageNum, messageText)
+            if failed:
+                for (name, (entries, order, nextId)) in saved.items():
+                    form = self.forms[name]
+                    (form.entries, form.order, form.nextId) = (entries, order, nextId)
+                    form.changes += 1
+                return self._error(status, ERROR_ROLLED_BACK,
+                                   'The bulk entry transaction has been rolled back')
+        finally:
+            self._lock.release()
+        return 0
+
+    def __getattr__(self, name):
+        '''Free* functions do nothing (the memory belongs to python); other
+AR* functions fail with an error status'''
+        if name.startswith('Free'):
+            def free(obj, freeStruct = False):
+                self.calls[name] = self.calls.get(name, 0) + 1
+                return 0
+            return free
+        if name.startswith('AR'):
+            def notImplemented(*args):
+                error = self._enter(name, args and args[-1] or None)
+                if error:
+                    return error
+                return self._error(args and args[-1] or None, ERROR_NOT_IMPLEMENTED,
+                                   'fake arapi: %s is not implemented' % (name))
+            return notImplemented
+        raise AttributeError(name)
+
+def install(arapi = None):
+    '''install makes the fake the arapi of cars; sessions that are created
+afterwards use it.
+Input: (optional) arapi (FakeArapi, default: a new FakeArapi)
+Output: the installed FakeArapi'''
+    from pyars import cars
+    if arapi is None:
+        arapi = FakeArapi(cars)
+    cars.arapi = arapi
+    return arapi
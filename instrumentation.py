@@ -0,0 +1,375 @@
+#######################################################################
+#
+# This is the instrumentation of pyars.
+# (C) 2004-2015 by Ergorion
+#
+# Instrumentation measures every call of the arapi (and cmdbapi) of a
+# session: the wall time spent in the C function and its return code.
+# In addition, the public methods of the session (e.g. ARGetEntry or
+# GetListEntryWithFields) are timed; the time of such a call minus the
+# time spent in C is the time pyars needed for the conversions, so that
+# the latency of the server can be told apart from the cost on the client.
+# The durations are counted in LatencyHistograms (per function) and can
+# be handed to callbacks (one CallRecord per call).
+#
+# Instrumentation is off by default; then the session calls the arapi
+# directly and there is no overhead at all. It is switched on per session
+# with session.enableInstrumentation() or for all sessions that are
+# created afterwards with instrumentation.enable().
+#
+
+import sys
+import threading
+import time
+
+if hasattr(time, 'perf_counter'): # python 3.3 and later
+    timer = time.perf_counter
+elif sys.platform == 'win32':
+    timer = time.clock
+else:
+    timer = time.time
+
+class LatencyHistogram(object):
+    '''LatencyHistogram counts durations (in microseconds) in the style of
+HdrHistogram: values below 2**subBucketBits are counted exactly, larger
+values in buckets whose width grows with the magnitude of the value; so
+every value is recorded with a relative error below 2**-subBucketBits
+(less than 1% with the default), while the memory stays small.'''
+
+    def __init__(self, subBucketBits = 7):
+        self.subBucketBits = subBucketBits
+        # lowest value of the bucket -> number of values
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _bucket(self, value):
+        '''return the lowest and the highest value of the bucket of value'''
+        shift = value.bit_length() - self.subBucketBits - 1
+        if shift <= 0:
+            return (value, value)
+        lowest = (value >> shift) << shift
+        return (lowest, lowest + (1 << shift) - 1)
+
+    def record(self, seconds):
+        '''record a duration given in seconds'''
+        value = int(seconds * 1000000)
+        if value < 0:
+            value = 0
+        lowest = self._bucket(value)[0]
+        self.counts[lowest] = self.counts.get(lowest, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        '''add the values of another LatencyHistogram'''
+        for (lowest, count) in other.counts.items():
+            self.counts[lowest] = self.counts.get(lowest, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def percentile(self, percent):
+        '''return the value (in microseconds) below which percent of the
+recorded values are, or None if nothing has been recorded'''
+        if not self.count:
+            return None
+        limit = self.count * percent / 100.0
+        seen = 0
+        for lowest in sorted(self.counts.keys()):
+            seen += self.counts[lowest]
+            if seen >= limit:
+                return min(self._bucket(lowest)[1], self.max)
+        return self.max
+
+    def mean(self):
+        if not self.count:
+            return None
+        return float(self.total) / self.count
+
+    def summary(self, percents = (50, 90, 99, 99.9)):
+        '''return a dictionary with count, min, mean, max and the percentiles
+(all durations in microseconds)'''
+        result = {'count': self.count,
+                  'min': self.min,
+                  'mean': self.mean(),
+                  'max': self.max}
+        for percent in percents:
+            result['p%s' % (percent)] = self.percentile(percent)
+        return result
+
+class CallRecord(object):
+    '''CallRecord describes one instrumented call:
+kind: 'arapi' or 'cmdbapi' for a call of a C function,
+      'method' for a call of a method of the session
+name: name of the function or method
+server: the server of the context of the session (if known)
+cTime: seconds spent in C
+pythonTime: seconds spent in python (always 0 for C functions)
+returnCode: return code of the C function, errnr of the session for methods
+rows: number of rows of the result of a method (None if unknown)
+calls: number of C functions that a method called'''
+
+    __slots__ = ('kind', 'name', 'server', 'cTime', 'pythonTime', 'returnCode',
+                 'rows', 'calls')
+
+    def __init__(self, kind, name, server, cTime, pythonTime, returnCode,
+                 rows = None, calls = 1):
+        self.kind = kind
+        self.name = name
+        self.server = server
+        self.cTime = cTime
+        self.pythonTime = pythonTime
+        self.returnCode = returnCode
+        self.rows = rows
+        self.calls = calls
+
+    def __repr__(self):
+        return 'CallRecord(%s %s: c %.6f s, python %.6f s, return code %s, rows %s)' % (
+                    self.kind, self.name, self.cTime, self.pythonTime,
+                    self.returnCode, self.rows)
+
+def countRows(result):
+    '''guess the number of rows of the result of a method: the length of
+lists and dictionaries, or of the first element of a tuple such as
+(entries, numMatches); the numItems of ctypes lists'''
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    if isinstance(result, (list, dict)):
+        return len(result)
+    return getattr(result, 'numItems', None)
+
+def sessionServer(session):
+    '''the server of the context of session (or None)'''
+    return getattr(getattr(session, 'context', None), 'server', None)
+
+class InstrumentedLibrary(object):
+    '''InstrumentedLibrary stands in for the arapi (or cmdbapi) of a session
+and times every function that is called through it.'''
+
+    def __init__(self, library, instrumentation, session, kind):
+        self._library = library
+        self._instrumentation = instrumentation
+        self._session = session
+        self._kind = kind
+
+    def __getattr__(self, name):
+        function = getattr(self._library, name)
+        if not callable(function):
+            return function
+        wrapper = self._instrumentation._wrapFunction(self._session, self._kind,
+                                                      name, function)
+        # the next lookup finds the wrapper without calling __getattr__
+        setattr(self, name, wrapper)
+        return wrapper
+
+class Instrumentation(object):
+    '''Instrumentation collects the durations of the calls of one or more
+sessions: histograms per (kind, name) for the time in C, and per method
+also for the time in python; callbacks are called with a CallRecord after
+every call.'''
+
+    # the libraries of a session that are instrumented
+    libraries = ('arapi', 'cmdbapi')
+
+    def __init__(self, callbacks = None, histograms = True):
+        '''Input: (optional) callbacks (list of functions that are called with
+                  a CallRecord, default: None)
+       (optional) histograms (record the durations in histograms, default: True)'''
+        self.callbacks = list(callbacks or [])
+        self.histograms = histograms
+        # (kind, name) -> {'c': LatencyHistogram, 'python': LatencyHistogram}
+        self._histograms = {}
+        # number of calls and sum of the return codes > 1 per (kind, name)
+        self._errors = {}
+        self._lock = threading.Lock()
+        # per thread: the method that is running and the time it spent in C
+        self._state = threading.local()
+
+    def addCallback(self, callback):
+        self.callbacks.append(callback)
+
+    def removeCallback(self, callback):
+        self.callbacks.remove(callback)
+
+    def attach(self, session):
+        '''attach wraps the libraries and the public methods of session;
+methods are those attributes of the class that are callable and start
+with an upper case letter.'''
+        if getattr(session, '_instrumentation', None) is not None:
+            self.detach(session)
+        for attribute in self.libraries:
+            library = session.__dict__.get(attribute)
+            if library is not None:
+                setattr(session, attribute,
+                        InstrumentedLibrary(library, self, session, attribute))
+        for name in dir(session.__class__):
+            if not name[:1].isupper():
+                continue
+            method = getattr(session.__class__, name, None)
+            if callable(method) and not isinstance(method, type):
+                wrapper = self._wrapMethod(session, name, getattr(session, name))
+                # another wrapper of the method (see resilience.py), that
+                # detach puts back
+                wrapper._previous = session.__dict__.get(name)
+                setattr(session, name, wrapper)
+        session._instrumentation = self
+
+    def detach(self, session):
+        '''detach restores the libraries and methods of session'''
+        for attribute in self.libraries:
+            library = session.__dict__.get(attribute)
+            if isinstance(library, InstrumentedLibrary):
+                setattr(session, attribute, library._library)
+        for name in list(session.__dict__.keys()):
+            method = session.__dict__[name]
+            if getattr(method, '_instrumented', False):
+                if method._previous is not None:
+                    session.__dict__[name] = method._previous
+                else:
+                    del session.__dict__[name]
+        session._instrumentation = None
+
+    def _wrapFunction(self, session, kind, name, function):
+        state = self._state
+        def wrapper(*args):
+            start = timer()
+            returnCode = function(*args)
+            duration = timer() - start
+            if getattr(state, 'depth', 0):
+                state.cTime += duration
+                state.calls += 1
+            self.record(CallRecord(kind, name, sessionServer(session),
+                                   duration, 0.0, returnCode))
+            return returnCode
+        return wrapper
+
+    def _wrapMethod(self, session, name, method):
+        state = self._state
+        def wrapper(*args, **kwargs):
+            if getattr(state, 'depth', 0):
+                # only the outermost method is recorded
+                state.depth += 1
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    state.depth -= 1
+            state.depth = 1
+            state.cTime = 0.0
+            state.calls = 0
+            result = None
+            start = timer()
+            try:
+                result = method(*args, **kwargs)
+                return result
+            finally:
+                duration = timer() - start
+                state.depth = 0
+                self.record(CallRecord('method', name, sessionServer(session),
+                                       state.cTime, max(duration - state.cTime, 0.0),
+                                       getattr(session, 'errnr', None),
+                                       countRows(result), state.calls))
+        wrapper._instrumented = True
+        wrapper.__name__ = name
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    def record(self, record):
+        '''count record in the histograms and hand it to the callbacks'''
+        if self.histograms:
+            key = (record.kind, record.name)
+            self._lock.acquire()
+            try:
+                try:
+                    histograms = self._histograms[key]
+                except KeyError:
+                    histograms = self._histograms[key] = {'c': LatencyHistogram(),
+                                                          'python': LatencyHistogram()}
+                histograms['c'].record(record.cTime)
+                if record.kind == 'method':
+                    histograms['python'].record(record.pythonTime)
+                if record.returnCode is not None and record.returnCode > 1:
+                    self._errors[key] = self._errors.get(key, 0) + 1
+            finally:
+                self._lock.release()
+        for callback in self.callbacks:
+            callback(record)
+
+    def histogram(self, name, kind = 'arapi', part = 'c'):
+        '''return the LatencyHistogram of a function or method (or None)
+Input: name
+       (optional) kind ('arapi', 'cmdbapi' or 'method', default: 'arapi')
+       (optional) part ('c' or 'python', default: 'c')'''
+        self._lock.acquire()
+        try:
+            histograms = self._histograms.get((kind, name))
+            return histograms and histograms[part] or None
+        finally:
+            self._lock.release()
+
+    def summary(self):
+        '''return a dictionary {(kind, name): {'c': summary, 'python': summary,
+'errors': number of calls with a return code > 1}}; for C functions,
+there is no python part.'''
+        self._lock.acquire()
+        try:
+            result = {}
+            for (key, histograms) in self._histograms.items():
+                result[key] = {'c': histograms['c'].summary(),
+                               'errors': self._errors.get(key, 0)}
+                if key[0] == 'method':
+                    result[key]['python'] = histograms['python'].summary()
+            return result
+        finally:
+            self._lock.release()
+
+    def report(self):
+        '''return the summary as a table (durations in microseconds)'''
+        lines = ['%-8s %-40s %8s %6s %10s %10s %10s %10s' % (
+                 'kind', 'name', 'calls', 'errors', 'c p50', 'c p99',
+                 'py p50', 'py p99')]
+        summary = self.summary()
+        for key in sorted(summary.keys()):
+            part = summary[key]
+            python = part.get('python', {})
+            lines.append('%-8s %-40s %8d %6d %10s %10s %10s %10s' % (
+                         key[0], key[1], part['c']['count'], part['errors'],
+                         part['c']['p50'], part['c']['p99'],
+                         python.get('p50', ''), python.get('p99', '')))
+        return '\n'.join(lines)
+
+    def reset(self):
+        self._lock.acquire()
+        try:
+            self._histograms = {}
+            self._errors = {}
+        finally:
+            self._lock.release()
+
+# the instrumentation that new sessions attach to (see enable)
+default = None
+
+def enable(instrumentation = None):
+    '''enable instruments all sessions that are created afterwards.
+Input: (optional) instrumentation (default: a new Instrumentation)
+Output: the instrumentation'''
+    global default
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+    default = instrumentation
+    return instrumentation
+
+def disable():
+    '''disable stops instrumenting new sessions; sessions that are
+instrumented already stay instrumented (see session.disableInstrumentation)'''
+    global default
+    default = None
@@ -0,0 +1,173 @@
+#######################################################################
+#
+# This is the persistent metadata store of the pythonic layer of pyars.
+# (C) 2004-2015 by Ergorion
+#
+# Every new process that works with a server asks for the same field
+# tables and object lists again. MetadataStore keeps pythonic snapshots
+# of them on disk (one file per server), so that they survive restarts:
+# - the basic field definitions of a schema (fieldId, fieldName, dataType,
+#   option, createMode) per field type (as used by GetFieldTable,
+#   GetAllFieldNames and GetFieldByName),
+# - the names of schemas, active links, filters and escalations.
+# The complete definitions that GetSchema and GetField return are C
+# structures of the arapi; they are not kept in the store, but still
+# retrieved from the server (and kept in the cache of the session).
+# erARS75 and later validate a snapshot at login with one call to
+# ARGetObjectChangeTimes and only refresh those object types that
+# changed on the server (see erARS75.useMetadataStore).
+#
+
+try:
+    import cPickle as pickle
+except ImportError: # python 3
+    import pickle
+import os
+import tempfile
+import threading
+
+class MetadataSnapshot(object):
+    '''MetadataSnapshot holds the metadata of one server; the change
+times of the object types (as returned by GetObjectChangeTimes) tell
+how current the snapshot is.'''
+
+    def __init__(self, server):
+        self.server = server
+        # objectType -> (createTime, changeTime, deleteTime)
+        self.changeTimes = {}
+        # schema -> {fieldType : [(fieldId, fieldName, dataType, option, createMode), ...]}
+        self.fields = {}
+        # objectType -> [name, ...] (for schemas and workflow objects)
+        self.names = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        del state['dirty']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    def getFields(self, schema, fieldType):
+        '''return the list of field definitions or None if they are not known'''
+        try:
+            return self.fields[schema][fieldType]
+        except KeyError:
+            return None
+
+    def setFields(self, schema, fieldType, fields):
+        self._lock.acquire()
+        try:
+            self.fields.setdefault(schema, {})[fieldType] = list(fields)
+            self.dirty = True
+        finally:
+            self._lock.release()
+
+    def invalidateSchema(self, schema):
+        '''forget the field definitions of schema'''
+        self._lock.acquire()
+        try:
+            if self.fields.pop(schema, None) is not None:
+                self.dirty = True
+        finally:
+            self._lock.release()
+
+    def retainSchemas(self, schemas):
+        '''forget the field definitions of all schemas that are not in schemas'''
+        schemas = set(schemas)
+        for schema in list(self.fields.keys()):
+            if schema not in schemas:
+                self.invalidateSchema(schema)
+
+    def getNames(self, objectType):
+        '''return the list of names of objectType or None if they are not known'''
+        return self.names.get(objectType)
+
+    def setNames(self, objectType, names):
+        self._lock.acquire()
+        try:
+            if names is None:
+                self.names.pop(objectType, None)
+            else:
+                self.names[objectType] = list(names)
+            self.dirty = True
+        finally:
+            self._lock.release()
+
+    def addNames(self, objectType, names):
+        '''add the names of new or changed objects to the known names
+(if the names of objectType are not known, nothing happens)'''
+        self._lock.acquire()
+        try:
+            known = self.names.get(objectType)
+            if known is None:
+                return
+            known = set(known)
+            known.update(names)
+            self.names[objectType] = sorted(known)
+            self.dirty = True
+        finally:
+            self._lock.release()
+
+class MetadataStore(object):
+    '''MetadataStore reads and writes MetadataSnapshots from/to a directory;
+several sessions (and processes) can share one directory.'''
+
+    formatVersion = 1
+
+    def __init__(self, directory):
+        '''Input: directory (will be created if it does not exist)'''
+        self.directory = directory
+        self._lock = threading.Lock()
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _path(self, server):
+        fileName = ''.join([c.isalnum() and c or '_' for c in server.lower()])
+        return os.path.join(self.directory, 'pyars_%s.metadata' % fileName)
+
+    def load(self, server):
+        '''load returns the snapshot for server or None if there is none
+(or if it cannot be read).'''
+        try:
+            f = open(self._path(server), 'rb')
+        except IOError:
+            return None
+        try:
+            try:
+                (formatVersion, snapshot) = pickle.load(f)
+            except Exception:
+                return None
+        finally:
+            f.close()
+        if formatVersion != self.formatVersion or snapshot.server != server:
+            return None
+        return snapshot
+
+    def save(self, snapshot):
+        '''save writes the snapshot; the file is replaced atomically,
+so that other processes never read half a file.'''
+        self._lock.acquire()
+        try:
+            (handle, tempName) = tempfile.mkstemp(dir = self.directory,
+                                                  suffix = '.tmp')
+            f = os.fdopen(handle, 'wb')
+            snapshot._lock.acquire()
+            try:
+                pickle.dump((self.formatVersion, snapshot), f, 2)
+            finally:
+                snapshot._lock.release()
+                f.close()
+            path = self._path(snapshot.server)
+            if os.name == 'nt' and os.path.exists(path):
+                # on windows, rename does not replace existing files
+                os.remove(path)
+            os.rename(tempName, path)
+            snapshot.dirty = False
+        finally:
+            self._lock.release()
@@ -0,0 +1,228 @@
+#######################################################################
+#
+# This is the object cache of the pythonic layer of pyars.
+# (C) 2004-2015 by Ergorion
+#
+# erARS keeps the definitions it retrieves from the server (fields,
+# schemas, active links, filters) in a cache. ObjectCache limits the
+# number of entries (or their size), evicts the least recently used
+# entries and forgets entries after a timeout that can be set per type
+# of object. Evicted and expired ctypes structs are handed to a free
+# function (ARFree of the session), so that the memory allocated by the
+# arapi is given back.
+# An object that another thread may evict while it is still in use (e.g.
+# a compiled qualifier that is handed to the server) can be pinned: if
+# it is evicted while it is pinned, it is freed when it is unpinned.
+#
+
+from collections import OrderedDict
+from ctypes import sizeof
+import sys
+import threading
+import time
+
+def estimateSize(object_):
+    '''estimateSize returns the size of an object in bytes; for ctypes
+objects, only the struct itself is counted (not the memory its pointers
+refer to), so this is a lower bound.'''
+    try:
+        return sizeof(object_)
+    except TypeError:
+        return sys.getsizeof(object_)
+
+class ObjectCache(object):
+    '''ObjectCache is a bounded LRU cache with a timeout per type of object.
+Entries are addressed by (typeOfObject, schema, objectId).'''
+
+    def __init__(self, maxEntries = None,
+                 maxBytes = None,
+                 timeout = 10 * 60,
+                 timeouts = None,
+                 freeFunction = None,
+                 sizeFunction = estimateSize):
+        '''Input: (optional) maxEntries (maximum number of entries, default: None = unlimited)
+       (optional) maxBytes (maximum sum of the sizes of the entries,
+                  default: None = unlimited)
+       (optional) timeout (seconds after which an entry expires, default: 600)
+       (optional) timeouts (dictionary {typeOfObject: seconds} that overrides
+                  timeout for certain types of objects, default: None)
+       (optional) freeFunction (called with every object that is evicted or
+                  expired, default: None)
+       (optional) sizeFunction (returns the size of an object, used for maxBytes,
+                  default: estimateSize)'''
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self.freeFunction = freeFunction
+        self.sizeFunction = sizeFunction
+        self._lock = threading.RLock()
+        # key -> (object, timestamp, size); the least recently used entry comes first
+        self._entries = OrderedDict()
+        self._bytes = 0
+        # id of a pinned object -> [number of pins, object, evicted]
+        self._pins = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _timeout(self, typeOfObject):
+        return self.timeouts.get(typeOfObject, self.timeout)
+
+    def _free(self, object_):
+        pin = self._pins.get(id(object_))
+        if pin is not None:
+            # freed by unpin
+            pin[2] = True
+            return
+        if self.freeFunction is not None and object_ is not None:
+            self.freeFunction(object_)
+
+    def _pin(self, object_):
+        if object_ is None:
+            return
+        pin = self._pins.get(id(object_))
+        if pin is None:
+            self._pins[id(object_)] = [1, object_, False]
+        else:
+            pin[0] += 1
+
+    def unpin(self, object_):
+        '''unpin releases a pin of an object (see get and put); if the object
+has been evicted in the meantime, it is freed now.'''
+        if object_ is None:
+            return
+        self._lock.acquire()
+        try:
+            pin = self._pins[id(object_)]
+            pin[0] -= 1
+            if pin[0]:
+                return
+            del self._pins[id(object_)]
+            if pin[2]:
+                self._free(object_)
+        finally:
+            self._lock.release()
+
+    def _remove(self, key):
+        (object_, timestamp, size) = self._entries.pop(key)
+        self._bytes -= size
+        self._free(object_)
+
+    def get(self, typeOfObject, schema, objectId, pin = False):
+        '''get returns an object if it is in the cache and has not expired
+yet; expired objects are freed.
+Input: typeOfObject, schema, objectId
+       (optional) pin (the object that is returned is pinned; release it
+                  with unpin, default: False)
+Output: (True, object) or (False, None) if the object is not in the cache'''
+        key = (typeOfObject, schema, objectId)
+        self._lock.acquire()
+        try:
+            try:
+                (object_, timestamp, size) = self._entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                return (False, None)
+            if time.time() - timestamp >= self._timeout(typeOfObject):
+                self._bytes -= size
+                self._free(object_)
+                self.expirations += 1
+                self.misses += 1
+                return (False, None)
+            # move the entry to the end: it is the most recently used one now
+            self._entries[key] = (object_, timestamp, size)
+            self.hits += 1
+            if pin:
+                self._pin(object_)
+            return (True, object_)
+        finally:
+            self._lock.release()
+
+    def put(self, typeOfObject, schema, objectId, object_, pin = False):
+        '''put stores an object in the cache; an object that was stored
+under the same key before is freed (unless it is the same object), and the
+least recently used objects are evicted if the cache is full.
+Input: typeOfObject, schema, objectId, object_
+       (optional) pin (pin object_; release it with unpin, default: False)
+Output: none'''
+        key = (typeOfObject, schema, objectId)
+        size = self.sizeFunction(object_)
+        self._lock.acquire()
+        try:
+            if key in self._entries:
+                (oldObject, timestamp, oldSize) = self._entries.pop(key)
+                self._bytes -= oldSize
+                if oldObject is not object_:
+                    self._free(oldObject)
+            self._entries[key] = (object_, time.time(), size)
+            self._bytes += size
+            if pin:
+                self._pin(object_)
+            self._evict(key)
+        finally:
+            self._lock.release()
+
+    def _evict(self, keep):
+        '''evict the least recently used entries (but not keep) until the
+limits are met again'''
+        while len(self._entries) > 1 and (
+               (self.maxEntries is not None and len(self._entries) > self.maxEntries) or
+               (self.maxBytes is not None and self._bytes > self.maxBytes)):
+            key = next(iter(self._entries))
+            if key == keep:
+                break
+            self._remove(key)
+            self.evictions += 1
+
+    def setLimits(self, maxEntries, maxBytes):
+        '''setLimits changes the limits of the cache and evicts the least
+recently used entries at once if the cache exceeds the new limits.
+Input: maxEntries, maxBytes (None = unlimited)
+Output: none'''
+        self._lock.acquire()
+        try:
+            self.maxEntries = maxEntries
+            self.maxBytes = maxBytes
+            self._evict(None)
+        finally:
+            self._lock.release()
+
+    def invalidate(self, typeOfObject = None, schema = None, objectId = None):
+        '''invalidate frees and removes all entries that match the given
+parts of the key (None matches everything).
+Input: (optional) typeOfObject, schema, objectId
+Output: number of removed entries'''
+        self._lock.acquire()
+        try:
+            keys = [key for key in self._entries
+                    if (typeOfObject is None or key[0] == typeOfObject) and
+                       (schema is None or key[1] == schema) and
+                       (objectId is None or key[2] == objectId)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+        finally:
+            self._lock.release()
+
+    def clear(self):
+        '''clear frees and removes all entries'''
+        return self.invalidate()
+
+    def stats(self):
+        '''stats returns a dictionary with the counters of the cache:
+hits, misses, evictions, expirations, entries and bytes'''
+        self._lock.acquire()
+        try:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'expirations': self.expirations,
+                    'entries': len(self._entries),
+                    'bytes': self._bytes}
+        finally:
+            self._lock.release()
@@ -0,0 +1,350 @@
+#######################################################################
+#
+# This is the retry and reconnect layer of pyars.
+# (C) 2004-2015 by Ergorion
+#
+# When the AR System server is restarted or an RPC call times out, every
+# call of a session fails with an RPC error in its status list, and the
+# control record stays unusable until the API is initialized again.
+# Resilience wraps the AR* (and CMDB*) methods of a session:
+# - the status of a failed call is classified by its messageNum into
+#   'reconnect' (the connection is lost), 'transient' (e.g. a timeout of
+#   the server) and 'permanent' errors (all others);
+# - after a 'reconnect' error, the control record is initialized again
+#   (ARTermination, ARInitialization, ARSetServerPort) before the next
+#   call of the session;
+# - calls that only read (see isIdempotent) are repeated after transient
+#   and reconnect errors, with an exponential backoff with jitter and at
+#   most maxRetries times; other calls fail as before, so that an update
+#   is never sent twice;
+# - one CircuitBreaker per server counts the transient failures of all
+#   sessions; after failureThreshold failures in a row, calls fail at once
+#   (without a round trip) for resetTimeout seconds, then a single call
+#   probes whether the server is back.
+# Failed calls report their error as before (errnr and the status list of
+# the session), so callers need not be changed. Only the calls that go
+# through the AR* (and CMDB*) methods of the session are covered; pyars
+# itself does not call the arapi of a session directly.
+#
+# Resilience is off by default. It is switched on per session with
+# session.enableResilience() or for all sessions that are created
+# afterwards with resilience.enable().
+#
+
+import random
+import threading
+import time
+
+from ctypes import byref
+
+from pyars import cars, instrumentation
+
+# message numbers of the AR System server
+ERROR_NETWORK = 90 # cannot establish a network connection to the server
+ERROR_RPC_FAILED = 91 # RPC call failed
+ERROR_TIMEOUT_UPDATE = 92 # timeout during database update
+ERROR_TIMEOUT_RETRIEVAL = 93 # timeout during data retrieval (busy server)
+ERROR_TIMEOUT_QUERY = 94 # timeout during database query
+
+# errors after which the control record has to be initialized again
+reconnectErrors = set([ERROR_NETWORK, ERROR_RPC_FAILED])
+# errors that may go away when the call is repeated
+transientErrors = set([ERROR_TIMEOUT_UPDATE, ERROR_TIMEOUT_RETRIEVAL,
+                       ERROR_TIMEOUT_QUERY])
+
+# prefixes of the methods that only read and can be repeated safely
+idempotentPrefixes = ('ARGet', 'ARExport', 'ARExpand', 'ARLoad', 'ARValidate',
+                      'ARVerifyUser', 'CMDBGet', 'CMDBExport', 'CMDBQuery')
+# prefixes of the methods that are not wrapped: they do not talk to the
+# server, or they manage the connection themselves
+unwrappedPrefixes = ('ARFree', 'ARInitialization', 'ARTermination',
+                     'ARDecode', 'AREncode', 'ARDateToJulianDate',
+                     'ARJulianDateToDate', 'CMDBInitialization',
+                     'CMDBTermination')
+
+def classify(messageNum):
+    '''return 'reconnect', 'transient' or 'permanent' for the messageNum
+of an error'''
+    if messageNum in reconnectErrors:
+        return 'reconnect'
+    if messageNum in transientErrors:
+        return 'transient'
+    return 'permanent'
+
+def classifyStatus(arsl):
+    '''classify the errors of a status list: the most hopeful class of its
+errors ('reconnect' before 'transient' before 'permanent'); None if the
+status list does not contain an error'''
+    classes = [classify(arsl.statusList[i].messageNum)
+               for i in range(arsl.numItems)
+               if arsl.statusList[i].messageType >= cars.AR_RETURN_ERROR]
+    for class_ in ('reconnect', 'transient', 'permanent'):
+        if class_ in classes:
+            return class_
+    return None
+
+def isIdempotent(name):
+    '''decide if the method name only reads and can be repeated'''
+    return name.startswith(idempotentPrefixes)
+
+class CircuitBreaker(object):
+    '''CircuitBreaker stops the calls to a server that is down: it is
+closed as long as the calls succeed; after failureThreshold transient
+failures in a row it opens, and all calls fail at once. After resetTimeout
+seconds, one call is let through (half open): if it succeeds, the breaker
+closes again, otherwise it stays open for another resetTimeout.'''
+
+    def __init__(self, server, failureThreshold = 5, resetTimeout = 30.0):
+        self.server = server
+        self.failureThreshold = failureThreshold
+        self.resetTimeout = resetTimeout
+        self.state = 'closed'
+        self.failures = 0
+        self.openedAt = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        '''decide if a call may be made now'''
+        self._lock.acquire()
+        try:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and time.time() - self.openedAt >= self.resetTimeout:
+                # this call is the probe; the others wait for its outcome
+                self.state = 'half open'
+                return True
+            return False
+        finally:
+            self._lock.release()
+
+    def success(self):
+        self._lock.acquire()
+        try:
+            self.state = 'closed'
+            self.failures = 0
+        finally:
+            self._lock.release()
+
+    def failure(self):
+        '''count a transient failure; return True if the breaker is open'''
+        self._lock.acquire()
+        try:
+            self.failures += 1
+            if self.state == 'half open' or self.failures >= self.failureThreshold:
+                self.state = 'open'
+                self.openedAt = time.time()
+            return self.state == 'open'
+        finally:
+            self._lock.release()
+
+    def retryIn(self):
+        '''seconds until the next call is let through (0 if closed)'''
+        self._lock.acquire()
+        try:
+            if self.state == 'closed':
+                return 0.0
+            return max(self.openedAt + self.resetTimeout - time.time(), 0.0)
+        finally:
+            self._lock.release()
+
+class Resilience(object):
+    '''Resilience repeats the failed reads and reconnects the sessions it
+is attached to (see the module documentation); the circuit breakers are
+shared by all sessions of this Resilience.'''
+
+    def __init__(self, maxRetries = 3, baseDelay = 0.2, maxDelay = 10.0,
+                 failureThreshold = 5, resetTimeout = 30.0):
+        '''Input: (optional) maxRetries (how often a read is repeated, default: 3)
+       (optional) baseDelay (seconds before the first retry, default: 0.2)
+       (optional) maxDelay (upper bound of the delay between retries, default: 10.0)
+       (optional) failureThreshold (failures in a row that open the circuit
+                  breaker of a server, default: 5)
+       (optional) resetTimeout (seconds the circuit breaker stays open,
+                  default: 30.0)'''
+        self.maxRetries = maxRetries
+        self.baseDelay = baseDelay
+        self.maxDelay = maxDelay
+        self.failureThreshold = failureThreshold
+        self.resetTimeout = resetTimeout
+        # server -> CircuitBreaker
+        self._breakers = {}
+        self._lock = threading.Lock()
+        # per thread: depth of the wrapped calls (only the outermost one
+        # is repeated)
+        self._state = threading.local()
+        self.retries = 0
+        self.reconnects = 0
+        self.rejected = 0
+
+    def breaker(self, server):
+        '''return the CircuitBreaker of server'''
+        self._lock.acquire()
+        try:
+            try:
+                return self._breakers[server]
+            except KeyError:
+                breaker = self._breakers[server] = CircuitBreaker(server,
+                                                                  self.failureThreshold,
+                                                                  self.resetTimeout)
+                return breaker
+        finally:
+            self._lock.release()
+
+    def delay(self, attempt):
+        '''seconds to wait before retry number attempt (0, 1, ...): a random
+value below the exponential bound ("full jitter"), so that many clients
+do not retry at the same moment'''
+        return random.uniform(0, min(self.maxDelay, self.baseDelay * (2 ** attempt)))
+
+    def stats(self):
+        '''return a dictionary with the number of retries, reconnects and
+rejected calls, and the state of the circuit breakers'''
+        self._lock.acquire()
+        try:
+            breakers = dict([(server, breaker.state)
+                             for (server, breaker) in self._breakers.items()])
+        finally:
+            self._lock.release()
+        return {'retries': self.retries,
+                'reconnects': self.reconnects,
+                'rejected': self.rejected,
+                'breakers': breakers}
+
+    def attach(self, session):
+        '''attach wraps the AR* and CMDB* methods of session'''
+        if getattr(session, '_resilience', None) is not None:
+            session._resilience.detach(session)
+        for name in dir(session.__class__):
+            if not name.startswith(('AR', 'CMDB')) or name.startswith(unwrappedPrefixes):
+                continue
+            method = getattr(session.__class__, name, None)
+            if callable(method) and not isinstance(method, type):
+                setattr(session, name, self._wrapMethod(session, name,
+                                                        getattr(session, name)))
+        session._reconnectNeeded = False
+        session._resilience = self
+
+    def detach(self, session):
+        '''detach restores the methods of session'''
+        for name in list(session.__dict__.keys()):
+            if getattr(session.__dict__[name], '_resilient', False):
+                del session.__dict__[name]
+        session._resilience = None
+
+    def reconnect(self, session):
+        '''reconnect initializes the control record of session again.
+Output: errnr'''
+        self.reconnects += 1
+        context = session.context
+        session.arapi.ARTermination(byref(context), byref(session.arsl))
+        session.errnr = session.arapi.ARInitialization(byref(context),
+                                                       byref(session.arsl))
+        if session.errnr > 1:
+            return session.errnr
+        session._reconnectNeeded = False
+        # the port is not part of the control record
+        loginParameters = getattr(session, '_loginParameters', None)
+        if loginParameters is not None:
+            (server, tcpport, rpcnumber) = (loginParameters[0], loginParameters[5],
+                                            loginParameters[6])
+            if server.find(':') > -1:
+                (server, tcpport) = server.split(':')
+                tcpport = int(tcpport)
+            if tcpport or rpcnumber:
+                # the method of the class, not the wrapper
+                session.__class__.ARSetServerPort(session, server, tcpport, rpcnumber)
+        return session.errnr
+
+    def _reject(self, session, breaker):
+        '''let a call fail without a round trip (the circuit breaker of the
+server is open)'''
+        self.rejected += 1
+        # the status list belongs to python; the next call uses the
+        # status list of the thread again
+        statusList = (cars.ARStatusStruct * 1)()
+        statusList[0].messageType = cars.AR_RETURN_ERROR
+        statusList[0].messageNum = ERROR_NETWORK
+        statusList[0].messageText = 'pyars: the server %s is not available, next try in %.0f s' % (
+                                    breaker.server, breaker.retryIn())
+        status = session._callStatus()
+        status.arsl = cars.ARStatusList(1, statusList)
+        status.errnr = cars.AR_RETURN_ERROR
+
+    def _wrapMethod(self, session, name, method):
+        state = self._state
+        idempotent = isIdempotent(name)
+        def wrapper(*args, **kwargs):
+            if getattr(state, 'depth', 0):
+                # a call within a wrapped call (e.g. from a conversion)
+                return method(*args, **kwargs)
+            status = session._callStatus()
+            if status.arsl is not status.lease.arsl:
+                # the status list of a rejected call (see _reject)
+                status.arsl = status.lease.arsl
+            breaker = self.breaker(instrumentation.sessionServer(session))
+            attempt = 0
+            while True:
+                if not breaker.allow():
+                    self._reject(session, breaker)
+                    return None
+                connected = True
+                if session._reconnectNeeded:
+                    session.lock.acquire()
+                    try:
+                        if session._reconnectNeeded:
+                            connected = self.reconnect(session) < 2
+                    finally:
+                        session.lock.release()
+                if connected:
+                    state.depth = 1
+                    try:
+                        result = method(*args, **kwargs)
+                    finally:
+                        state.depth = 0
+                    if session.errnr < 2:
+                        breaker.success()
+                        return result
+                    errorClass = classifyStatus(session.arsl)
+                else:
+                    # the server cannot be reached yet
+                    result = None
+                    errorClass = 'reconnect'
+                if errorClass not in ('reconnect', 'transient'):
+                    # the server answered
+                    breaker.success()
+                    return result
+                if errorClass == 'reconnect':
+                    session._reconnectNeeded = True
+                open_ = breaker.failure()
+                if not idempotent or attempt >= self.maxRetries or open_:
+                    return result
+                delay = self.delay(attempt)
+                session.logger.info('%s failed with a %s error, retry in %.2f s' % (
+                                       name, errorClass, delay))
+                self.retries += 1
+                attempt += 1
+                time.sleep(delay)
+        wrapper._resilient = True
+        wrapper.__name__ = name
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+# the resilience that new sessions attach to (see enable)
+default = None
+
+def enable(resilience = None):
+    '''enable makes all sessions that are created afterwards retry and
+reconnect.
+Input: (optional) resilience (default: a new Resilience)
+Output: the resilience'''
+    global default
+    if resilience is None:
+        resilience = Resilience()
+    default = resilience
+    return resilience
+
+def disable():
+    '''disable stops attaching new sessions; sessions that are attached
+already stay attached (see session.disableResilience)'''
+    global default
+    default = None
@@ -0,0 +1,129 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#######################################################################
+#
+# Tests of the methods that take their sessions from a SessionPool, run
+# against the in-process fake of the arapi. The caller holds a session of
+# the pool itself, so that a method that waits for all sessions of the
+# pool never returns; every call runs on a thread with a time limit.
+# (C) 2004-2015 by Ergorion
+#
+# usage: python test_sessionpool.py (the package has to be importable as pyars)
+#
+#######################################################################
+
+import os
+import sys
+import threading
+import unittest
+
+import pyars
+if 'pyars.cars' not in sys.modules:
+    pyars.configure('fake', os.environ.get('PYARS_API_VERSION', 81))
+from pyars import cars, erars, fakearapi
+
+schemaName = 'pyars sessionpool test'
+fieldId = 536870913
+tagsFieldId = 536870914
+
+def callWithTimeout(function, timeout = 10.0):
+    '''run function on a thread; return its result or fail if it does not
+return within timeout seconds'''
+    outcome = {}
+    def run():
+        try:
+            outcome['result'] = function()
+        except Exception:
+            outcome['error'] = sys.exc_info()[1]
+    thread = threading.Thread(target = run)
+    thread.setDaemon(True)
+    thread.start()
+    thread.join(timeout)
+    if thread.isAlive():
+        raise AssertionError('%s did not return within %s seconds' % (
+                             function, timeout))
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+class PooledCallerTest(unittest.TestCase):
+
+    def setUp(self):
+        if not isinstance(cars.arapi, fakearapi.FakeArapi):
+            fakearapi.install()
+        self.fake = cars.arapi
+        self.fake.addForm(schemaName, [(fieldId, 'Counter', cars.AR_DATA_TYPE_INTEGER),
+                                       (tagsFieldId, 'Tags', cars.AR_DATA_TYPE_CHAR)])
+        self.entryIds = self.fake.populate(schemaName, 100,
+                                           lambda i: {fieldId: i})
+        self.pool = erars.SessionPool('fake', 'Demo', '', maxSessions = 2)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def scan(self, **kwargs):
+        def run():
+            with self.pool.session() as session:
+                return list(session.ScanListEntryWithFields(schemaName, None, (fieldId, ),
+                                                            partitions = 4, pageSize = 10,
+                                                            pool = self.pool, **kwargs))
+        return callWithTimeout(run)
+
+    def testOrderedScan(self):
+        entries = self.scan(partitionField = fieldId, ordered = True)
+        self.assertEqual([entry[0] for entry in entries], self.entryIds)
+
+    def testUnorderedScan(self):
+        entries = self.scan()
+        self.assertEqual(sorted([entry[0] for entry in entries]), self.entryIds)
+
+    def testScanGivesBackTheSessions(self):
+        self.scan(ordered = True)
+        self.assertEqual(self.pool.stats(), (2, 2))
+
+    def merge(self, rows, **kwargs):
+        def run():
+            with self.pool.session() as session:
+                return session.MergeEntries(schemaName, rows, workers = 4,
+                                            batchSize = 10, pool = self.pool,
+                                            **kwargs)
+        return callWithTimeout(run)
+
+    def testMerge(self):
+        (entryIds, errors, statistics) = self.merge([{fieldId: i} for i in range(50)],
+                                                    keyFields = (fieldId, ))
+        self.assertEqual(errors, {})
+        self.assertEqual(len(set(entryIds)), 50)
+        self.assertEqual(self.pool.stats(), (2, 2))
+
+    def testMergeUnhashableKeys(self):
+        rows = [{fieldId: i, tagsFieldId: ['tag', i % 5]} for i in range(20)]
+        (entryIds, errors, statistics) = self.merge(rows, keyFields = (tagsFieldId, ))
+        self.assertEqual(errors, {})
+        self.assertEqual(statistics['rows'], 20)
+
+    def testFailureOfAnotherThreadMakesSessionSuspect(self):
+        session = self.pool.acquire()
+        session.enableThreadSharing()
+        def fail():
+            try:
+                session.GetEntry(schemaName, '999')
+            except erars.ARError:
+                pass
+        thread = threading.Thread(target = fail)
+        thread.start()
+        thread.join()
+        self.assertEqual(session.errnr, 0)
+        self.pool.release(session)
+        verified = []
+        verifyUser = session.VerifyUser
+        def verify(*args):
+            verified.append(session)
+            return verifyUser(*args)
+        session.VerifyUser = verify
+        self.assertTrue(self.pool.acquire() is session)
+        self.assertEqual(verified, [session])
+        self.pool.release(session)
+
+if __name__ == '__main__':
+    unittest.main()